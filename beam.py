@@ -0,0 +1,146 @@
+import numpy as np
+
+
+from typing import Dict, Sequence, Tuple
+
+
+from exercise import section_columns, section_properties
+
+
+# Slope, deflection and bending stress along a statically determinate beam
+# 정정보의 처짐각, 처짐, 굽힘 응력 분포
+#   x : (P,) increasing positions from the left end x[0] to the right end x[-1], m
+#   M : (P,) or (K, P) bending moment of K load cases, sagging positive, Nm
+#   support : 'simple' (pin at x[0], roller at x[-1]) or 'cantilever' (fixed at x[0], free at x[-1])
+#   x : 왼쪽 끝 x[0] 에서 오른쪽 끝 x[-1] 까지 증가하는 위치 (P,), m
+#   M : K 개 하중 경우의 굽힘 모멘트 (P,) 또는 (K, P), 처지는 방향이 양, Nm
+#   support : 'simple' (x[0] 핀, x[-1] 롤러) 또는 'cantilever' (x[0] 고정, x[-1] 자유)
+#
+#   v'' = M / (E I(x)), v upward positive; a stepped beam uses sections[i] between steps[i - 1] and steps[i]
+#   v'' = M / (E I(x)), v 는 위쪽이 양; 단이 있는 보는 steps[i - 1] 과 steps[i] 사이에서 sections[i] 를 사용
+
+
+def moment_diagram(x:np.ndarray, support:str='simple', point_loads:Sequence[Tuple[float]]=(), distributed_loads:Sequence[Tuple[float]]=()) -> np.ndarray:
+    # point_loads : (P_N, a_m) pairs, distributed_loads : (w_N_per_m, a_m, b_m) over a <= x <= b; downward positive
+    # point_loads : (P_N, a_m) 쌍, distributed_loads : a <= x <= b 구간의 (w_N_per_m, a_m, b_m); 아래 방향이 양
+    _check_support(support)
+    x = np.asarray(x, dtype=float)
+    x0, span = x[0], x[-1] - x[0]
+    s = x - x0
+
+    P, a_p = _load_columns(point_loads, 2)
+    w, a_w, b_w = _load_columns(distributed_loads, 3)
+    a_p, a_w, b_w = a_p - x0, a_w - x0, b_w - x0
+
+    def bracket(value:np.ndarray) -> np.ndarray:
+        # Macaulay bracket <value>
+        return np.maximum(value, 0.0)
+
+    if 'simple' == support:
+        reaction = ((P * (span - a_p)).sum() + (w * (b_w - a_w) * (span - 0.5 * (a_w + b_w))).sum()) / span
+        return (
+            reaction * s
+            - (P * bracket(s[:, None] - a_p)).sum(axis=-1)
+            - (0.5 * w * (bracket(s[:, None] - a_w) ** 2 - bracket(s[:, None] - b_w) ** 2)).sum(axis=-1)
+        )
+
+    # cantilever : only the loads to the right of x bend the section at x
+    # 외팔보 : x 오른쪽의 하중만 x 단면을 굽힘
+    return (
+        - (P * bracket(a_p - s[:, None])).sum(axis=-1)
+        - (0.5 * w * (bracket(b_w - s[:, None]) ** 2 - bracket(a_w - s[:, None]) ** 2)).sum(axis=-1)
+    )
+
+
+def beam_response(x:np.ndarray, M:np.ndarray, E:float, sections:np.ndarray, steps:Sequence[float]=(), support:str='simple', rule:str='trapezoid') -> Dict[str, np.ndarray]:
+    # sections : (S, 6) rows of (w0, h0, w1, h1, w2, h2) or one row; steps : (S - 1,) increasing positions
+    # sections : (w0, h0, w1, h1, w2, h2) 행의 (S, 6) 배열 또는 한 행; steps : 증가하는 위치 (S - 1,)
+    _check_support(support)
+    if rule not in ('trapezoid', 'simpson'):
+        raise ValueError(f"unknown rule {rule!r}, expected 'trapezoid' or 'simpson'")
+
+    x = np.asarray(x, dtype=float)
+    M = np.atleast_2d(np.asarray(M, dtype=float))
+    steps = np.asarray(steps, dtype=float)
+    props = section_properties(*section_columns(np.atleast_2d(sections)))
+    if props['area'].size != steps.size + 1:
+        raise ValueError(f"{props['area'].size} sections need {props['area'].size - 1} steps, got {steps.size}")
+
+    # each step appears twice, once on either side, so that M / EI may jump there
+    # 각 단 위치를 양쪽에 한번씩 두번 넣어 M / EI 가 불연속일 수 있게 함
+    inner = steps[(steps > x[0]) & (steps < x[-1])]
+    x_all = np.concatenate((x, inner, inner))
+    segment = np.concatenate((
+        np.searchsorted(steps, x, side='right'),
+        np.searchsorted(steps, inner, side='left'),
+        np.searchsorted(steps, inner, side='right'),
+    ))
+    order = np.lexsort((segment, x_all))
+    x_all, segment = x_all[order], segment[order]
+    M_all = np.stack([np.interp(x_all, x, m) for m in M])
+
+    curvature = M_all / (E * props['moment_of_inertia'][segment])
+    theta = _cumulative(x_all, curvature, rule)
+    v = _cumulative(x_all, theta, rule)
+
+    if 'simple' == support:
+        c1 = -(v[:, -1:] - v[:, :1]) / (x_all[-1] - x_all[0])
+    else:
+        c1 = -theta[:, :1]
+    slope = theta + c1
+    deflection = v + c1 * (x_all - x_all[0]) - v[:, :1]
+
+    # back to the caller's grid; at a step the section on the right side is reported
+    # 사용자의 격자로 되돌림; 단 위치에서는 오른쪽 단면의 값을 사용
+    inverse = np.empty_like(order)
+    inverse[order] = np.arange(order.size)
+    keep = inverse[:x.size]
+    segment_x = segment[keep]
+    sigma = np.abs(M) * (props['c_max'] / props['moment_of_inertia'])[segment_x]
+
+    return {
+        'x': x,
+        'moment_of_inertia': props['moment_of_inertia'][segment_x],
+        'curvature': curvature[:, keep],
+        'slope': slope[:, keep],
+        'deflection': deflection[:, keep],
+        'bending_stress': sigma,
+        'envelope': sigma.max(axis=0),
+    }
+
+
+def _cumulative(x:np.ndarray, f:np.ndarray, rule:str) -> np.ndarray:
+    # cumulative integral along the last axis, piecewise between repeated x so that jumps stay sharp
+    # 마지막 축을 따라 누적 적분, 반복된 x 사이마다 따로 적분하여 불연속을 유지
+    result = np.zeros_like(f)
+    breaks = np.flatnonzero(np.diff(x) == 0.0) + 1
+    offset = np.zeros(f.shape[:-1])
+
+    for start, stop in zip(np.concatenate(((0,), breaks)), np.concatenate((breaks, (x.size,)))):
+        xs, fs = x[start:stop], f[..., start:stop]
+        if xs.size < 2:
+            part = np.zeros_like(fs)
+        elif 'simpson' == rule:
+            # scipy on first use only
+            # 처음 사용할 때만 scipy 를 import
+            import scipy.integrate
+            part = scipy.integrate.cumulative_simpson(fs, x=xs, axis=-1, initial=0.0)
+        else:
+            part = np.concatenate(
+                (np.zeros_like(fs[..., :1]), np.cumsum(0.5 * (fs[..., 1:] + fs[..., :-1]) * np.diff(xs), axis=-1)),
+                axis=-1,
+            )
+        result[..., start:stop] = part + offset[..., None]
+        offset = result[..., stop - 1]
+
+    return result
+
+
+def _load_columns(loads:Sequence[Tuple[float]], n:int) -> Tuple[np.ndarray]:
+    loads = np.asarray(loads, dtype=float).reshape(-1, n)
+    return tuple(loads[:, i] for i in range(n))
+
+
+def _check_support(support:str):
+    if support not in ('simple', 'cantilever'):
+        raise ValueError(f"unknown support {support!r}, expected 'simple' or 'cantilever'")
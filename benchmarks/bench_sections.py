@@ -0,0 +1,211 @@
+import json
+import os
+import pathlib
+import platform
+import subprocess
+import sys
+import time
+
+from typing import Callable, Dict, Iterator, Sequence, Tuple
+
+
+import numpy as np
+
+
+bench_folder = pathlib.Path(__file__).parent.absolute()
+
+sys.path.insert(
+    0,
+    os.getenv(
+        'STUDENT_CODE_FOLDER',
+        str(bench_folder.parent)
+    )
+)
+
+
+import exercise
+import polygon_section
+
+
+# Timing of the section kernels, compared against a JSON baseline per machine
+# 단면 계산의 시간 측정, 기계마다 저장한 JSON 기준값과 비교
+#   python benchmarks/bench_sections.py --save        : measure and store benchmarks/baselines/<host>.json
+#   python benchmarks/bench_sections.py --threshold 0.25 : measure and fail if any case got 25 % slower
+#   RUN_BENCHMARKS=1 python -m pytest benchmarks       : the same check under pytest
+
+
+SCHEMA = 1
+NOMINAL = np.array((50e-3, 12e-3, 7.5e-3, 70e-3, 90e-3, 10e-3))
+
+
+def sections(n:int, seed:int=0) -> np.ndarray:
+    return NOMINAL * np.random.default_rng(seed).uniform(0.5, 1.5, size=(n, 6))
+
+
+def cases(max_n:int=10**7) -> Iterator[Tuple[str, int, Callable]]:
+    # (name, items per call, setup returning a no argument callable)
+    # (이름, 호출 한번의 항목 수, 인자 없는 함수를 반환하는 준비 함수)
+    dims = tuple(float(d) for d in NOMINAL)
+    for name in ('area', 'centroid_y', 'area_above_below_equal', 'area_moment_above_below_equal', 'moment_of_inertia'):
+        f = getattr(exercise, name)
+        yield f'scalar/{name}', 1, lambda f=f: (lambda: f(*dims))
+    yield 'scalar/bending_stress', 1, lambda: (lambda: exercise.bending_stress(100.0, *dims))
+
+    n = 1000
+    while n <= max_n:
+        def batch_setup(n:int=n, name:str='') -> Callable:
+            rows = sections(n)
+            moments = np.full(n, 100.0)
+            if 'bending_stress' == name:
+                return lambda: exercise.bending_stress_batch(moments, rows)
+            return lambda: getattr(exercise, name + '_batch')(rows)
+        for name in ('bending_stress', 'area_above_below_equal', 'moment_of_inertia'):
+            yield f'batch/{name}/{n}', n, lambda setup=batch_setup, n=n, name=name: setup(n, name)
+        n *= 10
+
+    def cache_hit() -> Callable:
+        cache = exercise.section_cache()
+        exercise.cached_bending_stress(cache, 100.0, *dims)
+        return lambda: exercise.cached_bending_stress(cache, 100.0, *dims)
+
+    def cache_miss() -> Callable:
+        # maxsize 1 and two alternating keys : every call misses and evicts
+        # maxsize 1 에 두 key 를 번갈아 사용 : 모든 호출이 miss 와 eviction
+        cache = exercise.section_cache(maxsize=1)
+        other = (dims[0] * 1.01,) + dims[1:]
+        return lambda: (
+            exercise.cached_bending_stress(cache, 100.0, *dims),
+            exercise.cached_bending_stress(cache, 100.0, *other),
+        )
+
+    yield 'cache/hit', 1, cache_hit
+    yield 'cache/miss', 2, cache_miss
+
+    def layered(n:int, n_layers:int) -> Callable:
+        rng = np.random.default_rng(1)
+        widths = rng.uniform(5e-3, 0.1, size=(n, n_layers))
+        heights = rng.uniform(5e-3, 0.1, size=(n, n_layers))
+        return lambda: exercise.layered_section_properties(widths, heights)
+
+    def polygon(n:int) -> Callable:
+        outlines = polygon_section.t_section_polygon(*sections(n).T)
+        return lambda: polygon_section.polygon_properties(outlines)
+
+    n_engine = min(10**5, max_n)
+    yield f'layered/8/{n_engine}', n_engine, lambda: layered(n_engine, 8)
+    yield f'polygon/12/{n_engine}', n_engine, lambda: polygon(n_engine)
+
+
+def measure(f:Callable, repeat:int=5, min_time_s:float=0.05) -> float:
+    # best of repeat runs of the seconds per call; each run loops until min_time_s has passed
+    # repeat 번 중 가장 짧은 호출당 시간; 각 측정은 min_time_s 가 지날 때까지 반복
+    f()
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            f()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time_s:
+            break
+        loops *= 2 if elapsed <= 0.0 else max(2, int(1.2 * min_time_s / elapsed))
+
+    best = elapsed / loops
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(loops):
+            f()
+        best = min(best, (time.perf_counter() - start) / loops)
+    return best
+
+
+def run(max_n:int=10**7, pattern:str='', repeat:int=5) -> Dict[str, Dict[str, float]]:
+    results = {}
+    for name, items, setup in cases(max_n):
+        if pattern not in name:
+            continue
+        seconds = measure(setup(), repeat)
+        results[name] = {'seconds': seconds, 'items': items, 'items_per_s': items / seconds}
+    return results
+
+
+def compare(current:Dict[str, Dict[str, float]], baseline:Dict[str, Dict[str, float]], threshold:float=0.25) -> Dict[str, float]:
+    # slowdown ratio of every case that got slower than (1 + threshold) × baseline; cases new to either side are skipped
+    # (1 + threshold) × 기준값보다 느려진 경우의 비율; 한쪽에만 있는 경우는 건너뜀
+    return {
+        name: current[name]['seconds'] / baseline[name]['seconds']
+        for name in sorted(set(current) & set(baseline))
+        if current[name]['seconds'] > (1.0 + threshold) * baseline[name]['seconds']
+    }
+
+
+def baseline_path(folder:pathlib.Path=bench_folder / 'baselines') -> pathlib.Path:
+    return folder / f"{platform.node() or 'default'}.json"
+
+
+def save_baseline(results:Dict[str, Dict[str, float]], path:pathlib.Path=None) -> pathlib.Path:
+    path = pathlib.Path(path or baseline_path())
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({
+        'schema': SCHEMA,
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'machine': platform.machine(),
+        'results': results,
+    }, indent=2, sort_keys=True))
+    return path
+
+
+def load_baseline(path:pathlib.Path=None) -> Dict[str, Dict[str, float]]:
+    # results of the stored baseline, None if there is none or it has another schema
+    # 저장된 기준값, 없거나 schema 가 다르면 None
+    path = pathlib.Path(path or baseline_path())
+    if not path.exists():
+        return None
+    stored = json.loads(path.read_text())
+    if SCHEMA != stored.get('schema'):
+        return None
+    return stored['results']
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=bench_folder, encoding='utf-8', stderr=subprocess.DEVNULL
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ''
+
+
+def main(argv:Sequence[str]=None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Benchmark the section kernels')
+    parser.add_argument('--max-n', type=int, default=10**7)
+    parser.add_argument('--filter', default='', help='only cases whose name contains this text')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--threshold', type=float, default=0.25, help='allowed slowdown, 0.25 = 25 %%')
+    parser.add_argument('--save', action='store_true', help='store the results as the new baseline')
+    parser.add_argument('--baseline', type=pathlib.Path, default=None)
+    args = parser.parse_args(argv)
+
+    results = run(args.max_n, args.filter, args.repeat)
+    baseline = load_baseline(args.baseline)
+    for name, r in results.items():
+        ratio = '' if not baseline or name not in baseline else f"{r['seconds'] / baseline[name]['seconds']:6.2f}x"
+        print(f"{name:48s} {r['seconds'] * 1e6:14.3f} us {r['items_per_s']:14.4g} items/s {ratio}")
+
+    if args.save:
+        print(f"saved {save_baseline(results, args.baseline)}")
+        return 0
+
+    slower = compare(results, baseline or {}, args.threshold)
+    for name, ratio in slower.items():
+        print(f"REGRESSION {name} : {ratio:.2f}x the baseline")
+    return 1 if slower else 0
+
+
+if '__main__' == __name__:
+    sys.exit(main())
@@ -0,0 +1,53 @@
+import os
+import pathlib
+import sys
+
+
+import pytest
+
+
+sys.path.insert(0, str(pathlib.Path(__file__).parent.absolute()))
+
+
+import bench_sections
+
+
+# The timing run is opt in so that the default pytest run stays fast :
+# 기본 pytest 실행이 느려지지 않도록 시간 측정은 선택 사항 :
+#   RUN_BENCHMARKS=1 BENCH_MAX_N=1000000 BENCH_THRESHOLD=0.25 python -m pytest benchmarks
+
+
+def test_compare():
+    baseline = {'a': {'seconds': 1.0}, 'b': {'seconds': 1.0}, 'gone': {'seconds': 1.0}}
+    current = {'a': {'seconds': 1.2}, 'b': {'seconds': 1.5}, 'new': {'seconds': 9.0}}
+    assert bench_sections.compare(current, baseline, 0.25) == {'b': 1.5}
+
+
+def test_baseline_round_trip(tmp_path:pathlib.Path):
+    results = {'scalar/area': {'seconds': 1e-6, 'items': 1, 'items_per_s': 1e6}}
+    path = bench_sections.save_baseline(results, tmp_path / 'host.json')
+    assert bench_sections.load_baseline(path) == results
+    assert bench_sections.load_baseline(tmp_path / 'missing.json') is None
+
+
+def test_cases_run():
+    # every case builds and runs once at a small size
+    # 모든 경우를 작은 크기로 한번씩 실행
+    names = []
+    for name, items, setup in bench_sections.cases(max_n=1000):
+        setup()()
+        names.append(name)
+    assert 'batch/bending_stress/1000' in names
+    assert not any(name.endswith('/10000') for name in names)
+
+
+@pytest.mark.skipif(not os.getenv('RUN_BENCHMARKS'), reason='set RUN_BENCHMARKS=1 to time the kernels')
+def test_no_regression():
+    results = bench_sections.run(max_n=int(os.getenv('BENCH_MAX_N', 10**6)))
+    baseline = bench_sections.load_baseline()
+    if baseline is None:
+        path = bench_sections.save_baseline(results)
+        pytest.skip(f'no baseline yet, saved {path}')
+
+    slower = bench_sections.compare(results, baseline, float(os.getenv('BENCH_THRESHOLD', 0.25)))
+    assert not slower, f'slower than the baseline : {slower}'
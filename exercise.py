@@ -1,26 +1,371 @@
 import numpy as np
-# Please complete this file
-# 이 파일을 완성하시오
-def area(
 
 
+from typing import Dict, Tuple
 
-def centroid_y(
 
+# Section of three stacked rectangles, bottom to top : a special case of layered_section_properties()
+# 아래에서부터 쌓은 세 직사각형 단면 : layered_section_properties() 의 특수한 경우
+#   w0, h0 : bottom flange 아래 플랜지
+#   w1, h1 : web 웹
+#   w2, h2 : top flange 위 플랜지
+# Every function accepts floats or numpy arrays of the same (broadcastable) shape.
+# 모든 함수는 float 또는 같은 모양의 numpy 배열을 받을 수 있음.
 
 
-def area_above_below_equal(
+def area(w0:float, h0:float, w1:float, h1:float, w2:float, h2:float) -> float:
+    return _pack(section_properties(w0, h0, w1, h1, w2, h2)['area'], w0, h0, w1, h1, w2, h2)
 
 
+def centroid_y(w0:float, h0:float, w1:float, h1:float, w2:float, h2:float) -> float:
+    return _pack(section_properties(w0, h0, w1, h1, w2, h2)['centroid_y'], w0, h0, w1, h1, w2, h2)
 
-def area_moment_above_below_equal(
 
+def area_above_below_equal(w0:float, h0:float, w1:float, h1:float, w2:float, h2:float) -> Dict[str, float]:
+    result = layered_area_above_below_equal(*_three_layers(w0, h0, w1, h1, w2, h2))
+    return {
+        'a_above': _pack(result['a_above'], w0, h0, w1, h1, w2, h2),
+        'a_below': _pack(result['a_below'], w0, h0, w1, h1, w2, h2),
+        'close': _pack_bool(result['close'], w0, h0, w1, h1, w2, h2),
+    }
 
 
-def moment_of_inertia(
+def area_moment_above_below_equal(w0:float, h0:float, w1:float, h1:float, w2:float, h2:float) -> Dict[str, float]:
+    result = layered_area_moment_above_below_equal(*_three_layers(w0, h0, w1, h1, w2, h2))
+    return {
+        'a_moment_above': _pack(result['a_moment_above'], w0, h0, w1, h1, w2, h2),
+        'a_moment_below': _pack(result['a_moment_below'], w0, h0, w1, h1, w2, h2),
+        'close': _pack_bool(result['close'], w0, h0, w1, h1, w2, h2),
+    }
 
 
+def moment_of_inertia(w0:float, h0:float, w1:float, h1:float, w2:float, h2:float) -> float:
+    return _pack(section_properties(w0, h0, w1, h1, w2, h2)['moment_of_inertia'], w0, h0, w1, h1, w2, h2)
 
-def bending_stress(
 
+def bending_stress(M:float, w0:float, h0:float, w1:float, h1:float, w2:float, h2:float) -> float:
+    props = section_properties(w0, h0, w1, h1, w2, h2)
+    return _pack(np.abs(M) * props['c_max'] / props['moment_of_inertia'], M, w0, h0, w1, h1, w2, h2)
 
+
+def section_properties(w0:float, h0:float, w1:float, h1:float, w2:float, h2:float) -> Dict[str, float]:
+    # Every section property in one pass; the functions above are views of this dict.
+    # 모든 단면 특성을 한번에 계산; 위 함수들은 이 dict 의 일부를 반환함.
+    if _scalars(w0, h0, w1, h1, w2, h2):
+        try:
+            return _scalar_properties(float(w0), float(h0), float(w1), float(h1), float(w2), float(h2))
+        except ZeroDivisionError:
+            # degenerate section : the array path gives the nan and inf
+            # 퇴화된 단면 : 배열 경로가 nan 과 inf 를 반환
+            pass
+    return layered_section_properties(*_three_layers(w0, h0, w1, h1, w2, h2))
+
+
+# Stacked section of any number of layers : widths and heights of shape (..., L), bottom layer first.
+# Sections with fewer layers are padded with zero width & zero height layers on top (see pad_layers()).
+# 임의 개수 층의 단면 : 폭과 높이 배열의 모양은 (..., L), 가장 아래 층부터.
+# 층 수가 적은 단면은 위쪽에 폭 0 높이 0 인 층을 채움 (pad_layers() 참고).
+
+
+def layered_section_properties(widths:np.ndarray, heights:np.ndarray) -> Dict[str, np.ndarray]:
+    widths, heights = np.broadcast_arrays(np.asarray(widths, dtype=float), np.asarray(heights, dtype=float))
+
+    # prefix sum of the heights gives the top of each layer
+    # 높이의 누적합이 각 층의 상단
+    tops = np.cumsum(heights, axis=-1)
+    bottoms = tops - heights
+    depth_m = tops[..., -1]
+
+    areas = widths * heights
+    centroids = bottoms + 0.5 * heights
+
+    area_m2 = areas.sum(axis=-1)
+    y_m = (areas * centroids).sum(axis=-1) / area_m2
+
+    # parallel axis theorem 평행축 정리
+    # h * h * h rather than h ** 3 : the scalar path of _scalar_properties() repeats it bit for bit
+    # h ** 3 대신 h * h * h : _scalar_properties() 의 scalar 계산이 bit 까지 같게 반복함
+    I_m4 = (widths * (heights * heights * heights) / 12.0 + areas * (centroids - y_m[..., None]) ** 2).sum(axis=-1)
+
+    c_top_m = depth_m - y_m
+    c_bottom_m = y_m
+
+    return {
+        'layer_width': widths,
+        'layer_height': heights,
+        'layer_area': areas,
+        'layer_centroid': centroids,
+        'layer_bottom': bottoms,
+        'layer_top': tops,
+        'depth': depth_m,
+        'area': area_m2,
+        'centroid_y': y_m,
+        'moment_of_inertia': I_m4,
+        'c_top': c_top_m,
+        'c_bottom': c_bottom_m,
+        'c_max': np.maximum(c_bottom_m, c_top_m),
+        'S_top': I_m4 / c_top_m,
+        'S_bottom': I_m4 / c_bottom_m,
+    }
+
+
+def layered_bending_stress(M:np.ndarray, widths:np.ndarray, heights:np.ndarray) -> np.ndarray:
+    props = layered_section_properties(widths, heights)
+    return np.abs(M) * props['c_max'] / props['moment_of_inertia']
+
+
+def layered_area_above_below_equal(widths:np.ndarray, heights:np.ndarray) -> Dict[str, np.ndarray]:
+    props = layered_section_properties(widths, heights)
+    t_below, t_above = _split_at_centroid(props)
+
+    a_below = (props['layer_width'] * t_below).sum(axis=-1)
+    a_above = (props['layer_width'] * t_above).sum(axis=-1)
+
+    return {
+        'a_above': a_above,
+        'a_below': a_below,
+        'close': np.isclose(a_above, a_below, rtol=1e-9, atol=0.0),
+    }
+
+
+def layered_area_moment_above_below_equal(widths:np.ndarray, heights:np.ndarray) -> Dict[str, np.ndarray]:
+    props = layered_section_properties(widths, heights)
+    t_below, t_above = _split_at_centroid(props)
+    y_m = props['centroid_y'][..., None]
+
+    q_below = (props['layer_width'] * t_below * (y_m - (props['layer_bottom'] + 0.5 * t_below))).sum(axis=-1)
+    q_above = (props['layer_width'] * t_above * ((props['layer_top'] - 0.5 * t_above) - y_m)).sum(axis=-1)
+
+    return {
+        'a_moment_above': q_above,
+        'a_moment_below': q_below,
+        'close': np.isclose(q_above, q_below, rtol=1e-9, atol=0.0),
+    }
+
+
+def pad_layers(widths:Tuple[np.ndarray], heights:Tuple[np.ndarray]) -> Tuple[np.ndarray]:
+    # list of N sections with ragged layer counts -> two (N, max layers) arrays
+    # 층 수가 서로 다른 N 개 단면 -> (N, 최대 층 수) 배열 두개
+    if len(widths) != len(heights):
+        raise ValueError(f"got {len(widths)} width arrays and {len(heights)} height arrays")
+
+    counts = np.array([len(w) for w in widths], dtype=int)
+    if any(len(w) != len(h) for w, h in zip(widths, heights)):
+        raise ValueError("each section needs as many widths as heights")
+
+    # scatter the flattened layers into the padded table in one go
+    # 평탄화한 층을 한번에 채움
+    rows = np.repeat(np.arange(len(counts)), counts)
+    cols = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+
+    shape = (len(counts), counts.max(initial=0))
+    padded_w, padded_h = np.zeros(shape), np.zeros(shape)
+    if rows.size:
+        padded_w[rows, cols] = np.concatenate(widths)
+        padded_h[rows, cols] = np.concatenate(heights)
+
+    return padded_w, padded_h
+
+
+# Batch API : one (N, 6) array of (w0, h0, w1, h1, w2, h2) rows, or a tuple of six (N,) arrays
+# 일괄 계산 : (w0, h0, w1, h1, w2, h2) 행의 (N, 6) 배열 또는 (N,) 배열 여섯개의 tuple
+
+
+def area_batch(sections:np.ndarray) -> np.ndarray:
+    return area(*section_columns(sections))
+
+
+def centroid_y_batch(sections:np.ndarray) -> np.ndarray:
+    return centroid_y(*section_columns(sections))
+
+
+def area_above_below_equal_batch(sections:np.ndarray) -> Dict[str, np.ndarray]:
+    return area_above_below_equal(*section_columns(sections))
+
+
+def area_moment_above_below_equal_batch(sections:np.ndarray) -> Dict[str, np.ndarray]:
+    return area_moment_above_below_equal(*section_columns(sections))
+
+
+def moment_of_inertia_batch(sections:np.ndarray) -> np.ndarray:
+    return moment_of_inertia(*section_columns(sections))
+
+
+def bending_stress_batch(M:np.ndarray, sections:np.ndarray) -> np.ndarray:
+    return bending_stress(np.asarray(M, dtype=float), *section_columns(sections))
+
+
+def section_properties_batch(sections:np.ndarray) -> Dict[str, np.ndarray]:
+    return section_properties(*section_columns(sections))
+
+
+# Opt-in cache of the moment independent properties, keyed on the six dimensions
+# 여섯 치수를 key 로 하여 모멘트와 무관한 단면 특성을 저장하는 선택적 cache
+
+
+def section_cache(maxsize:int=1024, quantum_m:float=0.0) -> Dict[str, object]:
+    # quantum_m > 0 : dimensions are rounded to multiples of quantum_m before lookup
+    # quantum_m > 0 : 치수를 quantum_m 의 배수로 반올림하여 찾음
+    if maxsize < 1:
+        raise ValueError(f"maxsize must be positive, got {maxsize}")
+    if quantum_m < 0.0:
+        raise ValueError(f"quantum_m must not be negative, got {quantum_m}")
+    return {
+        'maxsize': int(maxsize),
+        'quantum_m': float(quantum_m),
+        'entries': {},
+        'hits': 0,
+        'misses': 0,
+        'evictions': 0,
+    }
+
+
+def cached_section_properties(cache:Dict[str, object], w0:float, h0:float, w1:float, h1:float, w2:float, h2:float) -> Dict[str, float]:
+    key = section_key(cache['quantum_m'], w0, h0, w1, h1, w2, h2)
+    entries = cache['entries']
+
+    if key in entries:
+        cache['hits'] += 1
+        # move to the most recently used end
+        # 가장 최근에 사용한 쪽으로 이동
+        props = entries.pop(key)
+        entries[key] = props
+        return props
+
+    cache['misses'] += 1
+    full = section_properties(float(w0), float(h0), float(w1), float(h1), float(w2), float(h2))
+    props = {
+        'centroid_y': float(full['centroid_y']),
+        'moment_of_inertia': float(full['moment_of_inertia']),
+        'c_max': float(full['c_max']),
+        'stress_per_moment': float(full['c_max'] / full['moment_of_inertia']),
+    }
+
+    if len(entries) >= cache['maxsize']:
+        # dict keeps insertion order : the first key is the least recently used
+        # dict 는 삽입 순서를 유지 : 첫 key 가 가장 오래전에 사용됨
+        del entries[next(iter(entries))]
+        cache['evictions'] += 1
+
+    entries[key] = props
+    return props
+
+
+def cached_bending_stress(cache:Dict[str, object], M:float, w0:float, h0:float, w1:float, h1:float, w2:float, h2:float) -> float:
+    return abs(float(M)) * cached_section_properties(cache, w0, h0, w1, h1, w2, h2)['stress_per_moment']
+
+
+def cache_info(cache:Dict[str, object]) -> Dict[str, int]:
+    return {
+        'hits': cache['hits'],
+        'misses': cache['misses'],
+        'evictions': cache['evictions'],
+        'maxsize': cache['maxsize'],
+        'currsize': len(cache['entries']),
+    }
+
+
+def cache_clear(cache:Dict[str, object]):
+    cache['entries'].clear()
+    cache['hits'] = cache['misses'] = cache['evictions'] = 0
+
+
+def section_key(quantum_m:float, w0:float, h0:float, w1:float, h1:float, w2:float, h2:float) -> Tuple[float]:
+    dims = (w0, h0, w1, h1, w2, h2)
+    if quantum_m > 0.0:
+        return tuple(round(float(d) / quantum_m) for d in dims)
+    return tuple(float(d) for d in dims)
+
+
+def section_columns(sections:np.ndarray) -> Tuple[np.ndarray]:
+    # (N, 6) rows of (w0, h0, w1, h1, w2, h2), or an explicit tuple of six (N,) columns;
+    # a list is read as rows so that a list of six sections is not taken for six columns
+    # (w0, h0, w1, h1, w2, h2) 행의 (N, 6) 배열 또는 (N,) 열 여섯개의 tuple;
+    # list 는 행으로 읽어 단면 여섯개의 list 를 열 여섯개로 오해하지 않음
+    if isinstance(sections, tuple):
+        if len(sections) != 6:
+            raise ValueError(f"expected a tuple of six dimension arrays, got {len(sections)}")
+        columns = tuple(np.asarray(c, dtype=float) for c in sections)
+    else:
+        sections = np.asarray(sections, dtype=float)
+        if sections.ndim != 2 or sections.shape[-1] != 6:
+            raise ValueError(f"expected an (N, 6) array or a tuple of six arrays, got shape {sections.shape}")
+        columns = tuple(sections[:, i] for i in range(6))
+    return tuple(np.broadcast_arrays(*map(np.atleast_1d, columns)))
+
+
+def _three_layers(w0:float, h0:float, w1:float, h1:float, w2:float, h2:float) -> Tuple[np.ndarray]:
+    return (
+        np.stack(np.broadcast_arrays(w0, w1, w2), axis=-1).astype(float),
+        np.stack(np.broadcast_arrays(h0, h1, h2), axis=-1).astype(float),
+    )
+
+
+def _scalar_properties(w0:float, h0:float, w1:float, h1:float, w2:float, h2:float) -> Dict[str, float]:
+    # layered_section_properties() of one three layer section with python floats, several times faster than
+    # building and reducing (3,) arrays; the operations are in the same order so the results are bit identical
+    # 세 층 단면 하나의 layered_section_properties() 를 python float 로 계산하여 (3,) 배열을 만들고 더하는 것보다
+    # 몇 배 빠름; 연산 순서가 같으므로 결과의 bit 가 같음
+    t0 = h0
+    t1 = t0 + h1
+    t2 = t1 + h2
+    b0, b1, b2 = t0 - h0, t1 - h1, t2 - h2
+    a0, a1, a2 = w0 * h0, w1 * h1, w2 * h2
+    y0, y1, y2 = b0 + 0.5 * h0, b1 + 0.5 * h1, b2 + 0.5 * h2
+
+    area_m2 = a0 + a1 + a2
+    y_m = (a0 * y0 + a1 * y1 + a2 * y2) / area_m2
+    d0, d1, d2 = y0 - y_m, y1 - y_m, y2 - y_m
+    I_m4 = (
+        (w0 * (h0 * h0 * h0) / 12.0 + a0 * (d0 * d0))
+        + (w1 * (h1 * h1 * h1) / 12.0 + a1 * (d1 * d1))
+        + (w2 * (h2 * h2 * h2) / 12.0 + a2 * (d2 * d2))
+    )
+    c_top_m, c_bottom_m = t2 - y_m, y_m
+
+    return {
+        'layer_width': (w0, w1, w2),
+        'layer_height': (h0, h1, h2),
+        'layer_area': (a0, a1, a2),
+        'layer_centroid': (y0, y1, y2),
+        'layer_bottom': (b0, b1, b2),
+        'layer_top': (t0, t1, t2),
+        'depth': t2,
+        'area': area_m2,
+        'centroid_y': y_m,
+        'moment_of_inertia': I_m4,
+        'c_top': c_top_m,
+        'c_bottom': c_bottom_m,
+        'c_max': max(c_bottom_m, c_top_m),
+        'S_top': I_m4 / c_top_m,
+        'S_bottom': I_m4 / c_bottom_m,
+    }
+
+
+def _split_at_centroid(props:Dict[str, np.ndarray]) -> Tuple[np.ndarray]:
+    # height of each layer below / above the centroid
+    # 각 층에서 중립축 아래 / 위에 있는 부분의 높이
+    y_m = props['centroid_y'][..., None]
+    t_below = np.clip(y_m - props['layer_bottom'], 0.0, props['layer_height'])
+    t_above = np.clip(props['layer_top'] - y_m, 0.0, props['layer_height'])
+    return t_below, t_above
+
+
+def _pack(value:np.ndarray, *args) -> float:
+    # float in, float out; arrays in, arrays out
+    # float 입력이면 float, 배열 입력이면 배열 반환
+    if _scalars(*args):
+        return float(value)
+    return np.asarray(value, dtype=float)
+
+
+def _pack_bool(value:np.ndarray, *args) -> bool:
+    if _scalars(*args):
+        return bool(value)
+    return np.asarray(value, dtype=bool)
+
+
+def _scalars(*args) -> bool:
+    # python numbers are checked first; np.ndim() alone costs about 2 us per argument
+    # python 숫자를 먼저 확인; np.ndim() 만 쓰면 인자마다 약 2 us
+    return all(isinstance(a, (float, int)) or 0 == np.ndim(a) for a in args)
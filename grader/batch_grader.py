@@ -0,0 +1,222 @@
+import json
+import multiprocessing
+import multiprocessing.connection
+import os
+import pathlib
+import shutil
+import sys
+import tempfile
+import time
+
+from typing import Dict, Sequence
+
+
+# Grade many submissions locally with the same four checks as .github/workflows/classroom.yml
+# .github/workflows/classroom.yml 과 같은 네 검사로 여러 제출물을 한번에 채점
+#   python grader/batch_grader.py submissions/* --output reports --workers 8
+#
+#   Every (submission, check) pair runs in its own process forked from a warm server that has already
+#   imported pytest and numpy, so a check costs a fork instead of an interpreter or container start,
+#   one submission cannot leak modules or state into another, and a hung check is killed at its timeout.
+#   Each check also gets its own scratch HOME, TMPDIR and STATIC_ANALYSIS_CACHE, removed afterwards;
+#   the processes still run as the same user, so this is not a sandbox against hostile code.
+#   (제출물, 검사) 쌍마다 pytest 와 numpy 를 미리 import 한 server 에서 fork 한 process 에서 실행하므로
+#   검사 하나의 비용은 interpreter 나 container 시작이 아니라 fork 한번이며, 제출물 사이에 모듈이나
+#   상태가 섞이지 않고, 멈춘 검사는 시간 제한에서 종료됨.
+#   검사마다 따로 만든 HOME, TMPDIR, STATIC_ANALYSIS_CACHE 를 쓰고 끝나면 지움;
+#   같은 사용자로 실행하므로 악의적인 코드에 대한 sandbox 는 아님.
+#
+#   output/<submission>/report_<check>.json : pytest-json-report output, as in the workflow
+#   output/<submission>/report_<check>.log  : pytest console output
+#   output/summary.json                     : exit code, counts and score of every check
+
+
+tests_folder = pathlib.Path(__file__).parent.parent.absolute() / 'tests'
+
+
+def checks() -> Dict[str, Dict[str, object]]:
+    # test file, score and time limit of each check, following classroom.yml
+    # classroom.yml 을 따른 검사별 시험 파일, 점수, 시간 제한
+    return {
+        'syntax': {'file': 'test_syntax.py', 'max_score': 1, 'timeout_s': 60.0},
+        'style': {'file': 'test_style.py', 'max_score': 1, 'timeout_s': 60.0},
+        'results': {'file': 'test_results.py', 'max_score': 2, 'timeout_s': 120.0},
+        'comparison': {'file': 'test_comparison.py', 'max_score': 1, 'timeout_s': 120.0},
+    }
+
+
+def grade_submissions(folders:Sequence[pathlib.Path], output:pathlib.Path, workers:int=None, timeout_s:float=None, names:Sequence[str]=None) -> Dict[str, object]:
+    # timeout_s overrides the time limit of every check; names selects some of checks()
+    # timeout_s 는 모든 검사의 시간 제한을 바꿈; names 로 checks() 중 일부를 선택
+    output = pathlib.Path(output).absolute()
+    folders = [pathlib.Path(f).absolute() for f in folders]
+    # reports are kept by folder name : two submissions with the same name would overwrite each other
+    # 보고서는 폴더 이름별로 저장 : 이름이 같은 두 제출물은 서로 덮어씀
+    seen = {}
+    for folder in folders:
+        seen.setdefault(folder.name, []).append(str(folder))
+    duplicates = {name: paths for name, paths in seen.items() if len(paths) > 1}
+    if duplicates:
+        raise ValueError(f"submission folders need distinct names : {duplicates}")
+    selected = {name: c for name, c in checks().items() if names is None or name in names}
+    workers = workers or os.cpu_count() or 1
+
+    tasks = []
+    for folder in folders:
+        (output / folder.name).mkdir(parents=True, exist_ok=True)
+        for name, check in selected.items():
+            tasks.append((folder, name, check, check['timeout_s'] if timeout_s is None else timeout_s))
+
+    context = _warm_context()
+    results = {}
+    running = {}
+    started = time.perf_counter()
+    while tasks or running:
+        while tasks and len(running) < workers:
+            folder, name, check, limit = tasks.pop(0)
+            report = output / folder.name / f'report_{name}.json'
+            # a report left by an earlier run in the same output folder must not count for this one
+            # 같은 output 폴더에 이전 실행이 남긴 보고서가 이번 결과로 쓰이면 안 됨
+            for old in (report, report.with_suffix('.log')):
+                old.unlink(missing_ok=True)
+            scratch = tempfile.mkdtemp(prefix=f'grade-{folder.name}-{name}-')
+            process = context.Process(
+                target=_run_check, args=(str(folder), str(tests_folder / check['file']), str(report), scratch), daemon=True)
+            process.start()
+            running[process.sentinel] = (process, folder, name, check, report, time.perf_counter(), time.time(), limit, scratch)
+
+        multiprocessing.connection.wait(list(running), timeout=0.05)
+        now = time.perf_counter()
+        for sentinel, (process, folder, name, check, report, start, wall_start, limit, scratch) in list(running.items()):
+            timed_out = process.is_alive() and now - start > limit
+            if timed_out:
+                process.kill()
+                process.join()
+            if process.is_alive():
+                continue
+            del running[sentinel]
+            shutil.rmtree(scratch, ignore_errors=True)
+            if timed_out:
+                _write_failed_report(report, folder, now - start, 'timeout')
+            elif process.exitcode < 0 or not _written_since(report, wall_start):
+                # killed by a signal, or ended before pytest wrote its report (e.g. os._exit() in the submission)
+                # signal 로 종료되었거나 pytest 가 보고서를 쓰기 전에 끝남 (예 : 제출물의 os._exit())
+                _write_failed_report(report, folder, now - start, f'exit code {process.exitcode}')
+            results.setdefault(folder.name, {})[name] = _summarize(report, check, timed_out, now - start, process.exitcode)
+
+    summary = {
+        'created': time.time(),
+        'duration': time.perf_counter() - started,
+        'workers': workers,
+        'submissions': {
+            folder.name: {
+                'folder': str(folder),
+                'checks': results.get(folder.name, {}),
+                'score': sum(r['score'] for r in results.get(folder.name, {}).values()),
+                'max_score': sum(c['max_score'] for c in selected.values()),
+            }
+            for folder in folders
+        },
+    }
+    (output / 'summary.json').write_text(json.dumps(summary, indent=4))
+    return summary
+
+
+def main(argv:Sequence[str]=None) -> Dict[str, object]:
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Grade many STUDENT_CODE_FOLDER submissions in a warm process pool')
+    parser.add_argument('folders', nargs='+', type=pathlib.Path)
+    parser.add_argument('--output', type=pathlib.Path, default=pathlib.Path('reports'))
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--timeout', type=float, default=None, help='seconds per check, default as in classroom.yml')
+    parser.add_argument('--checks', nargs='*', default=None, choices=tuple(checks()))
+    args = parser.parse_args(argv)
+
+    summary = grade_submissions(args.folders, args.output, args.workers, args.timeout, args.checks)
+    for name, submission in summary['submissions'].items():
+        failed = [c for c, r in submission['checks'].items() if r['score'] < r['max_score']]
+        print(f"{name:32s} {submission['score']:3d} / {submission['max_score']}  {' '.join(failed)}")
+    print(f"{len(summary['submissions'])} submissions in {summary['duration']:.1f} s with {summary['workers']} workers")
+    return summary
+
+
+def _warm_context():
+    # forkserver with pytest and numpy preloaded where fork is available, spawn otherwise
+    # fork 가 가능하면 pytest 와 numpy 를 미리 불러온 forkserver, 아니면 spawn
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context('forkserver')
+        context.set_forkserver_preload(['numpy', 'pytest', 'pytest_jsonreport.plugin', 'json', 'ast'])
+        return context
+    return multiprocessing.get_context('spawn')
+
+
+def _run_check(folder:str, test_file:str, report:str, scratch:str):
+    # inside the forked process : the submission becomes the working folder, as /app in the workflow,
+    # and home, temporary and cache folders point into the scratch folder of this check only
+    # fork 한 process 안 : workflow 의 /app 처럼 제출물 폴더에서 실행하며
+    # home, 임시, cache 폴더는 이 검사만의 scratch 폴더 안을 가리킴
+    os.chdir(folder)
+    os.environ['STUDENT_CODE_FOLDER'] = folder
+    for variable, sub in (('HOME', 'home'), ('TMPDIR', 'tmp'), ('XDG_CACHE_HOME', 'cache'), ('STATIC_ANALYSIS_CACHE', 'static-analysis')):
+        os.environ[variable] = os.path.join(scratch, sub)
+        os.makedirs(os.environ[variable], exist_ok=True)
+    tempfile.tempdir = None
+
+    log = open(pathlib.Path(report).with_suffix('.log'), 'w')
+    os.dup2(log.fileno(), 1)
+    os.dup2(log.fileno(), 2)
+
+    import pytest
+    code = pytest.main([
+        test_file, '-q', '-p', 'no:cacheprovider',
+        '--json-report', '--json-report-indent=4', f'--json-report-file={report}',
+    ])
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os._exit(int(code))
+
+
+def _written_since(report:pathlib.Path, wall_start:float) -> bool:
+    # some file systems keep mtime to 1 or 2 s only
+    # 어떤 file system 은 mtime 을 1 ~ 2 초 단위로만 저장
+    try:
+        return report.stat().st_mtime >= wall_start - 2.0
+    except FileNotFoundError:
+        return False
+
+
+def _summarize(report:pathlib.Path, check:Dict[str, object], timed_out:bool, duration_s:float, process_exitcode:int=0) -> Dict[str, object]:
+    data = json.loads(report.read_text())
+    # the process has to agree with its report
+    # process 의 종료 코드도 보고서와 같아야 함
+    passed = 0 == data.get('exitcode') == process_exitcode and not timed_out
+    return {
+        'exitcode': data.get('exitcode'),
+        'summary': data.get('summary', {}),
+        'timed_out': timed_out,
+        'duration': duration_s,
+        'score': check['max_score'] if passed else 0,
+        'max_score': check['max_score'],
+        'report': str(report),
+    }
+
+
+def _write_failed_report(report:pathlib.Path, folder:pathlib.Path, duration_s:float, reason:str):
+    # pytest-json-report layout for a check that never finished
+    # 끝나지 않은 검사에 대한 pytest-json-report 형식의 보고서
+    report.write_text(json.dumps({
+        'created': time.time(),
+        'duration': duration_s,
+        'exitcode': 124 if 'timeout' == reason else 1,
+        'root': str(folder),
+        'environment': {},
+        'summary': {'error': 1, 'total': 0, 'collected': 0},
+        'collectors': [],
+        'tests': [],
+        'error': reason,
+    }, indent=4))
+
+
+if '__main__' == __name__:
+    main()
@@ -0,0 +1,97 @@
+import json
+import pathlib
+import shutil
+import sys
+
+
+import pytest
+
+
+grader_folder = pathlib.Path(__file__).parent.absolute()
+sys.path.insert(0, str(grader_folder))
+
+
+import batch_grader
+
+
+@pytest.fixture
+def submissions(tmp_path:pathlib.Path) -> dict:
+    repo = grader_folder.parent
+    folders = {}
+    for name in ('good', 'wrong', 'hang'):
+        folder = tmp_path / 'submissions' / name
+        folder.mkdir(parents=True)
+        shutil.copy(repo / 'exercise.py', folder / 'exercise.py')
+        shutil.copy(repo / 'sample.py', folder / 'sample.py')
+        folders[name] = folder
+
+    code = (folders['wrong'] / 'exercise.py').read_text()
+    (folders['wrong'] / 'exercise.py').write_text(code.replace("'area': area_m2,", "'area': 2.0 * area_m2,"))
+    (folders['hang'] / 'exercise.py').write_text('while True:\n    pass\n' + code)
+    return folders
+
+
+def test_grade(tmp_path:pathlib.Path, submissions:dict):
+    summary = batch_grader.grade_submissions(
+        (submissions['good'], submissions['wrong']), tmp_path / 'reports', workers=2, timeout_s=60.0, names=('syntax', 'results'))
+
+    good = summary['submissions']['good']['checks']
+    assert good['syntax']['score'] == 1 and good['results']['score'] == 2
+
+    wrong = summary['submissions']['wrong']['checks']
+    assert wrong['results']['score'] == 0
+    assert wrong['results']['summary']['failed'] > 0
+
+    report = json.loads((tmp_path / 'reports' / 'good' / 'report_results.json').read_text())
+    assert report['exitcode'] == 0
+    assert report['summary']['passed'] == report['summary']['total'] > 0
+    assert json.loads((tmp_path / 'reports' / 'summary.json').read_text())['submissions']['good']['score'] == 3
+
+
+def test_duplicate_names(tmp_path:pathlib.Path, submissions:dict):
+    other = tmp_path / 'cohort' / 'good'
+    shutil.copytree(submissions['good'], other)
+    with pytest.raises(ValueError):
+        batch_grader.grade_submissions((submissions['good'], other), tmp_path / 'reports', names=('syntax',))
+
+
+def test_old_reports_not_reused(tmp_path:pathlib.Path, submissions:dict):
+    # graded again into the same output folder, a submission that exits before pytest writes its report fails
+    # 같은 output 폴더에 다시 채점할 때 pytest 가 보고서를 쓰기 전에 끝나는 제출물은 실패
+    folder = submissions['good']
+    summary = batch_grader.grade_submissions([folder], tmp_path / 'reports', workers=2, names=('syntax', 'results'))
+    assert 3 == summary['submissions']['good']['score']
+
+    (folder / 'exercise.py').write_text('import os\nos._exit(0)\n' + (folder / 'exercise.py').read_text())
+    summary = batch_grader.grade_submissions([folder], tmp_path / 'reports', workers=2, names=('syntax', 'results'))
+    assert 0 == summary['submissions']['good']['score']
+    assert 'exit code 0' == json.loads((tmp_path / 'reports' / 'good' / 'report_results.json').read_text())['error']
+
+
+def test_scratch_folders(tmp_path:pathlib.Path, submissions:dict):
+    # every check sees its own HOME and analysis cache, removed after the check
+    # 검사마다 자기만의 HOME 과 분석 cache 를 보며 검사 뒤에 지워짐
+    folder = submissions['good']
+    (folder / 'exercise.py').write_text((folder / 'exercise.py').read_text() + (
+        '\n\ndef _record():\n'
+        '    import json, os\n'
+        '    names = ("HOME", "TMPDIR", "STATIC_ANALYSIS_CACHE")\n'
+        '    with open(f"env_{os.getpid()}.json", "w") as f:\n'
+        '        json.dump({k: os.environ[k] for k in names}, f)\n'
+        '_record()\n'
+    ))
+    batch_grader.grade_submissions([folder], tmp_path / 'reports', workers=2, names=('syntax', 'results'))
+
+    environments = [json.loads(p.read_text()) for p in folder.glob('env_*.json')]
+    assert 2 == len({e['STATIC_ANALYSIS_CACHE'] for e in environments}) == len({e['HOME'] for e in environments})
+    assert not any(pathlib.Path(e['HOME']).exists() for e in environments)
+
+
+def test_timeout(tmp_path:pathlib.Path, submissions:dict):
+    summary = batch_grader.grade_submissions(
+        [submissions['hang']], tmp_path / 'reports', workers=1, timeout_s=2.0, names=('results',))
+
+    result = summary['submissions']['hang']['checks']['results']
+    assert result['timed_out']
+    assert result['score'] == 0
+    assert json.loads(pathlib.Path(result['report']).read_text())['exitcode'] == 124
@@ -0,0 +1,71 @@
+import numpy as np
+
+
+from typing import Dict, Tuple
+
+
+from exercise import bending_stress, section_columns, section_properties
+
+
+# Many sections against many bending moments without building the N × M utilization matrix
+# 많은 단면과 많은 굽힘 모멘트의 조합을 N × M 이용률 행렬 없이 계산
+#   σ_ij = |M_j| × c_max_i / I_i, so u_ij = σ_ij / σ_allow_i = s_i × |M_j| is rank one :
+#   σ_ij = |M_j| × c_max_i / I_i 이므로 u_ij = σ_ij / σ_allow_i = s_i × |M_j| 는 rank 1 :
+#     max over j   -> s_i × max |M|, governing load case argmax |M|
+#     global top k -> only the top k sections and the top k load cases can take part
+
+
+def load_case_scan(sections:np.ndarray, moments:np.ndarray, sigma_allow:np.ndarray, top_k:int=10) -> Dict[str, np.ndarray]:
+    # sections : (N, 6), moments : (M,), sigma_allow : scalar or (N,)
+    # sections : (N, 6), moments : (M,), sigma_allow : 스칼라 또는 (N,)
+    s = _utilization_per_moment(sections, sigma_allow)
+    m_abs = np.abs(np.asarray(moments, dtype=float).ravel())
+    if 0 == m_abs.size:
+        raise ValueError("need at least one load case")
+
+    governing = int(np.argmax(m_abs))
+
+    k = min(int(top_k), s.size * m_abs.size)
+    top_i = _top_indices(s, k)
+    top_j = _top_indices(m_abs, k)
+
+    # at most k × k candidate pairs
+    # 후보 쌍은 최대 k × k 개
+    candidates = s[top_i, None] * m_abs[None, top_j]
+    ii, jj = np.meshgrid(top_i, top_j, indexing='ij')
+    # largest first, ties by section then load case index
+    # 큰 값부터, 같으면 단면 번호와 하중 번호 순
+    order = np.lexsort((jj.ravel(), ii.ravel(), -candidates.ravel()))[:k]
+
+    return {
+        'max_utilization': s * m_abs[governing],
+        'governing_load_case': np.full(s.size, governing),
+        'top_sections': ii.ravel()[order],
+        'top_load_cases': jj.ravel()[order],
+        'top_utilization': candidates.ravel()[order],
+    }
+
+
+def utilization_tiles(sections:np.ndarray, moments:np.ndarray, sigma_allow:np.ndarray, tile:Tuple[int]=(1024, 4096)):
+    # yields (first section, first load case, tile of u_ij) with bending_stress() broadcast over each tile
+    # (첫 단면 번호, 첫 하중 번호, u_ij 부분 행렬) 을 차례로 반환
+    columns = section_columns(sections)
+    moments = np.asarray(moments, dtype=float).ravel()
+    sigma_allow = np.broadcast_to(np.asarray(sigma_allow, dtype=float), columns[0].shape)
+
+    for i0 in range(0, columns[0].size, tile[0]):
+        block = tuple(c[i0:i0 + tile[0], None] for c in columns)
+        allow = sigma_allow[i0:i0 + tile[0], None]
+        for j0 in range(0, moments.size, tile[1]):
+            yield i0, j0, bending_stress(moments[None, j0:j0 + tile[1]], *block) / allow
+
+
+def _utilization_per_moment(sections:np.ndarray, sigma_allow:np.ndarray) -> np.ndarray:
+    props = section_properties(*section_columns(sections))
+    return props['c_max'] / props['moment_of_inertia'] / np.asarray(sigma_allow, dtype=float)
+
+
+def _top_indices(values:np.ndarray, k:int) -> np.ndarray:
+    if k >= values.size:
+        return np.arange(values.size)
+    return np.argpartition(-values, k - 1)[:k]
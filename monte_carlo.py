@@ -0,0 +1,123 @@
+import numpy as np
+
+
+from typing import Dict, Sequence
+
+
+from exercise import bending_stress
+
+
+# Streaming Monte Carlo tolerance analysis of the maximum bending stress
+# 최대 굽힘 응력의 스트리밍 몬테카를로 공차 해석
+#   Dimensions and the moment scatter normally around their nominal values, as in tests/conftest.py.
+#   치수와 모멘트는 tests/conftest.py 처럼 공칭값 주위에 정규 분포.
+#
+#   Samples are drawn in fixed blocks, each block from its own seed sequence, and statistics are reduced
+#   per block in block order. chunk_size only decides how many blocks are evaluated at once, so a seeded
+#   run gives the same numbers for any chunk size while memory stays at one chunk plus the histogram.
+#   표본은 고정 크기 block 단위로 각 block 마다 따로 seed 를 정해 생성하고, 통계는 block 순서대로 합침.
+#   chunk_size 는 한번에 계산할 block 수만 정하므로 chunk 크기와 상관 없이 같은 결과를 얻으며
+#   메모리는 chunk 하나와 histogram 만큼만 사용함.
+
+
+def stress_monte_carlo(nominal:Sequence[float], std:Sequence[float], M_Nm:float, M_std:float=0.0, n_samples:int=1_000_000, seed:int=0, sigma_limit:float=None, quantiles:Sequence[float]=(0.95, 0.999), chunk_size:int=2**20, block_size:int=2**16, bins:int=2**16, range_factor:float=1e3) -> Dict[str, object]:
+    # nominal, std : (w0, h0, w1, h1, w2, h2) mean values and standard deviations
+    # quantiles come from a histogram with log spaced bins over σ_nominal / range_factor .. σ_nominal × range_factor
+    # nominal, std : (w0, h0, w1, h1, w2, h2) 의 평균과 표준편차
+    # 분위수는 σ_nominal / range_factor .. σ_nominal × range_factor 범위의 로그 간격 histogram 으로 구함
+    nominal = np.asarray(nominal, dtype=float)
+    std = np.asarray(std, dtype=float)
+    if nominal.shape != (6,) or std.shape != (6,):
+        raise ValueError("nominal and std need six values (w0, h0, w1, h1, w2, h2)")
+    if n_samples < 1:
+        raise ValueError(f"n_samples must be positive, got {n_samples}")
+
+    mean_in = np.append(nominal, M_Nm)
+    std_in = np.append(std, M_std)
+
+    sigma_nominal = bending_stress(M_Nm, *nominal)
+    edges = np.geomspace(sigma_nominal / range_factor, sigma_nominal * range_factor, bins + 1)
+    # counts[0] : below the range, counts[-1] : above the range
+    # counts[0] : 범위 아래, counts[-1] : 범위 위
+    counts = np.zeros(bins + 2, dtype=np.int64)
+
+    stats = {'count': 0, 'mean': 0.0, 'm2': 0.0, 'min': np.inf, 'max': -np.inf, 'exceed': 0}
+
+    blocks_per_chunk = max(1, chunk_size // block_size)
+    n_blocks = -(-n_samples // block_size)
+
+    for first_block in range(0, n_blocks, blocks_per_chunk):
+        block_indices = range(first_block, min(first_block + blocks_per_chunk, n_blocks))
+        draws = np.concatenate([
+            _block_draws(seed, b, min(block_size, n_samples - b * block_size))
+            for b in block_indices
+        ])
+        samples = mean_in + std_in * draws
+
+        sigma = bending_stress(samples[:, 6], *samples[:, :6].T)
+
+        counts += np.bincount(np.searchsorted(edges, sigma, side='right'), minlength=bins + 2)
+        if sigma_limit is not None:
+            stats['exceed'] += int(np.count_nonzero(sigma > sigma_limit))
+        stats['min'] = min(stats['min'], float(sigma.min()))
+        stats['max'] = max(stats['max'], float(sigma.max()))
+
+        for start in range(0, sigma.size, block_size):
+            _merge_block(stats, sigma[start:start + block_size])
+
+    result = {
+        'count': stats['count'],
+        'mean': stats['mean'],
+        'variance': stats['m2'] / (stats['count'] - 1) if stats['count'] > 1 else 0.0,
+        'min': stats['min'],
+        'max': stats['max'],
+        'quantiles': {q: histogram_quantile(counts, edges, q) for q in quantiles},
+        'out_of_range': int(counts[0] + counts[-1]),
+    }
+    result['std'] = result['variance'] ** 0.5
+    if sigma_limit is not None:
+        result['p_exceed'] = stats['exceed'] / stats['count']
+    return result
+
+
+def histogram_quantile(counts:np.ndarray, edges:np.ndarray, q:float) -> float:
+    # counts has one underflow and one overflow bin around len(edges) - 1 regular bins;
+    # inside a bin the quantile is interpolated in log space
+    # counts 는 len(edges) - 1 개의 일반 bin 앞뒤로 범위 밖 bin 을 가짐; bin 안에서는 로그 공간에서 보간
+    total = counts.sum()
+    target = q * total
+    cumulative = np.cumsum(counts)
+    i = int(np.searchsorted(cumulative, target, side='left'))
+
+    if 0 == i:
+        return float(edges[0]) if counts[0] == 0 else -np.inf
+    if i == counts.size - 1:
+        return np.inf
+
+    before = cumulative[i - 1]
+    fraction = (target - before) / counts[i] if counts[i] else 0.0
+    log_lo, log_hi = np.log(edges[i - 1]), np.log(edges[i])
+    return float(np.exp(log_lo + fraction * (log_hi - log_lo)))
+
+
+def _block_draws(seed:int, block:int, n:int) -> np.ndarray:
+    # standard normal (n, 7) draws of one block; a short last block is a prefix of a full one
+    # block 하나의 표준 정규 (n, 7) 난수; 마지막의 짧은 block 은 전체 block 의 앞부분과 같음
+    rng = np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(block,)))
+    return rng.standard_normal((n, 7))
+
+
+def _merge_block(stats:Dict[str, float], values:np.ndarray):
+    # Chan et al. pairwise update of count, mean and sum of squared deviations
+    # Chan 등의 방법으로 개수, 평균, 편차 제곱합을 합침
+    n_b = values.size
+    mean_b = float(values.mean())
+    m2_b = float(((values - mean_b) ** 2).sum())
+
+    n_a = stats['count']
+    n = n_a + n_b
+    delta = mean_b - stats['mean']
+
+    stats['mean'] += delta * n_b / n
+    stats['m2'] += m2_b + delta * delta * n_a * n_b / n
+    stats['count'] = n
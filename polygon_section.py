@@ -0,0 +1,130 @@
+import numpy as np
+
+
+from typing import Dict, Sequence, Tuple
+
+
+# Cross sections bounded by polygons : closed form Green's theorem (shoelace) sums
+# 다각형 단면 : 그린 정리 (신발끈 공식) 의 닫힌 형태 합
+#   outer : (..., V, 2) array of (x, y) vertices; leading axes are a batch of same vertex count polygons
+#   holes : sequence of (..., Vh, 2) arrays, one per hole
+#   Orientation of each ring does not matter : outer rings add area, holes remove it.
+#   outer : (x, y) 꼭지점의 (..., V, 2) 배열; 앞쪽 축은 꼭지점 수가 같은 다각형의 묶음
+#   holes : 구멍마다 (..., Vh, 2) 배열 하나
+#   꼭지점 순서의 방향은 상관 없음 : 바깥 경계는 면적을 더하고 구멍은 뺌.
+
+
+def polygon_properties(outer:np.ndarray, holes:Sequence[np.ndarray]=()) -> Dict[str, np.ndarray]:
+    outer = np.asarray(outer, dtype=float)
+    holes = tuple(np.asarray(h, dtype=float) for h in holes)
+
+    # shift to a point near the section so that the parallel axis step does not cancel
+    # 평행축 정리 계산시 자릿수 손실을 줄이기 위해 원점을 단면 근처로 옮김
+    origin = outer.mean(axis=-2, keepdims=True)
+
+    sums = _ring_sums(outer - origin, 1.0)
+    for hole in holes:
+        sums = tuple(s + h for s, h in zip(sums, _ring_sums(hole - origin, -1.0)))
+    a, qx, qy, ixx, iyy, ixy = sums
+
+    cx = qy / a
+    cy = qx / a
+
+    Ix = ixx - a * cy * cy
+    Iy = iyy - a * cx * cx
+    Ixy = ixy - a * cx * cy
+
+    I_mean = 0.5 * (Ix + Iy)
+    I_radius = np.hypot(0.5 * (Ix - Iy), Ixy)
+
+    y = outer[..., 1]
+    x = outer[..., 0]
+
+    return {
+        'area': a,
+        'centroid_x': cx + origin[..., 0, 0],
+        'centroid_y': cy + origin[..., 0, 1],
+        'Ix': Ix,
+        'Iy': Iy,
+        'Ixy': Ixy,
+        'I1': I_mean + I_radius,
+        'I2': I_mean - I_radius,
+        # angle from the x axis to the major principal axis, radian
+        # x 축에서 최대 주축까지의 각, 라디안
+        'theta': 0.5 * np.arctan2(-2.0 * Ixy, Ix - Iy),
+        'x_min': x.min(axis=-1),
+        'x_max': x.max(axis=-1),
+        'y_min': y.min(axis=-1),
+        'y_max': y.max(axis=-1),
+    }
+
+
+def polygon_bending_stress(Mx:np.ndarray, outer:np.ndarray, holes:Sequence[np.ndarray]=(), My:np.ndarray=0.0) -> np.ndarray:
+    # maximum |σ| of unsymmetric bending; the extreme value is always at an outer vertex
+    # 비대칭 굽힘의 최대 |σ|; 최대값은 항상 바깥 경계의 꼭지점에서 발생
+    props = polygon_properties(outer, holes)
+    outer = np.asarray(outer, dtype=float)
+
+    Mx = np.asarray(Mx, dtype=float)[..., None]
+    My = np.asarray(My, dtype=float)[..., None]
+
+    Ix = props['Ix'][..., None]
+    Iy = props['Iy'][..., None]
+    Ixy = props['Ixy'][..., None]
+
+    x = outer[..., 0] - props['centroid_x'][..., None]
+    y = outer[..., 1] - props['centroid_y'][..., None]
+
+    sigma = ((Mx * Iy + My * Ixy) * y - (My * Ix + Mx * Ixy) * x) / (Ix * Iy - Ixy * Ixy)
+    return np.abs(sigma).max(axis=-1)
+
+
+def t_section_polygon(w0:float, h0:float, w1:float, h1:float, w2:float, h2:float) -> np.ndarray:
+    # outline of the three layer section of exercise.py, symmetric about x = 0, counter clockwise
+    # exercise.py 의 세 층 단면의 외곽선, x = 0 에 대해 대칭, 반시계 방향
+    w0, h0, w1, h1, w2, h2 = np.broadcast_arrays(*(np.asarray(d, dtype=float) for d in (w0, h0, w1, h1, w2, h2)))
+    y1 = h0
+    y2 = h0 + h1
+    y3 = y2 + h2
+    zero = np.zeros_like(h0)
+
+    x = np.stack((
+        -0.5 * w0, 0.5 * w0, 0.5 * w0, 0.5 * w1, 0.5 * w1, 0.5 * w2,
+        0.5 * w2, -0.5 * w2, -0.5 * w2, -0.5 * w1, -0.5 * w1, -0.5 * w0,
+    ), axis=-1)
+    y = np.stack((
+        zero, zero, y1, y1, y2, y2,
+        y3, y3, y2, y2, y1, y1,
+    ), axis=-1)
+
+    return np.stack((x, y), axis=-1)
+
+
+def rectangle_polygon(x0:float, y0:float, width:float, height:float) -> np.ndarray:
+    x0, y0, width, height = np.broadcast_arrays(*(np.asarray(d, dtype=float) for d in (x0, y0, width, height)))
+    x = np.stack((x0, x0 + width, x0 + width, x0), axis=-1)
+    y = np.stack((y0, y0, y0 + height, y0 + height), axis=-1)
+    return np.stack((x, y), axis=-1)
+
+
+def _ring_sums(ring:np.ndarray, sign:float) -> Tuple[np.ndarray]:
+    # A, ∫y dA, ∫x dA, ∫y² dA, ∫x² dA, ∫xy dA of one closed ring
+    # 닫힌 경계 하나의 A, ∫y dA, ∫x dA, ∫y² dA, ∫x² dA, ∫xy dA
+    x0 = ring[..., 0]
+    y0 = ring[..., 1]
+    x1 = np.roll(x0, -1, axis=-1)
+    y1 = np.roll(y0, -1, axis=-1)
+
+    cross = x0 * y1 - x1 * y0
+
+    a = 0.5 * cross.sum(axis=-1)
+    qx = ((y0 + y1) * cross).sum(axis=-1) / 6.0
+    qy = ((x0 + x1) * cross).sum(axis=-1) / 6.0
+    ixx = ((y0 * y0 + y0 * y1 + y1 * y1) * cross).sum(axis=-1) / 12.0
+    iyy = ((x0 * x0 + x0 * x1 + x1 * x1) * cross).sum(axis=-1) / 12.0
+    ixy = ((x0 * y1 + 2.0 * x0 * y0 + 2.0 * x1 * y1 + x1 * y0) * cross).sum(axis=-1) / 24.0
+
+    # make the ring counter clockwise for outer boundaries and clockwise for holes
+    # 바깥 경계는 반시계, 구멍은 시계 방향이 되도록 부호를 맞춤
+    orientation = sign * np.sign(a)
+    return tuple(orientation * s for s in (a, qx, qy, ixx, iyy, ixy))
@@ -1,4 +1,3 @@
-import matplotlib.pyplot as plt
 import exercise as beam
 
 
@@ -29,6 +28,10 @@ def sample_main():
     print(f"Area moment below the centroid {q_above_below['a_moment_below']:.6g} m^2")
     print(f"Are these area moments close? {q_above_below['close']}")
 
+    # pyplot only when a figure is drawn
+    # 그림을 그릴 때만 pyplot 을 import
+    import matplotlib.pyplot as plt
+
     ax = plt.gca()
     ax = plot_section(ax, centroid_m, w0_m, w1_m, w2_m, h0_m, h1_m, h2_m)
 
@@ -36,21 +39,27 @@ def sample_main():
 
 
 def plot_section(ax, centroid_m, w0_m, w1_m, w2_m, h0_m, h1_m, h2_m):
-    ax.fill_between(
-        x=[(-0.5) * w0_m, (0.5) * w0_m],
-        y1=[0, 0],
-        y2=[h0_m, h0_m],
-        color='blue', alpha=0.5)
-    ax.fill_between(
-        x=[(-0.5) * w1_m, (0.5) * w1_m],
-        y1=[h0_m, h0_m],
-        y2=[h1_m+h0_m, h1_m+h0_m],
-        color='blue', alpha=0.5)
-    ax.fill_between(
-        x=[(-0.5) * w2_m, (0.5) * w2_m],
-        y1=[h1_m+h0_m, h1_m+h0_m],
-        y2=[h2_m+h1_m+h0_m, h2_m+h1_m+h0_m],
-        color='blue', alpha=0.5)
+    plot_layers(ax, centroid_m, (w0_m, w1_m, w2_m), (h0_m, h1_m, h2_m))
+
+
+def plot_layers(ax, centroid_m, widths_m, heights_m):
+    # all layers as one PolyCollection instead of one fill_between per layer;
+    # only matplotlib is imported so that this also works with a submission's exercise.py
+    # 층마다 fill_between 을 부르지 않고 모든 층을 PolyCollection 하나로;
+    # 제출한 exercise.py 로도 동작하도록 matplotlib 만 import
+    from matplotlib.collections import PolyCollection
+
+    rectangles = []
+    bottom_m = 0.0
+    for w_m, h_m in zip(widths_m, heights_m):
+        rectangles.append((
+            ((-0.5) * w_m, bottom_m), ((0.5) * w_m, bottom_m),
+            ((0.5) * w_m, bottom_m + h_m), ((-0.5) * w_m, bottom_m + h_m),
+        ))
+        bottom_m += h_m
+
+    ax.add_collection(PolyCollection(rectangles, facecolors='blue', edgecolors='none', alpha=0.5))
+    ax.autoscale_view()
     ax.axhline(y=centroid_m, color='red', linestyle='--')
     ax.grid(True)
     ax.axis('equal')
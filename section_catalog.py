@@ -0,0 +1,153 @@
+import numpy as np
+
+
+from typing import Dict
+
+
+from exercise import section_columns, section_properties
+
+
+# Catalog of standard sections indexed for "lightest section that satisfies ..." queries
+# "조건을 만족하는 가장 가벼운 단면" 조회를 위해 색인한 표준 단면 목록
+#   properties are computed once per entry and kept as columns;
+#   a sorted order per column answers range queries by binary search.
+#   단면 특성은 항목마다 한번만 계산하여 열로 저장;
+#   열마다 정렬 순서를 두어 범위 조회는 이진 탐색으로 처리.
+#
+#   skyline : entries that no other entry beats at once in area (lighter), I, S (larger) and depth (shallower)
+#             the lightest section satisfying I >= I_min, S >= S_min and depth <= depth_max is always on it
+#   stair_I, stair_S : the (area, I) and (area, S) skylines; sorted by area, I or S is increasing along them,
+#             so a query on I or S alone is one binary search
+#   skyline : 면적 (가벼움), I, S (큼), 깊이 (얕음) 모두에서 다른 항목보다 못하지 않은 항목
+#             I >= I_min, S >= S_min, depth <= depth_max 를 만족하는 가장 가벼운 단면은 항상 여기에 있음
+#   stair_I, stair_S : (면적, I) 와 (면적, S) 의 skyline; 면적 순으로 I 또는 S 가 증가하므로
+#             I 나 S 한가지 조건의 조회는 이진 탐색 한번
+#
+#   σ <= σ_allow at a moment M is S >= |M| / σ_allow, see lightest_for_moment()
+#   모멘트 M 에서 σ <= σ_allow 는 S >= |M| / σ_allow, lightest_for_moment() 참고
+
+
+def catalog_index(sections:np.ndarray=None) -> Dict[str, np.ndarray]:
+    # sections : (N, 6) rows of (w0, h0, w1, h1, w2, h2); None for an empty catalog
+    # sections : (w0, h0, w1, h1, w2, h2) 행의 (N, 6) 배열; None 이면 빈 목록
+    index = {'sections': np.empty((0, 6))}
+    for name in sorted_columns():
+        index[name] = np.empty(0)
+        index['order_' + name] = np.empty(0, dtype=np.intp)
+    index['skyline'] = index['stair_I'] = index['stair_S'] = np.empty(0, dtype=np.intp)
+
+    if sections is not None:
+        catalog_add(index, sections)
+    return index
+
+
+def sorted_columns() -> tuple:
+    return ('area', 'centroid_y', 'moment_of_inertia', 'S_min', 'depth')
+
+
+def catalog_add(index:Dict[str, np.ndarray], sections:np.ndarray) -> np.ndarray:
+    # appends rows and updates the index in place; returns the numbers given to the new entries
+    # 행을 추가하고 색인을 갱신; 새 항목의 번호를 반환
+    columns = section_columns(sections)
+    props = section_properties(*columns)
+    props['S_min'] = props['moment_of_inertia'] / props['c_max']
+
+    n_old = index['sections'].shape[0]
+    new = np.arange(n_old, n_old + columns[0].size)
+    index['sections'] = np.concatenate((index['sections'], np.stack(columns, axis=-1)))
+
+    for name in sorted_columns():
+        # merge the new entries into the sorted order instead of sorting everything again
+        # 전체를 다시 정렬하지 않고 새 항목을 정렬 순서에 끼워 넣음
+        values = props[name]
+        order = np.argsort(values, kind='stable')
+        old_sorted = index[name][index['order_' + name]]
+        at = np.searchsorted(old_sorted, values[order], side='right')
+        index['order_' + name] = np.insert(index['order_' + name], at, new[order])
+        index[name] = np.concatenate((index[name], values))
+
+    # an entry dominated before stays dominated, so only the old skyline and the new entries are candidates
+    # 이미 지배된 항목은 계속 지배되므로 기존 skyline 과 새 항목만 후보
+    index['skyline'] = _skyline(index, np.concatenate((index['skyline'], new)))
+    index['stair_I'] = _staircase(index, 'moment_of_inertia')
+    index['stair_S'] = _staircase(index, 'S_min')
+    return new
+
+
+def lightest(index:Dict[str, np.ndarray], I_min:float=0.0, S_min:float=0.0, depth_max:float=np.inf) -> int:
+    # number of the lightest entry with I >= I_min, S >= S_min and depth <= depth_max; -1 if none
+    # I >= I_min, S >= S_min, depth <= depth_max 인 가장 가벼운 항목 번호; 없으면 -1
+    if np.isinf(depth_max) and (0.0 >= S_min or 0.0 >= I_min):
+        stair, name, limit = (index['stair_S'], 'S_min', S_min) if S_min > 0.0 else (index['stair_I'], 'moment_of_inertia', I_min)
+        k = np.searchsorted(index[name][stair], limit, side='left')
+        return int(stair[k]) if k < stair.size else -1
+
+    sky = index['skyline']
+    ok = (index['moment_of_inertia'][sky] >= I_min) & (index['S_min'][sky] >= S_min) & (index['depth'][sky] <= depth_max)
+    k = np.argmax(ok) if sky.size else 0
+    return int(sky[k]) if sky.size and ok[k] else -1
+
+
+def lightest_batch(index:Dict[str, np.ndarray], I_min:np.ndarray=0.0, S_min:np.ndarray=0.0, depth_max:np.ndarray=np.inf, block:int=4096) -> np.ndarray:
+    # lightest() for (Q,) queries at once
+    # (Q,) 개 조회를 한번에
+    I_min, S_min, depth_max = np.broadcast_arrays(
+        *(np.atleast_1d(np.asarray(v, dtype=float)) for v in (I_min, S_min, depth_max)))
+    sky = index['skyline']
+    result = np.full(I_min.shape, -1, dtype=np.intp)
+    if 0 == sky.size:
+        return result
+
+    I_sky, S_sky, depth_sky = (index[name][sky] for name in ('moment_of_inertia', 'S_min', 'depth'))
+    for start in range(0, result.size, block):
+        part = slice(start, start + block)
+        ok = (
+            (I_sky >= I_min[part, None]) & (S_sky >= S_min[part, None]) & (depth_sky <= depth_max[part, None])
+        )
+        k = np.argmax(ok, axis=-1)
+        result[part] = np.where(ok[np.arange(k.size), k], sky[k], -1)
+    return result
+
+
+def lightest_for_moment(index:Dict[str, np.ndarray], M:float, sigma_allow:float, depth_max:float=np.inf) -> int:
+    return lightest(index, S_min=abs(M) / sigma_allow, depth_max=depth_max)
+
+
+def in_range(index:Dict[str, np.ndarray], name:str, low:float=-np.inf, high:float=np.inf) -> np.ndarray:
+    # entries with low <= index[name] <= high, in increasing order of that column
+    # low <= index[name] <= high 인 항목, 그 열의 오름차순
+    order = index['order_' + name]
+    values = index[name][order]
+    return order[np.searchsorted(values, low, side='left'):np.searchsorted(values, high, side='right')]
+
+
+def _skyline(index:Dict[str, np.ndarray], candidates:np.ndarray, block:int=1024) -> np.ndarray:
+    # non-dominated candidates sorted by area; between equal entries the first one added stays
+    # 지배되지 않는 후보를 면적 순으로; 같은 항목 사이에서는 먼저 추가된 것만 남김
+    area, I, S, depth = (index[name] for name in ('area', 'moment_of_inertia', 'S_min', 'depth'))
+    candidates = candidates[np.lexsort((candidates, depth[candidates], -S[candidates], -I[candidates], area[candidates]))]
+
+    # in this order any dominating entry comes first, so each block is checked against
+    # the skyline so far and against the earlier entries of the same block
+    # 이 순서에서는 지배하는 항목이 항상 앞에 오므로 각 block 을
+    # 지금까지의 skyline 및 같은 block 의 앞 항목과 비교
+    def dominated_by(j:np.ndarray, i:np.ndarray) -> np.ndarray:
+        return (I[j] >= I[i]) & (S[j] >= S[i]) & (depth[j] <= depth[i])
+
+    sky = np.empty(0, dtype=np.intp)
+    for start in range(0, candidates.size, block):
+        part = candidates[start:start + block]
+        beaten = dominated_by(sky[None, :], part[:, None]).any(axis=-1)
+        earlier = np.tril(np.ones((part.size, part.size), dtype=bool), k=-1)
+        beaten |= (dominated_by(part[None, :], part[:, None]) & earlier).any(axis=-1)
+        sky = np.concatenate((sky, part[~beaten]))
+    return sky
+
+
+def _staircase(index:Dict[str, np.ndarray], name:str) -> np.ndarray:
+    # entries of the skyline, by area, that are stiffer than every lighter one
+    # skyline 항목 중 면적 순으로 더 가벼운 모든 항목보다 큰 것
+    sky = index['skyline']
+    values = index[name][sky]
+    best_before = np.concatenate(((-np.inf,), np.maximum.accumulate(values)[:-1]))
+    return sky[values > best_before]
@@ -0,0 +1,155 @@
+import numpy as np
+
+
+from typing import Dict, Tuple
+
+
+from exercise import layered_section_properties, section_columns
+
+
+# Horizontal cuts through stacked layer sections : area and first moment on either side of a cut at y
+# 쌓은 층 단면의 수평 절단 : 높이 y 에서 자른 면의 위/아래 면적과 1차 모멘트
+#   cut_table() keeps cumulative area and first moment at every layer interface,
+#   so each query is a binary search over the layers plus one partial layer.
+#   cut_table() 은 각 층 경계까지의 누적 면적과 1차 모멘트를 저장하므로
+#   조회마다 층에 대한 이진 탐색과 층 하나의 일부만 계산하면 됨.
+#
+#   y : (N, P) cut heights per section, or (P,) for the same heights in every section
+#   y : 단면별 자르는 높이 (N, P), 또는 모든 단면에 같은 높이 (P,)
+#
+#   Shear stress τ(y) = V Q(y) / (I b(y)) reuses the same table and I.
+#   전단 응력 τ(y) = V Q(y) / (I b(y)) 도 같은 표와 I 를 사용.
+
+
+def cut_table(widths:np.ndarray, heights:np.ndarray) -> Dict[str, np.ndarray]:
+    # widths, heights : (N, L) or (L,) layers, bottom first
+    props = layered_section_properties(np.atleast_2d(widths), np.atleast_2d(heights))
+
+    zero = np.zeros_like(props['area'][:, None])
+    props['cum_area'] = np.concatenate((zero, np.cumsum(props['layer_area'], axis=-1)), axis=-1)
+    props['cum_moment'] = np.concatenate(
+        (zero, np.cumsum(props['layer_area'] * props['layer_centroid'], axis=-1)), axis=-1)
+    return props
+
+
+def cut_table_batch(sections:np.ndarray) -> Dict[str, np.ndarray]:
+    w0, h0, w1, h1, w2, h2 = section_columns(sections)
+    return cut_table(np.stack((w0, w1, w2), axis=-1), np.stack((h0, h1, h2), axis=-1))
+
+
+def shear_stress(table:Dict[str, np.ndarray], V:np.ndarray, y:np.ndarray, side:str='below') -> np.ndarray:
+    # τ(y) = V Q(y) / (I b(y)) for shear forces V of shape (N,) or scalar
+    # at a layer interface b(y) jumps : side='below' uses the layer under the interface, 'above' the one over it
+    # 층 경계에서 b(y) 가 불연속 : side='below' 는 경계 아래 층, 'above' 는 경계 위 층의 폭을 사용
+    if side not in ('below', 'above'):
+        raise ValueError(f"side must be 'below' or 'above', got {side!r}")
+    a_below, q_below_base, width = _below(table, y, above=('above' == side))
+    q = a_below * table['centroid_y'][:, None] - q_below_base
+
+    V = np.asarray(V, dtype=float)
+    numerator = (V[:, None] if V.ndim else V) * q
+    denominator = table['moment_of_inertia'][:, None] * width
+    # no material outside the section or in zero width layers
+    # 단면 밖이나 폭이 0 인 층에는 응력이 없음
+    return np.divide(numerator, denominator, out=np.zeros_like(numerator), where=(denominator > 0.0))
+
+
+def shear_profile(table:Dict[str, np.ndarray], V:np.ndarray, n_points:int=1001) -> Dict[str, np.ndarray]:
+    # τ over the depth of every section on n_points levels, with both sides of each layer interface
+    # 각 단면의 높이 방향 n_points 개 위치와 층 경계 양쪽에서의 τ
+    depth = table['depth'][:, None]
+    grid = np.linspace(0.0, 1.0, n_points)[None, :] * depth
+    interfaces = table['layer_top'][:, :-1]
+
+    y = np.concatenate((grid, interfaces, interfaces), axis=-1)
+    tau = np.concatenate((
+        shear_stress(table, V, grid),
+        shear_stress(table, V, interfaces, side='below'),
+        shear_stress(table, V, interfaces, side='above'),
+    ), axis=-1)
+
+    # sort by height; at an interface the value below comes first
+    # 높이 순 정렬; 경계에서는 아래쪽 값이 먼저
+    rank = np.concatenate((
+        np.ones_like(grid), np.zeros_like(interfaces), np.full_like(interfaces, 2.0),
+    ), axis=-1)
+    order = np.lexsort((rank, y), axis=-1)
+    return {
+        'y': np.take_along_axis(y, order, axis=-1),
+        'tau': np.take_along_axis(tau, order, axis=-1),
+    }
+
+
+def area_below(table:Dict[str, np.ndarray], y:np.ndarray) -> np.ndarray:
+    return _below(table, y)[0]
+
+
+def first_moment(table:Dict[str, np.ndarray], y:np.ndarray) -> np.ndarray:
+    # Q(y) : first moment about the elastic neutral axis of the area above the cut
+    # Q(y) : 절단면 위쪽 면적의 탄성 중립축에 대한 1차 모멘트
+    #   the first moment of the whole section about its centroid is zero, so Q_above = -Q_below
+    #   전체 단면의 도심에 대한 1차 모멘트는 0 이므로 Q_above = -Q_below
+    a_below, q_below_base, _ = _below(table, y)
+    return a_below * table['centroid_y'][:, None] - q_below_base
+
+
+def plastic_neutral_axis(table:Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    # equal area axis found directly in the cumulative area table, and the plastic modulus
+    # Z = Σ|y - y_p| dA = Q_total - 2 Q_below(y_p) about the bottom
+    # 누적 면적 표에서 바로 찾은 등면적 축과 소성 단면 계수
+    half = 0.5 * table['area']
+    k = _locate(table['cum_area'][:, 1:], half[:, None])[:, 0]
+    k = np.minimum(k, table['layer_width'].shape[-1] - 1)
+
+    rows = np.arange(k.size)
+    width = table['layer_width'][rows, k]
+    y_p = table['layer_bottom'][rows, k] + (half - table['cum_area'][rows, k]) / width
+
+    _, q_below_base, _ = _below(table, y_p[:, None])
+    Z = table['cum_moment'][:, -1] - 2.0 * q_below_base[:, 0]
+
+    return {
+        'y_p': y_p,
+        'Z': Z,
+        'shape_factor': Z / np.minimum(table['S_top'], table['S_bottom']),
+    }
+
+
+def _below(table:Dict[str, np.ndarray], y:np.ndarray, above:bool=False) -> Tuple[np.ndarray]:
+    # area below y, its first moment about the bottom of the section and the width at y
+    # y 아래의 면적, 그 단면 하단에 대한 1차 모멘트, y 에서의 폭
+    y = np.asarray(y, dtype=float)
+    n_sections = table['area'].shape[0]
+    if y.ndim < 2:
+        y = np.atleast_1d(y)[None, :]
+    y = np.broadcast_to(y, (n_sections, y.shape[-1]))
+
+    k = np.minimum(_locate(table['layer_top'], y, strict=above), table['layer_top'].shape[-1] - 1)
+
+    bottom = np.take_along_axis(table['layer_bottom'], k, axis=-1)
+    height = np.take_along_axis(table['layer_height'], k, axis=-1)
+    width = np.take_along_axis(table['layer_width'], k, axis=-1)
+
+    t = np.clip(y - bottom, 0.0, height)
+    a = np.take_along_axis(table['cum_area'], k, axis=-1) + width * t
+    q = np.take_along_axis(table['cum_moment'], k, axis=-1) + width * t * (bottom + 0.5 * t)
+    inside = (y >= 0.0) & (y <= table['depth'][:, None])
+    return a, q, np.where(inside, width, 0.0)
+
+
+def _locate(edges:np.ndarray, y:np.ndarray, strict:bool=False) -> np.ndarray:
+    # for every y, the first index with edges[index] >= y (> y if strict), by a vectorized binary search
+    # 각 y 에 대해 edges[index] >= y (strict 이면 > y) 인 첫 번호, 벡터화된 이진 탐색
+    n_edges = edges.shape[-1]
+    lo = np.zeros(y.shape, dtype=np.intp)
+    hi = np.full(y.shape, n_edges, dtype=np.intp)
+
+    for _ in range(n_edges.bit_length()):
+        mid = (lo + hi) // 2
+        value = np.take_along_axis(edges, np.minimum(mid, n_edges - 1), axis=-1)
+        active = lo < hi
+        go_up = active & ((value <= y) if strict else (value < y))
+        lo = np.where(go_up, mid + 1, lo)
+        hi = np.where(active & ~go_up, mid, hi)
+
+    return lo
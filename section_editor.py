@@ -0,0 +1,168 @@
+from typing import Dict, Sequence
+
+
+from exercise import layered_section_properties
+
+
+# Mutable stacked section for interactive editing, one layer at a time
+# 한번에 한 층씩 바꾸는 대화형 편집용 단면
+#   keeps the running sums ΣA, ΣAy and ΣAy² + ΣI_own about the bottom of the section;
+#   a change of one layer adds and removes that layer's share instead of summing every layer again
+#   단면 하단에 대한 ΣA, ΣAy, ΣAy² + ΣI_own 을 유지;
+#   층 하나가 바뀌면 모든 층을 다시 더하지 않고 그 층의 몫만 빼고 더함
+#
+#   width change  : O(1)
+#   height change, insert, remove : the layers above move by dh.
+#     Moving the layers below by -dh and then the whole section by +dh is the same,
+#     and a whole section shift costs O(1) with ΣA and ΣAy, so only the shorter side is visited :
+#     O(min(layers below, layers above)), O(1) for the three layer sections of exercise.py
+#   높이 변경, 삽입, 삭제 : 위쪽 층이 dh 만큼 이동.
+#     아래쪽 층을 -dh 이동한 뒤 단면 전체를 +dh 이동해도 같고
+#     전체 이동은 ΣA, ΣAy 로 O(1) 이므로 짧은 쪽만 갱신 :
+#     O(min(아래 층 수, 위 층 수)), exercise.py 의 3층 단면에서는 O(1)
+#
+#   every refresh_every updates the sums are rebuilt from the layers so that rounding errors do not pile up
+#   refresh_every 번 갱신할 때마다 층으로부터 합을 다시 계산하여 반올림 오차가 쌓이지 않게 함
+
+
+def editable_section(widths:Sequence[float], heights:Sequence[float], refresh_every:int=256) -> Dict[str, object]:
+    # widths, heights : layers, bottom first
+    # widths, heights : 가장 아래 층부터
+    if len(widths) != len(heights):
+        raise ValueError(f"{len(widths)} widths for {len(heights)} heights")
+    section = {
+        'widths': [float(w) for w in widths],
+        'heights': [float(h) for h in heights],
+        'refresh_every': int(refresh_every),
+    }
+    refresh(section)
+    return section
+
+
+def refresh(section:Dict[str, object]):
+    # full recomputation of the sums
+    # 합을 처음부터 다시 계산
+    section['offset'] = 0.0
+    section['centroids'] = []
+    section['sum_A'] = section['sum_Ay'] = section['sum_Ayy'] = section['depth'] = 0.0
+    section['updates'] = 0
+
+    bottom = 0.0
+    for w, h in zip(section['widths'], section['heights']):
+        section['centroids'].append(bottom + 0.5 * h)
+        _add(section, w, h, bottom + 0.5 * h, 1.0)
+        bottom += h
+    section['depth'] = bottom
+
+
+def set_width(section:Dict[str, object], k:int, width:float):
+    h, y = section['heights'][k], section['centroids'][k] + section['offset']
+    _add(section, section['widths'][k], h, y, -1.0)
+    section['widths'][k] = float(width)
+    _add(section, section['widths'][k], h, y, 1.0)
+    _count(section)
+
+
+def set_height(section:Dict[str, object], k:int, height:float):
+    w, h = section['widths'][k], section['heights'][k]
+    bottom = section['centroids'][k] + section['offset'] - 0.5 * h
+    dh = float(height) - h
+
+    _add(section, w, h, bottom + 0.5 * h, -1.0)
+    _shift_above(section, k, dh)
+    section['heights'][k] = float(height)
+    section['centroids'][k] = bottom + 0.5 * height - section['offset']
+    _add(section, w, height, bottom + 0.5 * height, 1.0)
+    section['depth'] += dh
+    _count(section)
+
+
+def insert_layer(section:Dict[str, object], k:int, width:float, height:float):
+    # new layer k on top of layer k - 1; layers k and above move up
+    # 새 층 k 는 층 k - 1 위에 놓이고 기존 층 k 부터는 위로 이동
+    if 0 == k:
+        bottom = 0.0
+    else:
+        bottom = section['centroids'][k - 1] + section['offset'] + 0.5 * section['heights'][k - 1]
+    # a zero height layer adds nothing to the sums
+    # 높이 0 인 층은 합에 기여하지 않음
+    section['widths'].insert(k, float(width))
+    section['heights'].insert(k, 0.0)
+    section['centroids'].insert(k, bottom - section['offset'])
+    set_height(section, k, height)
+
+
+def remove_layer(section:Dict[str, object], k:int):
+    set_height(section, k, 0.0)
+    del section['widths'][k], section['heights'][k], section['centroids'][k]
+
+
+def editor_properties(section:Dict[str, object]) -> Dict[str, float]:
+    area_m2 = section['sum_A']
+    y_m = section['sum_Ay'] / area_m2
+    # parallel axis theorem 평행축 정리
+    I_m4 = section['sum_Ayy'] - area_m2 * y_m * y_m
+    c_top_m, c_bottom_m = section['depth'] - y_m, y_m
+    return {
+        'depth': section['depth'],
+        'area': area_m2,
+        'centroid_y': y_m,
+        'moment_of_inertia': I_m4,
+        'c_top': c_top_m,
+        'c_bottom': c_bottom_m,
+        'c_max': max(c_top_m, c_bottom_m),
+        'S_top': I_m4 / c_top_m,
+        'S_bottom': I_m4 / c_bottom_m,
+    }
+
+
+def editor_bending_stress(section:Dict[str, object], M:float) -> float:
+    props = editor_properties(section)
+    return abs(M) * props['c_max'] / props['moment_of_inertia']
+
+
+def editor_check(section:Dict[str, object]) -> Dict[str, float]:
+    # the same properties from scratch, to compare with editor_properties()
+    # editor_properties() 와 비교하기 위해 처음부터 계산한 같은 특성
+    props = layered_section_properties(section['widths'], section['heights'])
+    return {name: float(props[name]) for name in ('depth', 'area', 'centroid_y', 'moment_of_inertia')}
+
+
+def _shift_above(section:Dict[str, object], k:int, dh:float):
+    # move the layers above layer k up by dh, visiting the shorter side; layer k is not in the sums here
+    # 층 k 위의 층들을 dh 만큼 위로 이동, 짧은 쪽만 방문; 이때 층 k 는 합에 들어 있지 않음
+    n = len(section['widths'])
+    if 0.0 == dh or k + 1 >= n:
+        return
+    if n - k - 1 <= k:
+        for i in range(k + 1, n):
+            _move(section, i, dh)
+    else:
+        for i in range(k):
+            _move(section, i, -dh)
+        # whole section up by dh : ΣAy += dh ΣA, ΣAy² += 2 dh ΣAy + dh² ΣA
+        # 단면 전체를 dh 만큼 위로
+        section['sum_Ayy'] += dh * (2.0 * section['sum_Ay'] + dh * section['sum_A'])
+        section['sum_Ay'] += dh * section['sum_A']
+        section['offset'] += dh
+
+
+def _move(section:Dict[str, object], i:int, dy:float):
+    a = section['widths'][i] * section['heights'][i]
+    y = section['centroids'][i] + section['offset']
+    section['sum_Ayy'] += a * dy * (2.0 * y + dy)
+    section['sum_Ay'] += a * dy
+    section['centroids'][i] += dy
+
+
+def _add(section:Dict[str, object], w:float, h:float, y:float, sign:float):
+    a = w * h
+    section['sum_A'] += sign * a
+    section['sum_Ay'] += sign * a * y
+    section['sum_Ayy'] += sign * (a * y * y + w * h ** 3 / 12.0)
+
+
+def _count(section:Dict[str, object]):
+    section['updates'] += 1
+    if section['updates'] >= section['refresh_every']:
+        refresh(section)
@@ -0,0 +1,234 @@
+import numpy as np
+
+
+from typing import Callable, Dict, Tuple
+
+
+# Section properties by numerical integration of the width function b(y)
+# 폭 함수 b(y) 의 수치 적분으로 단면 특성 계산
+#   A = ∫ b dy,  ȳ = (1/A) ∫ y b dy,  I = ∫ (y - ȳ)² b dy
+#
+# Two ways to give b(y) :
+# b(y) 를 주는 두 가지 방법 :
+#   section_integrals()         : callable b(y, section, piece) on a batch of sections, refined adaptively per interval
+#   sampled_section_integrals() : b sampled on a y grid, integrated as is
+#
+# rule : 'trapezoid', 'simpson' or 'romberg'
+#
+# The refinement nodes on [0, 1] may be kept between calls in a node_cache() passed as `nodes`.
+# [0, 1] 의 세분 점은 node_cache() 를 `nodes` 로 넘겨 호출 사이에 재사용할 수 있음.
+
+
+def node_cache() -> Dict[str, object]:
+    # read only unit nodes by refinement level, filled by section_integrals()
+    # section_integrals() 가 채우는 세분 단계별 읽기 전용 단위 점
+    return {'levels': {}}
+
+
+def section_integrals(width:Callable, breakpoints:np.ndarray, rule:str='simpson', rtol:float=1e-10, max_level:int=20, max_nodes:int=2**20, nodes:Dict[str, object]=None) -> Dict[str, np.ndarray]:
+    # width(y, section, piece) -> b; the three have the same shape (P, m) :
+    #   y of m nodes in each of P intervals, the section number and the interval index of each node
+    # breakpoints : (N, K + 1) increasing y of the interfaces where b(y) may jump, bottom and top included
+    # b(y) only needs to be smooth inside each interval, so jumps at layer interfaces cost nothing extra.
+    # Each interval is refined on its own until its change is below rtol / K of the section total,
+    # and at most max_nodes nodes are evaluated by one call of width().
+    # width(y, section, piece) -> b; 세 배열의 모양은 (P, m) :
+    #   P 개 구간마다 m 개 점의 y, 각 점의 단면 번호와 구간 번호
+    # breakpoints : b(y) 가 불연속일 수 있는 경계의 y (N, K + 1), 하단과 상단 포함
+    # 구간마다 변화량이 단면 전체의 rtol / K 이하가 될 때까지 따로 세분하며
+    # width() 한번에 계산하는 점은 max_nodes 개 이하.
+    _check_rule(rule)
+    if nodes is None:
+        nodes = node_cache()
+    breakpoints = np.atleast_2d(np.asarray(breakpoints, dtype=float))
+    n_sections, n_pieces = breakpoints.shape[0], breakpoints.shape[1] - 1
+
+    # one row per (section, interval) pair, section major
+    # (단면, 구간) 쌍마다 한 행, 단면 순
+    section = np.repeat(np.arange(n_sections), n_pieces)
+    piece = np.tile(np.arange(n_pieces), n_sections)
+    bottom = breakpoints[:, :-1].ravel()
+    length = (breakpoints[:, 1:] - breakpoints[:, :-1]).ravel()
+
+    # integrate about mid depth to limit cancellation in I = ∫y²b - Aȳ²
+    # I = ∫y²b - Aȳ² 의 자릿수 손실을 줄이기 위해 높이의 가운데를 기준으로 적분
+    y_ref = 0.5 * (breakpoints[:, 0] + breakpoints[:, -1])
+
+    def moments(active:np.ndarray, unit:np.ndarray) -> np.ndarray:
+        # (3, P) sums of b, y b, y² b over the unit nodes of the active pairs, max_nodes at a time
+        # active 쌍의 단위 점에서 b, y b, y² b 의 합, 한번에 max_nodes 개씩
+        sums = np.zeros((3, active.size))
+        block = max(1, max_nodes // unit.size)
+        step = min(unit.size, max_nodes)
+        for start in range(0, active.size, block):
+            rows = active[start:start + block]
+            # one pair with more than max_nodes nodes is summed in parts
+            # 점이 max_nodes 개보다 많은 쌍은 나누어 더함
+            for first in range(0, unit.size, step):
+                y = bottom[rows, None] + length[rows, None] * unit[first:first + step]
+                shape = y.shape
+                b = np.asarray(width(y, np.broadcast_to(section[rows, None], shape), np.broadcast_to(piece[rows, None], shape)), dtype=float)
+                y_c = y - y_ref[section[rows], None]
+                sums[:, start:start + block] += (b.sum(axis=-1), (y_c * b).sum(axis=-1), (y_c * y_c * b).sum(axis=-1))
+        return sums
+
+    # trapezoid sequence T_k over 2**k panels per interval; each level only adds the new midpoints.
+    # history and romberg_row hold the pairs still active; converged pairs keep their estimate in final.
+    # 구간마다 2**k 개 패널의 사다리꼴 적분 T_k; 각 단계에서는 새 중점만 계산.
+    # history 와 romberg_row 는 아직 수렴하지 않은 쌍만 가지며 수렴한 쌍의 값은 final 에 남음.
+    active = np.arange(section.size)
+    trapezoid = 0.5 * length * moments(active, _unit_nodes(nodes, 0))
+    history = [trapezoid]
+    romberg_row = [trapezoid]
+    final = _estimate(rule, history, romberg_row).copy()
+
+    pair_levels = np.full(section.size, max_level)
+    done = np.zeros(section.size, dtype=bool)
+
+    for level in range(1, max_level + 1):
+        if 0 == active.size:
+            break
+        h = length[active] / (2 ** level)
+        trapezoid = 0.5 * history[-1] + h * moments(active, _unit_nodes(nodes, level))
+        history.append(trapezoid)
+        romberg_row = _romberg_row(romberg_row, trapezoid)
+
+        estimate = _estimate(rule, history, romberg_row)
+        previous, final[:, active] = final[:, active], estimate
+        if level < 2:
+            continue
+
+        newly = _close(estimate, previous, _section_scale(final, section, n_sections)[:, section[active]], rtol / n_pieces)
+        pair_levels[active[newly]] = level
+        done[active[newly]] = True
+
+        keep = ~newly
+        active = active[keep]
+        history = [t[:, keep] for t in history]
+        romberg_row = [r[:, keep] for r in romberg_row]
+
+    return _properties(
+        final.reshape(3, n_sections, n_pieces), y_ref,
+        converged=done.reshape(n_sections, n_pieces).all(axis=-1),
+        levels=pair_levels.reshape(n_sections, n_pieces).max(axis=-1, initial=0),
+    )
+
+
+def sampled_section_integrals(y:np.ndarray, b:np.ndarray, rule:str='simpson') -> Dict[str, np.ndarray]:
+    # y, b : (..., m) samples of the width along the depth; 'romberg' needs m = 2**k + 1 equally spaced samples
+    # y, b : 높이 방향 폭의 표본 (..., m); 'romberg' 는 같은 간격의 2**k + 1 개 표본이 필요
+    _check_rule(rule)
+    y = np.asarray(y, dtype=float)
+    b = np.asarray(b, dtype=float)
+    y, b = np.broadcast_arrays(y, b)
+
+    y_ref = 0.5 * (y[..., 0] + y[..., -1])
+    y_c = y - y_ref[..., None]
+    integrands = np.stack((b, y_c * b, y_c * y_c * b))
+
+    if 'trapezoid' == rule:
+        sums = (0.5 * (integrands[..., 1:] + integrands[..., :-1]) * np.diff(y_c, axis=-1)).sum(axis=-1)
+    elif 'simpson' == rule:
+        # scipy is imported on first use : a plain import of this module needs numpy only
+        # scipy 은 처음 사용할 때 import : 이 모듈만 import 할 때는 numpy 만 필요
+        import scipy.integrate
+        sums = scipy.integrate.simpson(integrands, x=y_c, axis=-1)
+    else:
+        m = y.shape[-1]
+        if m < 2 or (m - 1) & (m - 2):
+            raise ValueError(f"romberg needs 2**k + 1 samples, got {m}")
+        dy = np.diff(y_c, axis=-1)
+        if not np.allclose(dy, dy[..., :1], rtol=1e-9, atol=0.0):
+            raise ValueError("romberg needs equally spaced samples")
+        import scipy.integrate
+        sums = scipy.integrate.romb(integrands, dx=1.0, axis=-1) * dy[..., 0]
+
+    return _properties(sums, y_ref)
+
+
+def layered_width(widths:np.ndarray, heights:np.ndarray) -> Tuple[Callable, np.ndarray]:
+    # width function and breakpoints of stacked rectangles, (N, L) or (L,) arrays
+    # 쌓은 직사각형의 폭 함수와 경계, (N, L) 또는 (L,) 배열
+    widths = np.atleast_2d(np.asarray(widths, dtype=float))
+    heights = np.atleast_2d(np.asarray(heights, dtype=float))
+    widths, heights = np.broadcast_arrays(widths, heights)
+
+    tops = np.cumsum(heights, axis=-1)
+    breakpoints = np.concatenate((np.zeros_like(tops[:, :1]), tops), axis=-1)
+
+    def width(y:np.ndarray, section:np.ndarray, piece:np.ndarray) -> np.ndarray:
+        return widths[section, piece]
+
+    return width, breakpoints
+
+
+def _properties(sums:np.ndarray, y_ref:np.ndarray, **extra) -> Dict[str, np.ndarray]:
+    # sums : integrals of b, y b, y² b about y_ref, either (3, ...) or (3, N, K) to be added over the intervals
+    # sums : y_ref 기준 b, y b, y² b 의 적분
+    if sums.ndim > np.ndim(y_ref) + 1:
+        sums = sums.sum(axis=-1)
+    area_m2, q_m3, i_m4 = sums
+    y_m = q_m3 / area_m2
+    result = {
+        'area': area_m2,
+        'centroid_y': y_m + y_ref,
+        'moment_of_inertia': i_m4 - area_m2 * y_m * y_m,
+    }
+    result.update(extra)
+    return result
+
+
+def _estimate(rule:str, history:list, romberg_row:list) -> np.ndarray:
+    if 'trapezoid' == rule:
+        return history[-1]
+    elif 'simpson' == rule:
+        if len(history) < 2:
+            return history[-1]
+        return (4.0 * history[-1] - history[-2]) / 3.0
+    return romberg_row[-1]
+
+
+def _romberg_row(previous:list, trapezoid:np.ndarray) -> list:
+    # next row of the Richardson extrapolation table
+    # Richardson 외삽 표의 다음 행
+    row = [trapezoid]
+    for j, r in enumerate(previous, start=1):
+        factor = 4.0 ** j
+        row.append(row[-1] + (row[-1] - r) / (factor - 1.0))
+    return row
+
+
+def _section_scale(final:np.ndarray, section:np.ndarray, n_sections:int) -> np.ndarray:
+    # (3, N) magnitudes of the section totals of b, y b, y² b
+    # 단면 전체 b, y b, y² b 적분의 크기 (3, N)
+    total = np.stack([np.bincount(section, weights=f, minlength=n_sections) for f in final])
+    scale = np.abs(total)
+    # first moment may be close to zero : compare it with A × half depth instead
+    # 1차 모멘트는 0 에 가까울 수 있으므로 A × 높이의 절반과 비교
+    scale[1] = np.sqrt(np.abs(total[0] * total[2]))
+    return scale
+
+
+def _close(estimate:np.ndarray, previous:np.ndarray, scale:np.ndarray, rtol:float) -> np.ndarray:
+    # (P,) pairs whose three integrals changed by at most rtol × scale
+    # 세 적분의 변화가 모두 rtol × scale 이하인 쌍
+    return (np.abs(estimate - previous) <= rtol * scale).all(axis=0)
+
+
+def _unit_nodes(nodes:Dict[str, object], level:int) -> np.ndarray:
+    # nodes added at a refinement level on [0, 1], read only as they are shared through the cache
+    # [0, 1] 에서 각 단계에 새로 추가되는 점, cache 로 공유하므로 읽기 전용
+    levels = nodes['levels']
+    if level not in levels:
+        if 0 == level:
+            unit = np.array((0.0, 1.0))
+        else:
+            unit = (2.0 * np.arange(2 ** (level - 1)) + 1.0) / (2 ** level)
+        unit.flags.writeable = False
+        levels[level] = unit
+    return levels[level]
+
+
+def _check_rule(rule:str):
+    if rule not in ('trapezoid', 'simpson', 'romberg'):
+        raise ValueError(f"unknown rule {rule!r}, expected 'trapezoid', 'simpson' or 'romberg'")
@@ -0,0 +1,232 @@
+import numpy as np
+
+
+from argparse import ArgumentParser
+from itertools import islice
+from pathlib import Path
+from typing import Dict, Iterator, Sequence, Tuple
+from zipfile import ZIP_STORED, ZipFile
+
+
+from exercise import section_properties
+
+
+# Bulk evaluation of section catalogs stored as .npy, .npz or .csv
+# .npy, .npz, .csv 파일에 저장된 단면 목록의 일괄 계산
+#   input rows  : (w0, h0, w1, h1, w2, h2) or (w0, h0, w1, h1, w2, h2, M)
+#   output rows : output_columns(), written into a preallocated memory mapped .npy file
+#   입력 행 : (w0, h0, w1, h1, w2, h2) 또는 (w0, h0, w1, h1, w2, h2, M)
+#   출력 행 : output_columns(), 미리 할당한 메모리 매핑 .npy 파일에 기록
+#
+#   .npy and uncompressed .npz members are memory mapped, compressed .npz members and .csv are streamed,
+#   so memory stays at about one chunk whatever the number of rows.
+#   .npy 와 압축하지 않은 .npz 는 메모리 매핑, 압축한 .npz 와 .csv 는 순서대로 읽으므로
+#   행의 수와 상관 없이 chunk 하나 정도의 메모리만 사용함.
+#
+# Command line 명령행 :
+#   python -c "import section_io; section_io.main()" catalog.csv results.npy --chunk-rows 1048576
+
+
+def output_columns() -> Tuple[str]:
+    return ('area', 'centroid_y', 'moment_of_inertia', 'S_top', 'S_bottom', 'bending_stress')
+
+
+def evaluate_chunk(chunk:np.ndarray, out:np.ndarray=None) -> np.ndarray:
+    # (n, 6) or (n, 7) input rows -> (n, len(output_columns())); bending_stress is nan without an M column
+    # (n, 6) 또는 (n, 7) 입력 -> (n, len(output_columns())); M 열이 없으면 bending_stress 는 nan
+    chunk = np.asarray(chunk, dtype=float)
+    if chunk.ndim != 2 or chunk.shape[1] not in (6, 7):
+        raise ValueError(f"expected rows of 6 or 7 columns, got shape {chunk.shape}")
+    if out is None:
+        out = np.empty((chunk.shape[0], len(output_columns())))
+
+    props = section_properties(*chunk[:, :6].T)
+    for i, name in enumerate(output_columns()[:-1]):
+        out[:, i] = props[name]
+
+    if 7 == chunk.shape[1]:
+        out[:, -1] = np.abs(chunk[:, 6]) * props['c_max'] / props['moment_of_inertia']
+    else:
+        out[:, -1] = np.nan
+    return out
+
+
+def evaluate_file(input_path:str, output_path:str, chunk_rows:int=2**20, key:str=None) -> Dict[str, object]:
+    n_rows = count_rows(input_path, key)
+    out = np.lib.format.open_memmap(
+        str(output_path), mode='w+', dtype=np.float64, shape=(n_rows, len(output_columns())))
+
+    written = 0
+    for start, chunk in iter_chunks(input_path, chunk_rows, key):
+        evaluate_chunk(chunk, out[start:start + chunk.shape[0]])
+        written = start + chunk.shape[0]
+
+    out.flush()
+    if written != n_rows:
+        # a row left unwritten would read as a zero section
+        # 기록하지 않은 행은 치수가 0 인 단면으로 보임
+        raise ValueError(f"read {written} rows from {input_path} but counted {n_rows}")
+    del out
+    return {'rows': n_rows, 'columns': output_columns(), 'path': str(output_path)}
+
+
+def iter_chunks(path:str, chunk_rows:int=2**20, key:str=None) -> Iterator[Tuple[int, np.ndarray]]:
+    # yields (first row, (n, columns) chunk)
+    # (첫 행 번호, (n, 열) chunk) 를 차례로 반환
+    suffix = Path(path).suffix.lower()
+    if '.csv' == suffix:
+        yield from _csv_chunks(path, chunk_rows)
+    elif suffix in ('.npy', '.npz'):
+        array = open_array(path, key)
+        if array is None:
+            yield from _npz_stream_chunks(path, key, chunk_rows)
+        else:
+            for start in range(0, array.shape[0], chunk_rows):
+                yield start, np.asarray(array[start:start + chunk_rows])
+    else:
+        raise ValueError(f"unsupported file type {suffix!r}, expected .npy, .npz or .csv")
+
+
+def count_rows(path:str, key:str=None) -> int:
+    suffix = Path(path).suffix.lower()
+    if '.csv' == suffix:
+        # the rows np.loadtxt() reads : no blank lines, no # comments, no header
+        # np.loadtxt() 가 읽는 행 : 빈 줄, # 주석, 머리글 제외
+        with open(path, 'rb') as f:
+            first = _first_data_line(f)
+            n = 1 if first and _is_numeric(first) else 0
+            return n + sum(1 for line in f if _is_data(line))
+
+    array = open_array(path, key)
+    if array is None:
+        return _npz_header(path, key)[0][0]
+    return array.shape[0]
+
+
+def open_array(path:str, key:str=None) -> np.ndarray:
+    # memory mapped view of a .npy file or of an uncompressed .npz member; None for compressed members
+    # .npy 파일 또는 압축하지 않은 .npz 항목의 메모리 매핑; 압축된 항목이면 None
+    if '.npy' == Path(path).suffix.lower():
+        return np.load(path, mmap_mode='r')
+
+    with ZipFile(path) as archive:
+        info = archive.getinfo(_npz_member(archive, key))
+        if info.compress_type != ZIP_STORED:
+            return None
+        header_offset = info.header_offset
+
+    with open(path, 'rb') as f:
+        # zip local file header : 30 bytes, then the file name and the extra field
+        # zip 지역 파일 헤더 : 30 바이트 뒤에 파일 이름과 추가 필드
+        f.seek(header_offset + 26)
+        name_length = int.from_bytes(f.read(2), 'little')
+        extra_length = int.from_bytes(f.read(2), 'little')
+        f.seek(header_offset + 30 + name_length + extra_length)
+        shape, fortran_order, dtype = _read_npy_header(f)
+        offset = f.tell()
+
+    return np.memmap(path, dtype=dtype, mode='r', shape=shape, order='F' if fortran_order else 'C', offset=offset)
+
+
+def main(argv:Sequence[str]=None) -> Dict[str, object]:
+    parser = ArgumentParser(description='Evaluate section properties of a .npy, .npz or .csv catalog')
+    parser.add_argument('input', help='rows of (w0, h0, w1, h1, w2, h2[, M])')
+    parser.add_argument('output', help='.npy file of ' + ', '.join(output_columns()))
+    parser.add_argument('--chunk-rows', type=int, default=2**20)
+    parser.add_argument('--key', default=None, help='array name inside a .npz file')
+    args = parser.parse_args(argv)
+
+    result = evaluate_file(args.input, args.output, args.chunk_rows, args.key)
+    print(f"{result['rows']} rows -> {result['path']} ({', '.join(result['columns'])})")
+    return result
+
+
+def _csv_chunks(path:str, chunk_rows:int) -> Iterator[Tuple[int, np.ndarray]]:
+    # the lines are filtered with _is_data() as in count_rows(), so the two always agree
+    # count_rows() 와 같이 _is_data() 로 줄을 골라 두 함수의 행 수가 항상 같음
+    start = 0
+    with open(path, 'r') as f:
+        first = _first_data_line(f)
+        data = filter(_is_data, f)
+        pending = [first] if first and _is_numeric(first) else []
+        while True:
+            lines = pending + list(islice(data, chunk_rows - len(pending)))
+            pending = []
+            if not lines:
+                break
+            chunk = np.loadtxt(lines, delimiter=',', ndmin=2)
+            yield start, chunk
+            start += chunk.shape[0]
+
+
+def _npz_stream_chunks(path:str, key:str, chunk_rows:int) -> Iterator[Tuple[int, np.ndarray]]:
+    (n_rows, *row_shape), fortran_order, dtype = _npz_header(path, key)
+    if fortran_order:
+        # rows are not contiguous : load the member once
+        # 행이 연속되지 않음 : 한번에 읽음
+        array = np.load(path)[_npz_array_name(path, key)]
+        for start in range(0, n_rows, chunk_rows):
+            yield start, array[start:start + chunk_rows]
+        return
+
+    row_bytes = dtype.itemsize * int(np.prod(row_shape))
+    with ZipFile(path) as archive, archive.open(_npz_member(archive, key)) as f:
+        _read_npy_header(f)
+        for start in range(0, n_rows, chunk_rows):
+            n = min(chunk_rows, n_rows - start)
+            buffer = f.read(n * row_bytes)
+            yield start, np.frombuffer(buffer, dtype=dtype).reshape((n, *row_shape))
+
+
+def _npz_header(path:str, key:str) -> Tuple[tuple, bool, np.dtype]:
+    with ZipFile(path) as archive, archive.open(_npz_member(archive, key)) as f:
+        return _read_npy_header(f)
+
+
+def _npz_member(archive:ZipFile, key:str) -> str:
+    names = [n for n in archive.namelist() if n.endswith('.npy')]
+    if key is None:
+        if len(names) != 1:
+            raise ValueError(f"choose one of {[n[:-4] for n in names]} with key")
+        return names[0]
+    if f'{key}.npy' not in names:
+        raise KeyError(f"{key!r} not in {[n[:-4] for n in names]}")
+    return f'{key}.npy'
+
+
+def _npz_array_name(path:str, key:str) -> str:
+    with ZipFile(path) as archive:
+        return _npz_member(archive, key)[:-4]
+
+
+def _read_npy_header(f) -> Tuple[tuple, bool, np.dtype]:
+    version = np.lib.format.read_magic(f)
+    if (1, 0) == version:
+        return np.lib.format.read_array_header_1_0(f)
+    return np.lib.format.read_array_header_2_0(f)
+
+
+def _first_data_line(f) -> bytes:
+    # the line that may be a header, after the leading blank and comment lines; None at the end of the file
+    # 앞의 빈 줄과 주석 뒤에 오는, 머리글일 수 있는 줄; 파일이 끝나면 None
+    for line in f:
+        if _is_data(line):
+            return line
+    return None
+
+
+def _is_data(line:bytes) -> bool:
+    # anything left once the comment and the white space are removed
+    # 주석과 공백을 지운 뒤 남는 내용이 있는지
+    return bool(line.split(b'#' if isinstance(line, bytes) else '#', 1)[0].strip())
+
+
+def _is_numeric(line:bytes) -> bool:
+    # a header has a field that is not a number once the comment is removed
+    # 주석을 지운 뒤 숫자가 아닌 칸이 있으면 머리글
+    data = line.split(b'#' if isinstance(line, bytes) else '#', 1)[0]
+    try:
+        [float(v) for v in data.split(b',' if isinstance(line, bytes) else ',')]
+    except ValueError:
+        return False
+    return True
@@ -0,0 +1,152 @@
+import numpy as np
+
+
+from typing import Dict
+
+
+from exercise import area, bending_stress
+from section_sensitivity import section_jacobian_batch
+
+
+# Lightest three layer section for a bending moment and an allowable stress
+# 굽힘 모멘트와 허용 응력에 대한 가장 가벼운 세 층 단면
+#   bounds : (6, 2) array of (lower, upper) for (w0, h0, w1, h1, w2, h2)
+#   bounds : (w0, h0, w1, h1, w2, h2) 각각의 (하한, 상한), (6, 2) 배열
+#
+#   1. coarse grid sweep, evaluated in batches of batch_size sections
+#      격자 탐색, batch_size 개 단면씩 묶어서 계산
+#   2. SLSQP from the best grid points with the analytic gradients of section_sensitivity.py
+#      가장 좋은 격자점에서 시작하는 SLSQP, section_sensitivity.py 의 해석적 미분 사용
+
+
+def grid_sweep(M:float, bounds:np.ndarray, points_per_dim:int=8, batch_size:int=2**16):
+    # yields (sections, area, σ_max) for every batch of the grid
+    # 격자의 batch 마다 (단면, 면적, σ_max) 를 반환
+    bounds = _check_bounds(bounds)
+    axes = np.linspace(bounds[:, 0], bounds[:, 1], points_per_dim).T
+    n_total = points_per_dim ** 6
+
+    for start in range(0, n_total, batch_size):
+        index = np.unravel_index(np.arange(start, min(start + batch_size, n_total)), (points_per_dim,) * 6)
+        sections = np.stack([axes[d][i] for d, i in enumerate(index)], axis=-1)
+        yield sections, area(*sections.T), bending_stress(M, *sections.T)
+
+
+def pareto_front(M:float, bounds:np.ndarray, points_per_dim:int=8, batch_size:int=2**16) -> Dict[str, np.ndarray]:
+    # grid sections not dominated in (area, σ_max), sorted by increasing area
+    # (면적, σ_max) 에서 다른 단면에 지배되지 않는 격자 단면, 면적 순
+    front = {'sections': np.empty((0, 6)), 'area': np.empty(0), 'bending_stress': np.empty(0)}
+
+    for sections, area_m2, sigma_pa in grid_sweep(M, bounds, points_per_dim, batch_size):
+        front = _nondominated(
+            np.concatenate((front['sections'], sections)),
+            np.concatenate((front['area'], area_m2)),
+            np.concatenate((front['bending_stress'], sigma_pa)),
+        )
+
+    return front
+
+
+def minimum_area_section(M:float, sigma_allow:float, bounds:np.ndarray, points_per_dim:int=8, n_starts:int=4, batch_size:int=2**16, refine:bool=True) -> Dict[str, object]:
+    bounds = _check_bounds(bounds)
+
+    # keep the n_starts lightest feasible grid points
+    # 허용 응력을 만족하는 가장 가벼운 격자점 n_starts 개를 유지
+    best_sections = np.empty((0, 6))
+    best_area = np.empty(0)
+    for sections, area_m2, sigma_pa in grid_sweep(M, bounds, points_per_dim, batch_size):
+        feasible = sigma_pa <= sigma_allow
+        best_sections = np.concatenate((best_sections, sections[feasible]))
+        best_area = np.concatenate((best_area, area_m2[feasible]))
+        keep = np.argsort(best_area, kind='stable')[:n_starts]
+        best_sections, best_area = best_sections[keep], best_area[keep]
+
+    if 0 == best_area.size:
+        return {'section': None, 'area': np.inf, 'bending_stress': np.inf, 'feasible': False, 'success': False}
+
+    best = {'section': best_sections[0], 'area': float(best_area[0]), 'success': True}
+
+    if refine:
+        for start in best_sections:
+            candidate = _refine(M, sigma_allow, bounds, start)
+            if candidate['feasible'] and candidate['area'] < best['area']:
+                best = candidate
+
+    best['bending_stress'] = bending_stress(M, *best['section'])
+    best['feasible'] = best['bending_stress'] <= sigma_allow * (1.0 + 1e-9)
+    return best
+
+
+def _refine(M:float, sigma_allow:float, bounds:np.ndarray, start:np.ndarray) -> Dict[str, object]:
+    # free variables scaled to [0, 1] inside the bounds; a dimension with lower == upper stays fixed
+    # 자유 변수를 범위 안에서 [0, 1] 로 변환; 하한과 상한이 같은 치수는 고정
+    lower = bounds[:, 0]
+    span = bounds[:, 1] - bounds[:, 0]
+    free = span > 0.0
+    area_0 = area(*start)
+
+    def dims(x:np.ndarray) -> np.ndarray:
+        section = np.array(start, dtype=float)
+        section[free] = lower[free] + span[free] * x
+        return section
+
+    if not free.any():
+        return {
+            'section': dims(np.empty(0)),
+            'area': area_0,
+            'feasible': bending_stress(M, *start) <= sigma_allow * (1.0 + 1e-9),
+            'success': True,
+        }
+
+    def objective(x:np.ndarray) -> float:
+        return area(*dims(x)) / area_0
+
+    def objective_gradient(x:np.ndarray) -> np.ndarray:
+        return section_jacobian_batch(dims(x)[None, :])['area'][0, free] * span[free] / area_0
+
+    def constraint(x:np.ndarray) -> float:
+        return 1.0 - bending_stress(M, *dims(x)) / sigma_allow
+
+    def constraint_gradient(x:np.ndarray) -> np.ndarray:
+        return -section_jacobian_batch(dims(x)[None, :], M)['bending_stress'][0, free] * span[free] / sigma_allow
+
+    # scipy on first use only
+    # 처음 사용할 때만 scipy 를 import
+    import scipy.optimize
+    result = scipy.optimize.minimize(
+        objective, (start[free] - lower[free]) / span[free],
+        jac=objective_gradient,
+        method='SLSQP',
+        bounds=[(0.0, 1.0)] * int(free.sum()),
+        constraints=({'type': 'ineq', 'fun': constraint, 'jac': constraint_gradient},),
+        options={'maxiter': 200, 'ftol': 1e-12},
+    )
+
+    section = dims(np.clip(result.x, 0.0, 1.0))
+    return {
+        'section': section,
+        'area': area(*section),
+        'feasible': bending_stress(M, *section) <= sigma_allow * (1.0 + 1e-9),
+        'success': bool(result.success),
+    }
+
+
+def _nondominated(sections:np.ndarray, area_m2:np.ndarray, sigma_pa:np.ndarray) -> Dict[str, np.ndarray]:
+    # sort by area then stress; a point stays if its stress is below every lighter point
+    # 면적, 응력 순으로 정렬; 더 가벼운 모든 점보다 응력이 낮으면 남김
+    order = np.lexsort((sigma_pa, area_m2))
+    sigma_sorted = sigma_pa[order]
+    running_min = np.minimum.accumulate(sigma_sorted)
+    keep = np.ones(order.size, dtype=bool)
+    keep[1:] = sigma_sorted[1:] < running_min[:-1]
+    order = order[keep]
+    return {'sections': sections[order], 'area': area_m2[order], 'bending_stress': sigma_pa[order]}
+
+
+def _check_bounds(bounds:np.ndarray) -> np.ndarray:
+    bounds = np.asarray(bounds, dtype=float)
+    if bounds.shape != (6, 2):
+        raise ValueError(f"bounds must be a (6, 2) array, got shape {bounds.shape}")
+    if (bounds[:, 0] <= 0.0).any() or (bounds[:, 1] < bounds[:, 0]).any():
+        raise ValueError("bounds must be positive with lower <= upper")
+    return bounds
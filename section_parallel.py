@@ -0,0 +1,95 @@
+import numpy as np
+
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from os import cpu_count
+from typing import Callable, Tuple
+
+
+from section_io import evaluate_chunk, output_columns
+
+
+# Row chunks of a section batch evaluated on a pool of workers
+# 단면 묶음을 행 단위 chunk 로 나누어 여러 worker 에서 계산
+#   backend='process' : inputs and outputs live in multiprocessing.shared_memory blocks;
+#                       workers get only the block names and a row range, never the arrays themselves
+#   backend='thread'  : threads share the arrays directly, for kernels that release the GIL
+#   backend='process' : 입력과 출력은 multiprocessing.shared_memory 에 두고
+#                       worker 에는 배열 대신 메모리 이름과 행 범위만 전달
+#   backend='thread'  : numpy 계산이 GIL 을 놓는 경우 thread 들이 배열을 직접 공유
+#
+#   kernel(chunk, out) reads an (n, C) chunk and fills its (n, n_columns) output rows;
+#   for processes it must be a module level function. Every chunk writes to its own rows, so the
+#   result does not depend on the number of workers or the order in which chunks finish.
+#   kernel(chunk, out) 은 (n, C) chunk 를 읽어 (n, n_columns) 출력 행을 채움;
+#   process 를 쓸 때는 모듈 수준 함수여야 함. chunk 마다 자기 행에만 쓰므로
+#   결과는 worker 수나 chunk 가 끝나는 순서와 상관 없음.
+
+
+def parallel_evaluate(rows:np.ndarray, kernel:Callable=evaluate_chunk, n_columns:int=None, workers:int=None, chunk_rows:int=None, backend:str='process') -> np.ndarray:
+    if backend not in ('process', 'thread'):
+        raise ValueError(f"unknown backend {backend!r}, expected 'process' or 'thread'")
+
+    rows = np.ascontiguousarray(rows, dtype=float)
+    if n_columns is None:
+        n_columns = len(output_columns())
+    workers = workers or cpu_count() or 1
+    chunk_rows = chunk_rows or auto_chunk_rows(rows.shape[0], workers)
+    ranges = [(start, min(start + chunk_rows, rows.shape[0])) for start in range(0, rows.shape[0], chunk_rows)]
+
+    if 1 == workers or len(ranges) <= 1:
+        out = np.empty((rows.shape[0], n_columns))
+        for start, stop in ranges:
+            kernel(rows[start:stop], out[start:stop])
+        return out
+
+    if 'thread' == backend:
+        out = np.empty((rows.shape[0], n_columns))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(lambda r: kernel(rows[r[0]:r[1]], out[r[0]:r[1]]), ranges))
+        return out
+
+    shm_in = SharedMemory(create=True, size=max(rows.nbytes, 1))
+    shm_out = SharedMemory(create=True, size=max(rows.shape[0] * n_columns * 8, 1))
+    try:
+        shared_in = np.ndarray(rows.shape, dtype=float, buffer=shm_in.buf)
+        shared_in[...] = rows
+        shared_out = np.ndarray((rows.shape[0], n_columns), dtype=float, buffer=shm_out.buf)
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(_run_chunk, kernel, shm_in.name, rows.shape, shm_out.name, shared_out.shape, start, stop)
+                for start, stop in ranges
+            ]
+            for future in futures:
+                future.result()
+
+        out = shared_out.copy()
+        del shared_in, shared_out
+    finally:
+        for shm in (shm_in, shm_out):
+            shm.close()
+            shm.unlink()
+
+    return out
+
+
+def auto_chunk_rows(n_rows:int, workers:int, min_rows:int=2**14, max_rows:int=2**20) -> int:
+    # about four chunks per worker for load balance, each big enough to amortize the dispatch
+    # 부하 분산을 위해 worker 당 약 4개 chunk, 각 chunk 는 전달 비용을 상쇄할 만큼 크게
+    target = -(-n_rows // (4 * max(workers, 1)))
+    return int(min(max(target, min_rows), max_rows))
+
+
+def _run_chunk(kernel:Callable, in_name:str, in_shape:Tuple[int], out_name:str, out_shape:Tuple[int], start:int, stop:int):
+    shm_in = SharedMemory(name=in_name)
+    shm_out = SharedMemory(name=out_name)
+    try:
+        rows = np.ndarray(in_shape, dtype=float, buffer=shm_in.buf)
+        out = np.ndarray(out_shape, dtype=float, buffer=shm_out.buf)
+        kernel(rows[start:stop], out[start:stop])
+        del rows, out
+    finally:
+        shm_in.close()
+        shm_out.close()
@@ -0,0 +1,162 @@
+import numpy as np
+
+
+from concurrent.futures import ProcessPoolExecutor
+from os import cpu_count
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+
+from exercise import section_columns
+from section_cuts import cut_table, plastic_neutral_axis
+
+
+# Contact sheets of many stacked layer sections, rendered without a display
+# 많은 층 단면을 한 장에 모아 화면 없이 그림
+#   one PolyCollection holds every layer of every section on a page, and two LineCollections
+#   hold the centroid (red --) and plastic neutral axis (green -.) lines,
+#   so a page costs a few artists whatever the number of sections.
+#   Pages are drawn on Agg canvases, without pyplot, in parallel worker processes.
+#   한 쪽의 모든 단면의 모든 층은 PolyCollection 하나에, 도심 (빨강 --) 과
+#   소성 중립축 (초록 -.) 선은 LineCollection 두개에 담으므로 단면 수와 상관 없이 artist 는 몇 개뿐.
+#   각 쪽은 pyplot 없이 Agg canvas 에 여러 worker process 에서 병렬로 그림.
+#
+#   widths, heights : (N, L) layers, bottom first; sections with fewer layers are padded with zeros (see pad_layers())
+#   widths, heights : 아래 층부터 (N, L); 층이 적은 단면은 0 으로 채움 (pad_layers() 참고)
+#
+#   matplotlib is imported inside the drawing functions only.
+#   matplotlib 은 그리는 함수 안에서만 import.
+
+
+def layer_polygons(widths:np.ndarray, heights:np.ndarray, x_center:np.ndarray=0.0, y_bottom:np.ndarray=0.0, scale:np.ndarray=1.0) -> np.ndarray:
+    # (K, 4, 2) rectangles of the non empty layers, centered on x_center and stacked from y_bottom
+    # 비어 있지 않은 층의 (K, 4, 2) 직사각형, x_center 를 중심으로 y_bottom 부터 쌓음
+    widths, heights = np.atleast_2d(widths).astype(float), np.atleast_2d(heights).astype(float)
+    x_center, y_bottom, scale = (np.broadcast_to(np.asarray(v, dtype=float), widths.shape[:1])[:, None] for v in (x_center, y_bottom, scale))
+
+    tops = y_bottom + scale * np.cumsum(heights, axis=-1)
+    bottoms = tops - scale * heights
+    half = 0.5 * scale * widths
+    left, right = x_center - half, x_center + half
+
+    corners = np.stack((
+        np.stack((left, bottoms), axis=-1),
+        np.stack((right, bottoms), axis=-1),
+        np.stack((right, tops), axis=-1),
+        np.stack((left, tops), axis=-1),
+    ), axis=-2)
+    return corners[(widths > 0.0) & (heights > 0.0)]
+
+
+def sheet_layout(widths:np.ndarray, heights:np.ndarray, columns:int=10, margin:float=0.1) -> Dict[str, np.ndarray]:
+    # unit cells in rows of `columns`, row 0 on top; each section is scaled to fit its cell
+    # 한 줄에 columns 개인 단위 칸, 0 번 줄이 맨 위; 각 단면은 칸에 맞게 축소
+    widths, heights = np.atleast_2d(widths), np.atleast_2d(heights)
+    n = widths.shape[0]
+    depth = heights.sum(axis=-1)
+    width = widths.max(axis=-1, initial=0.0)
+    row, column = np.divmod(np.arange(n), columns)
+
+    scale = (1.0 - 2.0 * margin) / np.maximum(np.maximum(depth, width), np.finfo(float).tiny)
+    return {
+        'x_center': column + 0.5,
+        'y_bottom': -(row + 1.0) + 0.5 * (1.0 - scale * depth),
+        'scale': scale,
+        'half_width': 0.5 * scale * width,
+        'rows': int(row.max(initial=-1)) + 1,
+        'columns': int(min(columns, max(n, 1))),
+    }
+
+
+def draw_sheet(ax, widths:np.ndarray, heights:np.ndarray, columns:int=10, labels:List[str]=None) -> Dict[str, object]:
+    # adds the collections of a contact sheet to ax and returns them
+    # contact sheet 의 collection 들을 ax 에 추가하고 반환
+    from matplotlib.collections import LineCollection, PolyCollection
+
+    widths, heights = np.atleast_2d(widths).astype(float), np.atleast_2d(heights).astype(float)
+    layout = sheet_layout(widths, heights, columns)
+    table = cut_table(widths, heights)
+    y_p = plastic_neutral_axis(table)['y_p']
+
+    layers = PolyCollection(
+        layer_polygons(widths, heights, layout['x_center'], layout['y_bottom'], layout['scale']),
+        facecolors='blue', edgecolors='none', alpha=0.5)
+
+    def axis_lines(y:np.ndarray) -> np.ndarray:
+        # (N, 2, 2) segments a little wider than each section
+        # 각 단면보다 조금 넓은 (N, 2, 2) 선분
+        y = layout['y_bottom'] + layout['scale'] * y
+        reach = 1.1 * layout['half_width']
+        start = np.stack((layout['x_center'] - reach, y), axis=-1)
+        end = np.stack((layout['x_center'] + reach, y), axis=-1)
+        return np.stack((start, end), axis=-2)
+
+    centroid = LineCollection(axis_lines(table['centroid_y']), colors='red', linestyles='--', linewidths=0.8)
+    plastic = LineCollection(axis_lines(y_p), colors='green', linestyles='-.', linewidths=0.8)
+    for collection in (layers, centroid, plastic):
+        ax.add_collection(collection)
+
+    if labels is not None:
+        for x, y, label in zip(layout['x_center'], layout['y_bottom'], labels):
+            ax.text(x, y - 0.02, label, ha='center', va='top', fontsize=6)
+
+    ax.set_xlim(0.0, layout['columns'])
+    ax.set_ylim(-max(layout['rows'], 1), 0.0)
+    ax.set_aspect('equal')
+    ax.set_axis_off()
+    return {'layers': layers, 'centroid': centroid, 'plastic_axis': plastic, 'layout': layout}
+
+
+def render_page(path:str, widths:np.ndarray, heights:np.ndarray, columns:int=10, dpi:int=100, cell_inch:float=1.0, labels:List[str]=None) -> str:
+    # one PNG on an Agg canvas; pyplot and its figure manager are not involved
+    # Agg canvas 에 PNG 한 장; pyplot 과 figure 관리자를 사용하지 않음
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    layout = sheet_layout(widths, heights, columns)
+    figure = Figure(figsize=(cell_inch * layout['columns'], cell_inch * max(layout['rows'], 1)), dpi=dpi)
+    FigureCanvasAgg(figure)
+    ax = figure.add_axes((0.0, 0.0, 1.0, 1.0))
+    draw_sheet(ax, widths, heights, columns, labels)
+    figure.savefig(path, dpi=dpi)
+    return str(path)
+
+
+def render_sheets(widths:np.ndarray, heights:np.ndarray, folder:str, per_page:int=100, columns:int=10, workers:int=None, dpi:int=100, prefix:str='sheet', labels:bool=True) -> List[str]:
+    # pages of per_page sections in folder/<prefix>_0000.png, ..., drawn by `workers` processes
+    # per_page 개씩 folder/<prefix>_0000.png, ... 에 그리며 workers 개의 process 를 사용
+    widths, heights = np.atleast_2d(widths).astype(float), np.atleast_2d(heights).astype(float)
+    folder = Path(folder)
+    folder.mkdir(parents=True, exist_ok=True)
+
+    pages = []
+    for number, start in enumerate(range(0, widths.shape[0], per_page)):
+        stop = min(start + per_page, widths.shape[0])
+        names = [str(i) for i in range(start, stop)] if labels else None
+        pages.append((
+            str(folder / f'{prefix}_{number:04d}.png'), widths[start:stop], heights[start:stop], columns, dpi, 1.0, names,
+        ))
+
+    workers = min(workers or cpu_count() or 1, len(pages))
+    if workers <= 1:
+        return [render_page(*page) for page in pages]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # map keeps the page order
+        # map 은 쪽 순서를 유지
+        return list(pool.map(_render_page, pages))
+
+
+def render_sheets_batch(sections:np.ndarray, folder:str, **kwargs) -> List[str]:
+    # render_sheets() for (N, 6) rows of (w0, h0, w1, h1, w2, h2)
+    # (w0, h0, w1, h1, w2, h2) 의 (N, 6) 행에 대한 render_sheets()
+    widths, heights = _three_layer_stacks(sections)
+    return render_sheets(widths, heights, folder, **kwargs)
+
+
+def _three_layer_stacks(sections:np.ndarray) -> Tuple[np.ndarray]:
+    w0, h0, w1, h1, w2, h2 = section_columns(sections)
+    return np.stack((w0, w1, w2), axis=-1), np.stack((h0, h1, h2), axis=-1)
+
+
+def _render_page(page:tuple) -> str:
+    return render_page(*page)
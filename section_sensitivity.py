@@ -0,0 +1,87 @@
+import numpy as np
+
+
+from typing import Dict
+
+
+from exercise import layered_section_properties, section_columns
+
+
+# Closed form derivatives of A, ȳ, I and σ_max with respect to the layer dimensions
+# 층 치수에 대한 A, ȳ, I, σ_max 의 해석적 미분
+#   u_i = y_i - ȳ and Σ a_i u_i = 0, so the dȳ term drops out of dI :
+#   u_i = y_i - ȳ 이고 Σ a_i u_i = 0 이므로 dI 에서 dȳ 항이 없어짐 :
+#   dI = Σ d(w_i h_i³ / 12) + u_i² da_i + 2 a_i u_i dy_i
+
+
+def layered_jacobian(widths:np.ndarray, heights:np.ndarray, M:np.ndarray=1.0) -> Dict[str, np.ndarray]:
+    # each value has shape (..., L, 2) : [..., 0] = ∂/∂width, [..., 1] = ∂/∂height of each layer
+    # 각 값의 모양은 (..., L, 2) : [..., 0] = 각 층 폭에 대한 미분, [..., 1] = 높이에 대한 미분
+    props = layered_section_properties(widths, heights)
+    w = props['layer_width']
+    h = props['layer_height']
+    a = props['layer_area']
+    area_m2 = props['area'][..., None]
+    y_m = props['centroid_y'][..., None]
+    I_m4 = props['moment_of_inertia'][..., None]
+    u = props['layer_centroid'] - y_m
+
+    # raising layer k lifts every layer above it : sums over i > k
+    # k 층이 높아지면 그 위의 모든 층이 올라감 : i > k 에 대한 합
+    a_above = _sum_above(a)
+    au_above = _sum_above(a * u)
+
+    dA = np.stack((h, w), axis=-1)
+    dQ = np.stack((h * props['layer_centroid'], w * props['layer_centroid'] + 0.5 * a + a_above), axis=-1)
+    dy = (dQ - y_m[..., None] * dA) / area_m2[..., None]
+    dI = np.stack((
+        h ** 3 / 12.0 + u * u * h,
+        0.25 * w * h * h + u * u * w + a * u + 2.0 * au_above,
+    ), axis=-1)
+
+    # extreme fibers : c_bottom = ȳ, c_top = H - ȳ with ∂H/∂h_k = 1
+    # 최외곽 : c_bottom = ȳ, c_top = H - ȳ, ∂H/∂h_k = 1
+    dH = np.zeros_like(dA)
+    dH[..., 1] = 1.0
+
+    M_abs = np.abs(np.asarray(M, dtype=float))[..., None, None]
+    c_bottom = props['c_bottom'][..., None, None]
+    c_top = props['c_top'][..., None, None]
+    I4 = I_m4[..., None]
+
+    d_sigma_bottom = M_abs * (dy / I4 - c_bottom * dI / (I4 * I4))
+    d_sigma_top = M_abs * ((dH - dy) / I4 - c_top * dI / (I4 * I4))
+
+    # σ_max = max(σ_top, σ_bottom) is not differentiable where both fibers govern;
+    # there the top fiber derivative is returned and 'kink' is set
+    # 양쪽 최외곽 응력이 같은 곳에서 σ_max 는 미분 불가능; 그 곳에서는 상단 미분을 반환하고 'kink' 를 표시
+    top_governs = props['c_top'] >= props['c_bottom']
+    kink = np.isclose(props['c_top'], props['c_bottom'], rtol=1e-12, atol=0.0)
+
+    return {
+        'area': dA,
+        'centroid_y': dy,
+        'moment_of_inertia': dI,
+        'bending_stress': np.where(top_governs[..., None, None], d_sigma_top, d_sigma_bottom),
+        'bending_stress_top': d_sigma_top,
+        'bending_stress_bottom': d_sigma_bottom,
+        'top_governs': top_governs,
+        'kink': kink,
+    }
+
+
+def section_jacobian_batch(sections:np.ndarray, M:np.ndarray=1.0) -> Dict[str, np.ndarray]:
+    # (N, 6) Jacobians in the (w0, h0, w1, h1, w2, h2) order of exercise.py
+    # exercise.py 의 (w0, h0, w1, h1, w2, h2) 순서로 정리한 (N, 6) Jacobian
+    w0, h0, w1, h1, w2, h2 = section_columns(sections)
+    result = layered_jacobian(np.stack((w0, w1, w2), axis=-1), np.stack((h0, h1, h2), axis=-1), M)
+    return {
+        key: (value.reshape(value.shape[:-2] + (6,)) if value.ndim >= 3 else value)
+        for key, value in result.items()
+    }
+
+
+def _sum_above(values:np.ndarray) -> np.ndarray:
+    # Σ_{i > k} values_i for every k along the last axis
+    total = values.sum(axis=-1, keepdims=True)
+    return total - np.cumsum(values, axis=-1)
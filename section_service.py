@@ -0,0 +1,281 @@
+import numpy as np
+
+
+from argparse import ArgumentParser
+from asyncio import Future, IncompleteReadError, get_running_loop, run, start_server
+from json import dumps, loads
+from time import perf_counter
+from typing import Dict, Sequence
+
+
+from exercise import area, area_above_below_equal, area_moment_above_below_equal, bending_stress, centroid_y, moment_of_inertia
+
+
+# Local HTTP/JSON service of the six exercise.py functions with micro batching
+# exercise.py 의 여섯 함수를 제공하는 지역 HTTP/JSON 서비스, 작은 묶음으로 모아서 계산
+#   POST /area, /centroid_y, /area_above_below_equal, /area_moment_above_below_equal,
+#        /moment_of_inertia, /bending_stress
+#     body : {"w0": .., "h0": .., "w1": .., "h1": .., "w2": .., "h2": ..} (plus "M" for bending_stress)
+#            or {"args": [..]} in the order of the function arguments
+#     reply : {"result": ..}, null for a nan or infinite result of a degenerate section,
+#             or {"error": ..} with status 400 / 404, and 500 when the function raised
+#   GET /metrics : requests, batches, throughput and latency
+#
+#   Requests for the same function that arrive within window_s of the first one are evaluated as one
+#   numpy batch; a batch is evaluated at once when it reaches max_batch items.
+#   같은 함수에 대한 요청 중 첫 요청 후 window_s 이내에 도착한 것은 한 numpy 묶음으로 계산;
+#   묶음이 max_batch 개가 되면 바로 계산.
+#
+# Command line 명령행 :
+#   python -c "import section_service; section_service.main()" --port 8000 --window-ms 1 --max-batch 4096
+
+
+def service_functions() -> Dict[str, tuple]:
+    dims = ('w0', 'h0', 'w1', 'h1', 'w2', 'h2')
+    return {
+        'area': dims,
+        'centroid_y': dims,
+        'area_above_below_equal': dims,
+        'area_moment_above_below_equal': dims,
+        'moment_of_inertia': dims,
+        'bending_stress': ('M',) + dims,
+    }
+
+
+def service_state(window_s:float=1e-3, max_batch:int=4096, latency_samples:int=65536) -> Dict[str, object]:
+    if window_s < 0.0:
+        raise ValueError(f"window_s must not be negative, got {window_s}")
+    if max_batch < 1:
+        raise ValueError(f"max_batch must be positive, got {max_batch}")
+    return {
+        'window_s': float(window_s),
+        'max_batch': int(max_batch),
+        'pending': {name: [] for name in service_functions()},
+        'timers': {},
+        'started': perf_counter(),
+        'requests': 0,
+        'batches': 0,
+        'largest_batch': 0,
+        'compute_s': 0.0,
+        # ring buffer of the latest latencies
+        # 최근 지연 시간의 원형 버퍼
+        'latency_s': np.full(int(latency_samples), np.nan),
+    }
+
+
+def service_submit(state:Dict[str, object], name:str, args:Sequence[float]) -> Future:
+    # queues one call inside the running event loop; await the returned future for the result
+    # 실행 중인 event loop 안에서 호출 하나를 대기열에 넣음; 결과는 반환된 future 를 await
+    if name not in service_functions():
+        raise KeyError(name)
+    arity = len(service_functions()[name])
+    if len(args) != arity:
+        raise ValueError(f"{name} takes {arity} arguments, got {len(args)}")
+
+    loop = get_running_loop()
+    future = loop.create_future()
+    pending = state['pending'][name]
+    pending.append(([float(a) for a in args], future, perf_counter()))
+
+    if len(pending) >= state['max_batch']:
+        _flush(state, name)
+    elif name not in state['timers']:
+        state['timers'][name] = loop.call_later(state['window_s'], _flush, state, name)
+    return future
+
+
+def service_metrics(state:Dict[str, object]) -> Dict[str, float]:
+    latency = state['latency_s'][~np.isnan(state['latency_s'])]
+    # None rather than nan before the first batch, so that the reply stays valid JSON
+    # 첫 묶음 전에는 JSON 에 맞도록 nan 대신 None
+    p50, p99, worst = (None,) * 3
+    if latency.size:
+        p50, p99, worst = (float(v) * 1e3 for v in np.percentile(latency, (50.0, 99.0, 100.0)))
+    elapsed = perf_counter() - state['started']
+    return {
+        'requests': state['requests'],
+        'batches': state['batches'],
+        'mean_batch': state['requests'] / max(state['batches'], 1),
+        'largest_batch': state['largest_batch'],
+        'throughput_per_s': state['requests'] / elapsed,
+        'compute_s': state['compute_s'],
+        'latency_p50_ms': p50,
+        'latency_p99_ms': p99,
+        'latency_max_ms': worst,
+    }
+
+
+def serve(state:Dict[str, object], host:str='127.0.0.1', port:int=0):
+    # coroutine returning the started asyncio server; port=0 picks a free port, see state['port']
+    # 시작한 asyncio 서버를 반환하는 coroutine; port=0 이면 빈 port 를 고르며 state['port'] 참고
+    async def read_request(reader):
+        # (method, path, body, keep alive) of one HTTP/1.1 request; None at the end of the connection
+        # ValueError for a malformed request line or Content-Length, IncompleteReadError for a short body
+        # HTTP/1.1 요청 하나의 (method, path, body, keep alive); 연결이 끝나면 None
+        # 요청 줄이나 Content-Length 가 잘못되면 ValueError, 본문이 짧으면 IncompleteReadError
+        line = await reader.readline()
+        if not line.strip():
+            return None
+        method, path, version = line.decode('latin-1').split()
+
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            key, _, value = line.decode('latin-1').partition(':')
+            headers[key.strip().lower()] = value.strip()
+
+        body = await reader.readexactly(int(headers.get('content-length', 0)))
+        keep_alive = 'close' != headers.get('connection', 'keep-alive' if 'HTTP/1.1' == version else 'close').lower()
+        return method, path, body, keep_alive
+
+    async def handle(reader, writer):
+        try:
+            while True:
+                try:
+                    request = await read_request(reader)
+                except (ValueError, IncompleteReadError) as e:
+                    # the rest of the stream cannot be trusted : answer and close
+                    # 나머지 stream 을 믿을 수 없으므로 응답하고 연결을 닫음
+                    writer.write(_response(400, {'error': f"malformed request: {e!r}"}, False))
+                    await writer.drain()
+                    break
+                if request is None:
+                    break
+                method, path, body, keep_alive = request
+                status, reply = _route(state, method, path, body)
+                if isinstance(reply, Future):
+                    try:
+                        reply = {'result': await reply}
+                    except Exception as e:
+                        status, reply = 500, {'error': f"{path.strip('/')} failed: {e!r}"}
+                writer.write(_response(status, reply, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def start():
+        server = await start_server(handle, host, port)
+        state['port'] = server.sockets[0].getsockname()[1]
+        return server
+
+    return start()
+
+
+def main(argv:Sequence[str]=None):
+    parser = ArgumentParser(description='Serve the exercise.py functions over local HTTP/JSON')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--window-ms', type=float, default=1.0)
+    parser.add_argument('--max-batch', type=int, default=4096)
+    args = parser.parse_args(argv)
+
+    state = service_state(args.window_ms * 1e-3, args.max_batch)
+
+    async def forever():
+        server = await serve(state, args.host, args.port)
+        print(f"serving on http://{args.host}:{state['port']}")
+        async with server:
+            await server.serve_forever()
+
+    run(forever())
+
+
+def _flush(state:Dict[str, object], name:str):
+    timer = state['timers'].pop(name, None)
+    if timer is not None:
+        timer.cancel()
+    items, state['pending'][name] = state['pending'][name], []
+    if not items:
+        return
+
+    start = perf_counter()
+    columns = np.array([args for args, _, _ in items]).T
+    try:
+        function = {
+            'area': area,
+            'centroid_y': centroid_y,
+            'area_above_below_equal': area_above_below_equal,
+            'area_moment_above_below_equal': area_moment_above_below_equal,
+            'moment_of_inertia': moment_of_inertia,
+            'bending_stress': bending_stress,
+        }[name]
+        # a degenerate section gives nan, sent as null
+        # 퇴화된 단면은 nan 이며 null 로 보냄
+        with np.errstate(divide='ignore', invalid='ignore'):
+            result = function(*columns)
+    except Exception:
+        result = None
+    finish = perf_counter()
+
+    for i, (args, future, _) in enumerate(items):
+        if future.done():
+            continue
+        if result is None:
+            # the batch raised : each item on its own, so that one bad item fails alone
+            # 묶음 계산이 실패 : 항목마다 따로 계산하여 잘못된 항목만 실패
+            try:
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    future.set_result(_item(function(*np.array(args)[:, None]), 0))
+            except Exception as e:
+                future.set_exception(e)
+        else:
+            future.set_result(_item(result, i))
+
+    n = len(items)
+    ring = state['latency_s']
+    ring[(state['requests'] + np.arange(n)) % ring.size] = finish - np.array([s for _, _, s in items])
+    state['requests'] += n
+    state['batches'] += 1
+    state['largest_batch'] = max(state['largest_batch'], n)
+    state['compute_s'] += finish - start
+
+
+def _item(result, i:int):
+    if isinstance(result, dict):
+        return {key: _item(value, i) for key, value in result.items()}
+    value = np.asarray(result)[i].item()
+    # JSON has no nan or infinity
+    # JSON 에는 nan 과 무한대가 없음
+    if isinstance(value, float) and not np.isfinite(value):
+        return None
+    return value
+
+
+def _route(state:Dict[str, object], method:str, path:str, body:bytes) -> tuple:
+    # (status, reply); the reply of a function call is a future to await
+    # (status, 응답); 함수 호출의 응답은 await 할 future
+    name = path.strip('/')
+    if 'GET' == method and 'metrics' == name:
+        return 200, service_metrics(state)
+    if name not in service_functions():
+        return 404, {'error': f"unknown path {path!r}"}
+    if 'POST' != method:
+        return 405, {'error': f"use POST for {path!r}"}
+
+    try:
+        payload = loads(body or b'{}')
+        if 'args' in payload:
+            args = payload['args']
+        else:
+            args = [payload[key] for key in service_functions()[name]]
+        future = service_submit(state, name, args)
+    except (KeyError, TypeError, ValueError) as e:
+        return 400, {'error': f"bad request for {name}: {e!r}"}
+    return 200, future
+
+
+def _response(status:int, reply:Dict[str, object], keep_alive:bool) -> bytes:
+    body = dumps(reply).encode()
+    reason = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed', 500: 'Internal Server Error'}[status]
+    return (
+        f"HTTP/1.1 {status} {reason}\r\n"
+        f"Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+    ).encode() + body
@@ -0,0 +1,260 @@
+import numpy as np
+
+
+from json import dumps, loads
+from pathlib import Path
+from typing import Dict, Tuple
+
+
+from exercise import section_columns, section_properties
+
+
+# Persistent store of section properties on disk, keyed by quantized dimensions
+# 양자화한 치수를 key 로 하는 디스크의 단면 특성 저장소
+#   root/segment_000001.keys.npy   : (n, 6) int64 keys
+#   root/segment_000001.values.npy : (n, len(store_columns())) float64 values, memory mapped when read
+#   root/store.json                : key scheme, quantum_m and columns, checked by open_store()
+#   Segments are only ever appended; store_compact() merges them and store_evict() drops the oldest.
+#   Segment 는 추가만 하며 store_compact() 로 합치고 store_evict() 로 오래된 것부터 지움.
+#
+#   key   : round(d / quantum_m) of the six dimensions, or their float64 bits when quantum_m is 0
+#   index : 64 bit FNV-1a hash of each key, sorted, with the segment and row of the entry;
+#           a batch lookup is one searchsorted. A hash collision is reported as a miss.
+#   key   : 여섯 치수의 round(d / quantum_m), quantum_m 이 0 이면 float64 의 bit
+#   index : key 마다 64 bit FNV-1a hash 를 정렬하여 segment 와 행 번호와 함께 저장;
+#           일괄 조회는 searchsorted 한번. hash 충돌은 miss 로 처리.
+
+
+def store_columns() -> Tuple[str]:
+    return ('area', 'centroid_y', 'moment_of_inertia', 'S_top', 'S_bottom', 'c_max')
+
+
+def open_store(root:str, quantum_m:float=0.0, max_bytes:int=None) -> Dict[str, object]:
+    # max_bytes : after each append the oldest segments are evicted down to this size
+    # max_bytes : 추가할 때마다 오래된 segment 부터 지워 이 크기 이하로 유지
+    if quantum_m < 0.0:
+        raise ValueError(f"quantum_m must not be negative, got {quantum_m}")
+    root = Path(root)
+    root.mkdir(parents=True, exist_ok=True)
+    _check_metadata(root, float(quantum_m))
+
+    store = {
+        'root': root,
+        'quantum_m': float(quantum_m),
+        'max_bytes': max_bytes,
+        'segments': sorted(int(p.name.split('_')[1].split('.')[0]) for p in root.glob('segment_*.keys.npy')),
+        'values': {},
+        'hits': 0,
+        'misses': 0,
+    }
+    _rebuild_index(store)
+    return store
+
+
+def store_keys(quantum_m:float, sections:np.ndarray) -> np.ndarray:
+    dims = np.stack(section_columns(sections), axis=-1)
+    if quantum_m > 0.0:
+        return np.rint(dims / quantum_m).astype(np.int64)
+    # + 0.0 turns -0.0 into 0.0
+    # + 0.0 으로 -0.0 을 0.0 으로 바꿈
+    return np.ascontiguousarray(dims + 0.0).view(np.int64)
+
+
+def store_lookup(store:Dict[str, object], sections:np.ndarray) -> Tuple[np.ndarray]:
+    # (N, len(store_columns())) values, nan on the misses, and the (N,) hit mask
+    # (N, len(store_columns())) 값, miss 인 행은 nan, 그리고 (N,) hit 여부
+    return _lookup(store, store_keys(store['quantum_m'], sections))
+
+
+def store_evaluate(store:Dict[str, object], sections:np.ndarray) -> Dict[str, np.ndarray]:
+    # looks up the whole batch, computes the distinct misses only and appends them
+    # 전체를 조회한 뒤 서로 다른 miss 만 계산하여 추가
+    columns = section_columns(sections)
+    keys = store_keys(store['quantum_m'], columns)
+    values, found = _lookup(store, keys)
+
+    missing = np.flatnonzero(~found)
+    if missing.size:
+        _, first, inverse = np.unique(keys[missing], axis=0, return_index=True, return_inverse=True)
+        rows = missing[first]
+        props = section_properties(*(c[rows] for c in columns))
+        new_values = np.stack([props[name] for name in store_columns()], axis=-1)
+        values[missing] = new_values[inverse.ravel()]
+        store_append(store, keys[rows], new_values)
+
+    store['hits'] += int(found.sum())
+    store['misses'] += int(missing.size)
+    return {name: values[:, i] for i, name in enumerate(store_columns())}
+
+
+def store_append(store:Dict[str, object], keys:np.ndarray, values:np.ndarray):
+    # writes one new segment; keys are expected not to be in the store yet
+    # segment 하나를 새로 기록; key 는 아직 저장소에 없는 것이어야 함
+    number = (store['segments'][-1] + 1) if store['segments'] else 1
+    _write_segment(store, number, keys, values)
+    store['segments'].append(number)
+    _insert_index(store, number, keys)
+
+    if store['max_bytes'] is not None:
+        store_evict(store, store['max_bytes'])
+
+
+def store_compact(store:Dict[str, object]):
+    # merges every segment into one, keeping the newest entry of a repeated key
+    # 모든 segment 를 하나로 합치고 반복된 key 는 가장 최근 것만 남김
+    if len(store['segments']) < 2:
+        return
+    keys = np.concatenate([np.load(_segment_path(store, n, 'keys')) for n in store['segments']])
+    values = np.concatenate([np.asarray(_segment_values(store, n)) for n in store['segments']])
+
+    # newest first so that np.unique keeps the latest copy
+    # np.unique 가 최근 것을 남기도록 최근 것부터
+    _, first = np.unique(keys[::-1], axis=0, return_index=True)
+    keep = np.sort(keys.shape[0] - 1 - first)
+
+    old = list(store['segments'])
+    number = old[-1] + 1
+    _write_segment(store, number, keys[keep], values[keep])
+    store['segments'] = [number]
+    _remove_segments(store, old)
+    _rebuild_index(store)
+
+
+def store_evict(store:Dict[str, object], max_bytes:int):
+    # drops the oldest segments until the store takes at most max_bytes; the newest segment always stays
+    # 저장소가 max_bytes 이하가 될 때까지 오래된 segment 부터 지움; 가장 최근 segment 는 남김
+    sizes = [_segment_bytes(store, n) for n in store['segments']]
+    total, drop = sum(sizes), []
+    for number, size in zip(store['segments'][:-1], sizes[:-1]):
+        if total <= max_bytes:
+            break
+        drop.append(number)
+        total -= size
+
+    if drop:
+        store['segments'] = [n for n in store['segments'] if n not in drop]
+        _remove_segments(store, drop)
+        _rebuild_index(store)
+
+
+def store_info(store:Dict[str, object]) -> Dict[str, int]:
+    return {
+        'hits': store['hits'],
+        'misses': store['misses'],
+        'entries': int(store['hash'].size),
+        'segments': len(store['segments']),
+        'bytes': sum(_segment_bytes(store, n) for n in store['segments']),
+    }
+
+
+def store_metadata(quantum_m:float) -> Dict[str, object]:
+    return {
+        'key_scheme': 'quantized' if quantum_m > 0.0 else 'float64_bits',
+        'quantum_m': float(quantum_m),
+        'columns': list(store_columns()),
+    }
+
+
+def _check_metadata(root:Path, quantum_m:float):
+    # keys of another quantum or scheme would find other sections' values : refuse to open them
+    # 다른 quantum 이나 방식의 key 는 다른 단면의 값을 찾게 되므로 열지 않음
+    path = root / 'store.json'
+    expected = store_metadata(quantum_m)
+    if path.exists():
+        found = loads(path.read_text())
+        if found != expected:
+            raise ValueError(f"store {root} was written with {found}, not {expected}")
+    elif any(root.glob('segment_*.keys.npy')):
+        raise ValueError(f"store {root} has segments but no store.json; its key scheme is unknown")
+    else:
+        temporary = path.with_name('tmp_' + path.name)
+        temporary.write_text(dumps(expected))
+        temporary.replace(path)
+
+
+def _lookup(store:Dict[str, object], keys:np.ndarray) -> Tuple[np.ndarray]:
+    values = np.full((keys.shape[0], len(store_columns())), np.nan)
+    found = np.zeros(keys.shape[0], dtype=bool)
+    if 0 == store['hash'].size:
+        return values, found
+
+    h = _hash(keys)
+    # sorted queries walk the index in order, which is several times faster than random ones
+    # 정렬한 조회는 index 를 순서대로 읽으므로 무작위 조회보다 몇 배 빠름
+    order = np.argsort(h)
+    pos = np.empty_like(order)
+    pos[order] = np.minimum(np.searchsorted(store['hash'], h[order]), store['hash'].size - 1)
+    found = (store['hash'][pos] == h) & (store['keys'][pos] == keys).all(axis=-1)
+
+    hit = np.flatnonzero(found)
+    segment, row = store['segment'][pos[hit]], store['row'][pos[hit]]
+    for number in np.unique(segment):
+        mine = segment == number
+        values[hit[mine]] = _segment_values(store, int(number))[row[mine]]
+    return values, found
+
+
+def _hash(keys:np.ndarray) -> np.ndarray:
+    # FNV-1a over the six 64 bit words of a key
+    # key 의 64 bit 값 여섯개에 대한 FNV-1a
+    h = np.full(keys.shape[0], 0xcbf29ce484222325, dtype=np.uint64)
+    prime = np.uint64(0x100000001b3)
+    for column in keys.view(np.uint64).T:
+        h = (h ^ column) * prime
+    return h
+
+
+def _insert_index(store:Dict[str, object], number:int, keys:np.ndarray):
+    h = _hash(keys)
+    order = np.argsort(h, kind='stable')
+    at = np.searchsorted(store['hash'], h[order], side='right')
+    store['hash'] = np.insert(store['hash'], at, h[order])
+    store['keys'] = np.insert(store['keys'], at, keys[order], axis=0)
+    store['segment'] = np.insert(store['segment'], at, number)
+    store['row'] = np.insert(store['row'], at, order)
+
+
+def _rebuild_index(store:Dict[str, object]):
+    store['values'] = {n: v for n, v in store['values'].items() if n in store['segments']}
+    keys = [np.load(_segment_path(store, n, 'keys')) for n in store['segments']]
+
+    store['keys'] = np.concatenate(keys) if keys else np.empty((0, 6), dtype=np.int64)
+    store['segment'] = np.repeat(np.asarray(store['segments'], dtype=np.int64), [k.shape[0] for k in keys])
+    store['row'] = np.concatenate([np.arange(k.shape[0]) for k in keys]) if keys else np.empty(0, dtype=np.int64)
+    store['hash'] = _hash(store['keys'])
+
+    order = np.argsort(store['hash'], kind='stable')
+    for name in ('hash', 'keys', 'segment', 'row'):
+        store[name] = store[name][order]
+
+
+def _segment_values(store:Dict[str, object], number:int) -> np.ndarray:
+    if number not in store['values']:
+        store['values'][number] = np.load(_segment_path(store, number, 'values'), mmap_mode='r')
+    return store['values'][number]
+
+
+def _write_segment(store:Dict[str, object], number:int, keys:np.ndarray, values:np.ndarray):
+    # write under a temporary name and rename, so that a reader never sees half a segment
+    # 임시 이름으로 쓴 뒤 이름을 바꾸어 절반만 쓴 segment 가 보이지 않게 함
+    for kind, array in (('values', values), ('keys', keys)):
+        final = _segment_path(store, number, kind)
+        temporary = final.with_name('tmp_' + final.name)
+        with open(temporary, 'wb') as f:
+            np.save(f, np.ascontiguousarray(array))
+        temporary.replace(final)
+
+
+def _remove_segments(store:Dict[str, object], numbers:list):
+    for number in numbers:
+        store['values'].pop(number, None)
+        for kind in ('keys', 'values'):
+            _segment_path(store, number, kind).unlink(missing_ok=True)
+
+
+def _segment_path(store:Dict[str, object], number:int, kind:str) -> Path:
+    return store['root'] / f'segment_{number:06d}.{kind}.npy'
+
+
+def _segment_bytes(store:Dict[str, object], number:int) -> int:
+    return sum(_segment_path(store, number, kind).stat().st_size for kind in ('keys', 'values'))
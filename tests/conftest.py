@@ -20,10 +20,20 @@ proj_folder = pathlib.Path(
 
 
 
+# modules next to exercise.py that are not the submission; they have their own tests
+# exercise.py 옆에 있지만 제출물이 아닌 모듈; 각자의 test 가 있음
+engine_modules = (
+    'beam.py', 'load_cases.py', 'monte_carlo.py', 'polygon_section.py',
+    'section_catalog.py', 'section_cuts.py', 'section_editor.py', 'section_integration.py',
+    'section_io.py', 'section_optimize.py', 'section_parallel.py', 'section_render.py',
+    'section_sensitivity.py', 'section_service.py', 'section_store.py',
+)
+
+
 def py_files() -> Tuple[pathlib.Path]:
     return tuple(
         filter(
-            lambda s:'sample.py' != s.name,
+            lambda s:s.name not in ('sample.py',) + engine_modules,
             proj_folder.glob('*.py')
         )
     )
@@ -0,0 +1,102 @@
+import numpy as np
+
+
+from typing import Dict, Tuple
+
+
+# Seeded reference oracle for the six exercise.py functions
+# exercise.py 의 여섯 함수에 대한 seed 고정 기준값 계산
+#   random_sections() draws reproducible batches around the conftest.py distributions plus edge cases,
+#   reference() evaluates every expected value for a whole batch in extended precision,
+#   worst_relative_error() finds the sample that is furthest off.
+#   random_sections() 는 conftest.py 의 분포와 경계 사례를 섞은 재현 가능한 묶음을 만들고,
+#   reference() 는 묶음 전체의 기대값을 확장 정밀도로 계산하며,
+#   worst_relative_error() 는 가장 크게 벗어난 표본을 찾음.
+
+
+def edge_cases() -> Tuple[str]:
+    return ('nominal', 'thin_web', 'equal_flanges', 'thin_flanges', 'deep_web', 'wide_web', 'centroid_in_flange')
+
+
+def random_sections(seed:int, n:int) -> Dict[str, np.ndarray]:
+    # (n, 6) rows of (w0, h0, w1, h1, w2, h2), (n,) moments and the (n,) edge case number of every row
+    # (w0, h0, w1, h1, w2, h2) 의 (n, 6) 행, (n,) 모멘트, 각 행의 (n,) 경계 사례 번호
+    rng = np.random.default_rng(seed)
+    mean = np.array((50e-3, 12e-3, 7.5e-3, 70e-3, 90e-3, 10e-3))
+    std = np.array((10e-3, 2.5e-3, 1.5e-3, 1.4e-3, 18e-3, 2e-3))
+    dims = np.abs(rng.normal(mean, std, size=(n, 6)))
+
+    case = rng.integers(len(edge_cases()), size=n)
+    w0, h0, w1, h1, w2, h2 = (dims[:, i] for i in range(6))
+
+    thin_web = 1 == case
+    w1[thin_web] = mean[2] * 10.0 ** rng.uniform(-3.0, -1.0, thin_web.sum())
+
+    equal = 2 == case
+    w2[equal], h2[equal] = w0[equal], h0[equal]
+
+    thin_flanges = 3 == case
+    h0[thin_flanges] *= 10.0 ** rng.uniform(-3.0, -1.0, thin_flanges.sum())
+    h2[thin_flanges] *= 10.0 ** rng.uniform(-3.0, -1.0, thin_flanges.sum())
+
+    deep = 4 == case
+    h1[deep] *= rng.uniform(5.0, 50.0, deep.sum())
+
+    wide = 5 == case
+    w1[wide] = np.maximum(w0[wide], w2[wide]) * rng.uniform(1.0, 3.0, wide.sum())
+
+    # heavy bottom flange and short web : the centroid sits in the bottom flange
+    # 무거운 아래 플랜지와 짧은 웹 : 도심이 아래 플랜지 안에 있음
+    in_flange = 6 == case
+    h0[in_flange] *= rng.uniform(5.0, 10.0, in_flange.sum())
+    h1[in_flange] *= rng.uniform(0.01, 0.1, in_flange.sum())
+
+    M = rng.normal(100.0, 10.0, n) * rng.choice((-1.0, 1.0), n)
+    return {'sections': np.stack((w0, h0, w1, h1, w2, h2), axis=-1), 'M': M, 'case': case}
+
+
+def reference(sections:np.ndarray, M:np.ndarray) -> Dict[str, np.ndarray]:
+    # rectangles summed one by one in long double, independent of exercise.py
+    # exercise.py 와 별도로 직사각형마다 long double 로 더함
+    d = np.asarray(sections, dtype=np.longdouble)
+    widths, heights = d[:, 0::2], d[:, 1::2]
+
+    tops = np.cumsum(heights, axis=-1)
+    bottoms = tops - heights
+    areas = widths * heights
+    area = areas.sum(axis=-1)
+    y = (areas * (bottoms + heights / 2)).sum(axis=-1) / area
+    I = (widths * heights ** 3 / 12 + areas * (bottoms + heights / 2 - y[:, None]) ** 2).sum(axis=-1)
+
+    # parts of each rectangle below and above the centroid, and their first moments about it
+    # 각 직사각형에서 도심 아래와 위 부분, 그리고 도심에 대한 1차 모멘트
+    t_below = np.clip(y[:, None] - bottoms, 0, heights)
+    t_above = heights - t_below
+    a_below = (widths * t_below).sum(axis=-1)
+    a_above = (widths * t_above).sum(axis=-1)
+    q_below = (widths * t_below * (y[:, None] - bottoms - t_below / 2)).sum(axis=-1)
+    q_above = (widths * t_above * (tops - t_above / 2 - y[:, None])).sum(axis=-1)
+
+    c = np.maximum(y, tops[:, -1] - y)
+    return {
+        name: np.asarray(value, dtype=float) for name, value in {
+            'area': area,
+            'centroid_y': y,
+            'moment_of_inertia': I,
+            'bending_stress': np.abs(np.asarray(M, dtype=np.longdouble)) * c / I,
+            'a_above': a_above,
+            'a_below': a_below,
+            'a_moment_above': q_above,
+            'a_moment_below': q_below,
+        }.items()
+    }
+
+
+def worst_relative_error(result:np.ndarray, expected:np.ndarray, scale:np.ndarray=None) -> Tuple[float, int]:
+    # largest |result - expected| / |scale| and where it is; scale defaults to expected
+    # 가장 큰 |result - expected| / |scale| 과 그 위치; scale 의 기본값은 expected
+    scale = np.abs(expected if scale is None else scale)
+    error = np.abs(np.asarray(result, dtype=float) - expected) / scale
+    error = np.where(np.isnan(error), np.inf, error)
+    i = int(np.argmax(error))
+    return float(error[i]), i
@@ -0,0 +1,171 @@
+import ast
+import hashlib
+import json
+import os
+import pathlib
+
+from typing import Dict, List
+
+
+# One pass per file for the syntax, import and top level checks, cached by content hash
+# 파일마다 한번에 문법, import, 최상위 코드를 검사하고 내용의 hash 로 결과를 저장
+#   analyze(py_file) reads and parses a file once and returns every finding;
+#   an unchanged file (same size and mtime) is answered from the cache after one stat call.
+#   The cache lives in STATIC_ANALYSIS_CACHE, by default in the cache folder of the user
+#   ($XDG_CACHE_HOME or ~/.cache)/section-static-analysis, never in a folder shared with other users;
+#   STATIC_ANALYSIS_CACHE= (empty) keeps the results in memory only.
+#   analyze(py_file) 는 파일을 한번 읽고 한번 parse 하여 모든 결과를 반환;
+#   바뀌지 않은 파일 (크기와 mtime 이 같음) 은 stat 한번 후 cache 에서 답함.
+#   cache 위치는 STATIC_ANALYSIS_CACHE, 기본값은 사용자의 cache 폴더
+#   ($XDG_CACHE_HOME 또는 ~/.cache)/section-static-analysis 이며 다른 사용자와 공유하는 폴더는 쓰지 않음;
+#   STATIC_ANALYSIS_CACHE= (빈 값) 이면 메모리에만 저장.
+
+
+# bump when the rules change so that old cache entries are not reused
+# 규칙이 바뀌면 올려서 이전 cache 를 쓰지 않게 함
+RULES_VERSION = 3
+ALLOWED_IMPORTS = ('math', 'numpy', 'scipy', 'matplotlib')
+
+# per process : results by path, and the on disk index once it has been read
+# process 마다 : 경로별 결과, 그리고 한번 읽은 디스크의 색인
+_memory = {}
+_index = {'entries': None}
+
+
+def cache_folder() -> pathlib.Path:
+    # None : no disk cache
+    # None : 디스크 cache 없음
+    folder = os.getenv('STATIC_ANALYSIS_CACHE')
+    if folder is None:
+        return pathlib.Path(os.getenv('XDG_CACHE_HOME') or pathlib.Path.home() / '.cache') / 'section-static-analysis'
+    return pathlib.Path(folder) if folder else None
+
+
+def analyze(py_file:pathlib.Path) -> Dict[str, object]:
+    py_file = pathlib.Path(py_file).absolute()
+    stat = py_file.stat()
+    signature = [stat.st_mtime_ns, stat.st_size, RULES_VERSION]
+
+    cached = _memory.get(str(py_file))
+    if cached is not None and cached[0] == signature:
+        findings = cached[1]
+    elif cache_folder() is None:
+        findings = analyze_code(py_file.read_bytes().decode('utf-8'))
+    else:
+        findings = _disk_cached(py_file, signature, cache_folder())
+
+    _memory[str(py_file)] = (signature, findings)
+    return findings
+
+
+def analyze_code(code:str) -> Dict[str, object]:
+    findings = {
+        'syntax_error': None,
+        'imports': [],
+        'import_findings': [],
+        'top_level_findings': line_findings(code),
+    }
+
+    try:
+        tree = ast.parse(code)
+    except SyntaxError as e:
+        findings['syntax_error'] = str(e)
+        return findings
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                findings['imports'].append(alias.name)
+                if not any(alias.name.startswith(m) for m in ALLOWED_IMPORTS):
+                    findings['import_findings'].append(f"line {node.lineno} : tried to import {alias.name}")
+        elif isinstance(node, ast.ImportFrom):
+            findings['imports'].append(node.module or '.')
+            if 'numpy' == node.module:
+                findings['import_findings'].append(f"line {node.lineno} : from numpy import")
+
+    # statements the line rule cannot see, such as decorators, one line function bodies
+    # or "import math; x = 1"
+    # decorator, 한 줄 함수 본문, "import math; x = 1" 처럼 줄 단위 규칙이 놓치는 문장
+    reported = {f['line'] for f in findings['top_level_findings']}
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef):
+            if node.decorator_list:
+                line = node.decorator_list[0].lineno
+                finding = {'line': line, 'text': 'decorator at the top level'}
+            elif node.body[0].lineno == node.lineno:
+                finding = {'line': node.lineno, 'text': 'function body on the def line'}
+            else:
+                continue
+        elif isinstance(node, (ast.Import, ast.ImportFrom)):
+            continue
+        elif isinstance(node, ast.Expr) and isinstance(node.value, ast.Constant) and isinstance(node.value.value, str):
+            continue
+        else:
+            finding = {'line': node.lineno, 'text': f'{type(node).__name__} at the top level'}
+        if finding['line'] not in reported:
+            findings['top_level_findings'].append(finding)
+            reported.add(finding['line'])
+
+    findings['top_level_findings'].sort(key=lambda f: f['line'])
+    return findings
+
+
+def line_findings(code:str) -> List[Dict[str, object]]:
+    # the original line rule of test_style.py : comments, docstring starts, one line def signatures, imports
+    # test_style.py 의 원래 줄 단위 규칙 : 주석, docstring 시작, 한 줄 def, import
+    findings = []
+    for number, line in enumerate(code.splitlines(keepends=True), start=1):
+        line_strip = line.strip()
+        if line.startswith('#') or line.startswith('"""') or line.startswith("'''"):
+            continue
+        elif line.startswith('def ') and line_strip.endswith(':'):
+            continue
+        elif line.startswith('import ') or (line.startswith('from ') and ' import ' in line):
+            continue
+        elif line.startswith(' ') or line_strip == '':
+            continue
+        findings.append({'line': number, 'text': line.rstrip('\n')})
+    return findings
+
+
+def _disk_cached(py_file:pathlib.Path, signature:list, folder:pathlib.Path) -> Dict[str, object]:
+    # the index of path -> (mtime, size, rules, hash) is read once per process
+    # 경로 -> (mtime, 크기, 규칙, hash) 색인은 process 마다 한번 읽음
+    if _index['entries'] is None:
+        _index['entries'] = _read_json(folder / 'index.json') or {}
+    entry = _index['entries'].get(str(py_file))
+    if entry is not None and entry[:3] == signature:
+        findings = _read_json(folder / f'{entry[3]}.json')
+        if findings is not None:
+            return findings
+
+    code = py_file.read_bytes()
+    digest = hashlib.sha256(code + f'rules {RULES_VERSION}'.encode()).hexdigest()
+    findings = _read_json(folder / f'{digest}.json')
+    if findings is None:
+        findings = analyze_code(code.decode('utf-8'))
+        _write_json(folder / f'{digest}.json', findings)
+    _index['entries'][str(py_file)] = signature + [digest]
+    _write_json(folder / 'index.json', _index['entries'])
+    return findings
+
+
+def _read_json(path:pathlib.Path):
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def _write_json(path:pathlib.Path, value):
+    # write and rename so that parallel workers never read half a file
+    # 병렬 worker 가 반만 쓴 파일을 읽지 않도록 쓴 뒤 이름을 바꿈
+    try:
+        # readable by the user only
+        # 사용자만 읽을 수 있게
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        temporary = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+        temporary.write_text(json.dumps(value))
+        temporary.replace(path)
+    except OSError:
+        pass
@@ -0,0 +1,127 @@
+import os
+import pathlib
+import sys
+
+from typing import Tuple
+
+
+import numpy as np
+import numpy.testing as nt
+import pytest
+
+
+sys.path.insert(
+    0,
+    os.getenv(
+        'STUDENT_CODE_FOLDER',
+        str(
+            pathlib.Path(__file__).parent.parent.absolute()
+        )
+    )
+)
+
+
+import exercise
+
+
+@pytest.fixture
+def sections() -> np.ndarray:
+    rng = np.random.default_rng(1024)
+    nominal = np.array((50e-3, 12e-3, 7.5e-3, 70e-3, 90e-3, 10e-3))
+    return nominal * rng.normal(1.0, 0.2, size=(257, 6)).clip(0.2, None)
+
+
+@pytest.fixture
+def moments_Nm(sections:np.ndarray) -> np.ndarray:
+    return np.random.default_rng(2048).normal(100, 10, size=sections.shape[0])
+
+
+@pytest.mark.parametrize(
+    'name',
+    ('area', 'centroid_y', 'moment_of_inertia'),
+)
+def test_batch_bit_identical_to_scalar(name:str, sections:np.ndarray):
+    result = getattr(exercise, f'{name}_batch')(sections)
+    expected = np.array([getattr(exercise, name)(*map(float, row)) for row in sections])
+
+    assert isinstance(result, np.ndarray)
+    assert result.shape == (sections.shape[0],)
+    nt.assert_array_equal(result, expected)
+
+
+def test_bending_stress_batch_bit_identical_to_scalar(sections:np.ndarray, moments_Nm:np.ndarray):
+    result = exercise.bending_stress_batch(moments_Nm, sections)
+    expected = np.array([
+        exercise.bending_stress(float(m), *map(float, row))
+        for m, row in zip(moments_Nm, sections)
+    ])
+    nt.assert_array_equal(result, expected)
+
+
+@pytest.mark.parametrize(
+    'name',
+    ('area_above_below_equal', 'area_moment_above_below_equal'),
+)
+def test_above_below_batch_struct_of_arrays(name:str, sections:np.ndarray):
+    result = getattr(exercise, f'{name}_batch')(sections)
+
+    for row, *values in zip(sections, *result.values()):
+        expected = getattr(exercise, name)(*map(float, row))
+        assert tuple(expected.values()) == tuple(values)
+
+    assert result['close'].dtype == bool
+    assert all(v.shape == (sections.shape[0],) for v in result.values())
+
+
+def test_columns_same_as_rows(sections:np.ndarray):
+    nt.assert_array_equal(
+        exercise.moment_of_inertia_batch(sections),
+        exercise.moment_of_inertia_batch(tuple(sections.T)),
+    )
+    nt.assert_array_equal(
+        exercise.moment_of_inertia_batch(sections),
+        exercise.moment_of_inertia(*sections.T),
+    )
+
+
+def test_list_of_six_rows(wh:Tuple[float]):
+    # a list is rows, even with six entries; only a tuple is read as columns
+    # list 는 항목이 여섯개라도 행; tuple 만 열로 읽음
+    nt.assert_array_equal(exercise.area_batch([list(wh)] * 6), np.full(6, exercise.area(*wh)))
+
+
+def test_scalar_returns_float(wh:Tuple[float]):
+    assert type(exercise.area(*wh)) is float
+    assert type(exercise.area_above_below_equal(*wh)['close']) is bool
+
+
+def test_section_properties_consistent(sections:np.ndarray, moments_Nm:np.ndarray):
+    props = exercise.section_properties_batch(sections)
+
+    nt.assert_array_equal(props['area'], exercise.area_batch(sections))
+    nt.assert_array_equal(props['centroid_y'], exercise.centroid_y_batch(sections))
+    nt.assert_array_equal(props['moment_of_inertia'], exercise.moment_of_inertia_batch(sections))
+    nt.assert_allclose(props['c_top'] + props['c_bottom'], sections[:, 1::2].sum(axis=1))
+    nt.assert_allclose(
+        np.abs(moments_Nm) / np.minimum(props['S_top'], props['S_bottom']),
+        exercise.bending_stress_batch(moments_Nm, sections),
+    )
+
+
+def test_section_properties_scalar(wh:Tuple[float]):
+    props = exercise.section_properties(*wh)
+
+    assert props['area'] == exercise.area(*wh)
+    assert props['moment_of_inertia'] == exercise.moment_of_inertia(*wh)
+    assert len(props['layer_area']) == len(props['layer_centroid']) == 3
+
+
+def test_bad_shape():
+    with pytest.raises(ValueError):
+        exercise.area_batch(np.ones((4, 5)))
+    with pytest.raises(ValueError):
+        exercise.area_batch(np.ones(6))
+
+
+if "__main__" == __name__:
+    pytest.main([__file__])
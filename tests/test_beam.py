@@ -0,0 +1,93 @@
+import math
+import os
+import pathlib
+import sys
+
+
+import numpy as np
+import numpy.testing as nt
+import pytest
+
+
+sys.path.insert(
+    0,
+    os.getenv(
+        'STUDENT_CODE_FOLDER',
+        str(
+            pathlib.Path(__file__).parent.parent.absolute()
+        )
+    )
+)
+
+
+import beam
+import exercise
+
+
+@pytest.fixture
+def section() -> np.ndarray:
+    return np.array((50e-3, 12e-3, 7.5e-3, 70e-3, 90e-3, 10e-3))
+
+
+@pytest.fixture
+def E_Pa() -> float:
+    return 10e9
+
+
+@pytest.mark.parametrize('rule', ('trapezoid', 'simpson'))
+def test_simply_supported_uniform_load(rule:str, section:np.ndarray, E_Pa:float):
+    L_m, w_N_m = 2.0, 500.0
+    x = np.linspace(0.0, L_m, 2001)
+    M = beam.moment_diagram(x, 'simple', distributed_loads=((w_N_m, 0.0, L_m),))
+
+    assert math.isclose(M[1000], w_N_m * L_m ** 2 / 8.0, rel_tol=1e-12)
+
+    result = beam.beam_response(x, M, E_Pa, section, rule=rule)
+    I_m4 = exercise.moment_of_inertia(*section)
+
+    assert math.isclose(result['deflection'][0, 1000], -5.0 * w_N_m * L_m ** 4 / (384.0 * E_Pa * I_m4), rel_tol=1e-6)
+    assert math.isclose(result['envelope'].max(), exercise.bending_stress(M[1000], *section), rel_tol=1e-12)
+    nt.assert_allclose(result['deflection'][0, (0, -1)], 0.0, atol=1e-15)
+
+
+def test_cantilever_tip_load(section:np.ndarray, E_Pa:float):
+    L_m, P_N = 1.5, 200.0
+    x = np.linspace(0.0, L_m, 1501)
+    M = beam.moment_diagram(x, 'cantilever', point_loads=((P_N, L_m),))
+    result = beam.beam_response(x, M, E_Pa, section, support='cantilever', rule='simpson')
+    EI = E_Pa * exercise.moment_of_inertia(*section)
+
+    assert math.isclose(M[0], -P_N * L_m, rel_tol=1e-12)
+    assert math.isclose(result['deflection'][0, -1], -P_N * L_m ** 3 / (3.0 * EI), rel_tol=1e-9)
+    assert math.isclose(result['slope'][0, -1], -P_N * L_m ** 2 / (2.0 * EI), rel_tol=1e-9)
+
+
+def test_stepped_cantilever(section:np.ndarray, E_Pa:float):
+    L_m, P_N = 1.0, 100.0
+    sections = np.stack((section, section * (1.0, 1.0, 1.0, 0.5, 1.0, 1.0)))
+    I1, I2 = exercise.moment_of_inertia_batch(sections)
+
+    # the step at L / 2 falls between grid points
+    x = np.linspace(0.0, L_m, 1000)
+    M = np.stack((
+        beam.moment_diagram(x, 'cantilever', point_loads=((P_N, L_m),)),
+        beam.moment_diagram(x, 'cantilever', point_loads=((2.0 * P_N, L_m),)),
+    ))
+    result = beam.beam_response(x, M, E_Pa, sections, steps=(0.5 * L_m,), support='cantilever', rule='simpson')
+
+    expected = -P_N / E_Pa * ((L_m ** 3 - (0.5 * L_m) ** 3) / (3.0 * I1) + (0.5 * L_m) ** 3 / (3.0 * I2))
+    nt.assert_allclose(result['deflection'][:, -1], (expected, 2.0 * expected), rtol=1e-6)
+    nt.assert_array_equal(result['envelope'], result['bending_stress'][1])
+    assert result['moment_of_inertia'][0] == I1 and result['moment_of_inertia'][-1] == I2
+
+
+def test_bad_arguments(section:np.ndarray):
+    x = np.linspace(0.0, 1.0, 11)
+    with pytest.raises(ValueError):
+        beam.moment_diagram(x, 'fixed')
+    with pytest.raises(ValueError):
+        beam.beam_response(x, x, 1.0, section, steps=(0.5,))
+
+
+if "__main__" == __name__:
+    pytest.main([__file__])
@@ -0,0 +1,76 @@
+import math
+import os
+import pathlib
+import sys
+
+from typing import Dict, Tuple
+
+
+import pytest
+
+
+sys.path.insert(
+    0,
+    os.getenv(
+        'STUDENT_CODE_FOLDER',
+        str(
+            pathlib.Path(__file__).parent.parent.absolute()
+        )
+    )
+)
+
+
+import exercise
+
+
+@pytest.fixture
+def cache() -> Dict[str, object]:
+    return exercise.section_cache(maxsize=2)
+
+
+def test_cached_bending_stress(cache:Dict[str, object], wh:Tuple[float]):
+    for M_Nm in (50.0, -100.0, 150.0):
+        result = exercise.cached_bending_stress(cache, M_Nm, *wh)
+        expected = exercise.bending_stress(M_Nm, *wh)
+        assert math.isclose(result, expected, rel_tol=1e-12)
+
+    info = exercise.cache_info(cache)
+    assert (info['hits'], info['misses'], info['currsize']) == (2, 1, 1)
+
+
+def test_cache_lru_eviction(cache:Dict[str, object], wh:Tuple[float]):
+    a = wh
+    b = tuple(x * 1.1 for x in wh)
+    c = tuple(x * 1.2 for x in wh)
+
+    exercise.cached_section_properties(cache, *a)
+    exercise.cached_section_properties(cache, *b)
+    # touch a so that b becomes the least recently used
+    exercise.cached_section_properties(cache, *a)
+    exercise.cached_section_properties(cache, *c)
+
+    assert exercise.section_key(0.0, *b) not in cache['entries']
+    assert exercise.section_key(0.0, *a) in cache['entries']
+    assert exercise.cache_info(cache)['evictions'] == 1
+
+
+def test_cache_quantum():
+    wh = (50e-3, 12e-3, 7.5e-3, 70e-3, 90e-3, 10e-3)
+    cache = exercise.section_cache(quantum_m=1e-6)
+    exercise.cached_section_properties(cache, *wh)
+    exercise.cached_section_properties(cache, *(x + 1e-9 for x in wh))
+    assert exercise.cache_info(cache)['hits'] == 1
+
+    exercise.cache_clear(cache)
+    assert exercise.cache_info(cache) == {
+        'hits': 0, 'misses': 0, 'evictions': 0, 'maxsize': 1024, 'currsize': 0,
+    }
+
+
+def test_cache_bad_size():
+    with pytest.raises(ValueError):
+        exercise.section_cache(maxsize=0)
+
+
+if "__main__" == __name__:
+    pytest.main([__file__])
@@ -0,0 +1,105 @@
+import os
+import pathlib
+import sys
+
+
+import numpy as np
+import numpy.testing as nt
+import pytest
+
+
+sys.path.insert(
+    0,
+    os.getenv(
+        'STUDENT_CODE_FOLDER',
+        str(
+            pathlib.Path(__file__).parent.parent.absolute()
+        )
+    )
+)
+
+
+import exercise
+import section_catalog
+
+
+@pytest.fixture
+def sections() -> np.ndarray:
+    rng = np.random.default_rng(2718)
+    nominal = np.array((50e-3, 12e-3, 7.5e-3, 70e-3, 90e-3, 10e-3))
+    return nominal * rng.uniform(0.5, 1.5, size=(2000, 6))
+
+
+def brute_force(sections:np.ndarray, I_min:float, S_min:float, depth_max:float) -> int:
+    props = exercise.section_properties_batch(sections)
+    ok = (
+        (props['moment_of_inertia'] >= I_min)
+        & (props['moment_of_inertia'] / props['c_max'] >= S_min)
+        & (props['depth'] <= depth_max)
+    )
+    if not ok.any():
+        return -1
+    return int(np.flatnonzero(ok)[np.argmin(props['area'][ok])])
+
+
+@pytest.fixture
+def queries(sections:np.ndarray) -> np.ndarray:
+    props = exercise.section_properties_batch(sections)
+    rng = np.random.default_rng(31415)
+    n = 200
+    return np.stack((
+        rng.uniform(0.0, 1.1, n) * props['moment_of_inertia'].max(),
+        rng.uniform(0.0, 0.8, n) * (props['moment_of_inertia'] / props['c_max']).max(),
+        np.where(rng.uniform(size=n) < 0.3, np.inf, rng.uniform(0.5, 1.2, n) * props['depth'].max()),
+    ), axis=-1)
+
+
+def test_lightest_matches_brute_force(sections:np.ndarray, queries:np.ndarray):
+    index = section_catalog.catalog_index(sections)
+    for I_min, S_min, depth_max in queries:
+        for q in ((I_min, 0.0, np.inf), (0.0, S_min, np.inf), (I_min, S_min, depth_max)):
+            assert section_catalog.lightest(index, *q) == brute_force(sections, *q), q
+
+
+def test_batch_matches_scalar(sections:np.ndarray, queries:np.ndarray):
+    index = section_catalog.catalog_index(sections)
+    result = section_catalog.lightest_batch(index, *queries.T, block=64)
+    nt.assert_array_equal(result, [section_catalog.lightest(index, *q) for q in queries])
+
+
+def test_incremental_add(sections:np.ndarray, queries:np.ndarray):
+    index = section_catalog.catalog_index()
+    for part in np.array_split(sections, 7):
+        section_catalog.catalog_add(index, part)
+
+    full = section_catalog.catalog_index(sections)
+    nt.assert_array_equal(np.sort(index['skyline']), np.sort(full['skyline']))
+    for name in section_catalog.sorted_columns():
+        nt.assert_array_equal(index[name][index['order_' + name]], np.sort(full[name]))
+    nt.assert_array_equal(
+        section_catalog.lightest_batch(index, *queries.T),
+        section_catalog.lightest_batch(full, *queries.T),
+    )
+
+
+def test_lightest_for_moment(sections:np.ndarray):
+    index = section_catalog.catalog_index(sections)
+    M, sigma_allow = 5e3, 250e6
+    k = section_catalog.lightest_for_moment(index, M, sigma_allow)
+    assert exercise.bending_stress(M, *sections[k]) <= sigma_allow * (1.0 + 1e-12)
+    assert k == brute_force(sections, 0.0, M / sigma_allow, np.inf)
+
+
+def test_in_range(sections:np.ndarray):
+    index = section_catalog.catalog_index(sections)
+    low, high = np.quantile(index['depth'], (0.2, 0.4))
+    found = section_catalog.in_range(index, 'depth', low, high)
+    nt.assert_array_equal(np.sort(found), np.flatnonzero((index['depth'] >= low) & (index['depth'] <= high)))
+    assert np.all(np.diff(index['depth'][found]) >= 0.0)
+
+
+def test_nothing_satisfies(sections:np.ndarray):
+    index = section_catalog.catalog_index(sections)
+    assert section_catalog.lightest(index, I_min=1.0) == -1
+    assert section_catalog.lightest(index, I_min=0.0, S_min=1.0, depth_max=1.0) == -1
+    assert section_catalog.lightest(section_catalog.catalog_index(), I_min=1e-9) == -1
@@ -0,0 +1,101 @@
+import os
+import pathlib
+import sys
+
+
+import numpy as np
+import numpy.testing as nt
+import pytest
+
+
+sys.path.insert(
+    0,
+    os.getenv(
+        'STUDENT_CODE_FOLDER',
+        str(
+            pathlib.Path(__file__).parent.parent.absolute()
+        )
+    )
+)
+
+
+import exercise
+import section_editor
+
+
+@pytest.fixture
+def section() -> dict:
+    return section_editor.editable_section((50e-3, 7.5e-3, 90e-3), (12e-3, 70e-3, 10e-3))
+
+
+def check(section:dict, rtol:float=1e-12):
+    props = section_editor.editor_properties(section)
+    for name, expected in section_editor.editor_check(section).items():
+        nt.assert_allclose(props[name], expected, rtol=rtol, err_msg=name)
+
+
+def test_initial_matches_exercise(section:dict):
+    props = section_editor.editor_properties(section)
+    dims = (50e-3, 12e-3, 7.5e-3, 70e-3, 90e-3, 10e-3)
+    nt.assert_allclose(props['centroid_y'], exercise.centroid_y(*dims), rtol=1e-14)
+    nt.assert_allclose(props['moment_of_inertia'], exercise.moment_of_inertia(*dims), rtol=1e-14)
+    nt.assert_allclose(section_editor.editor_bending_stress(section, 100.0), exercise.bending_stress(100.0, *dims), rtol=1e-14)
+
+
+@pytest.mark.parametrize('k', (0, 1, 2))
+def test_drag_height(section:dict, k:int):
+    for h in np.linspace(5e-3, 0.12, 37):
+        section_editor.set_height(section, k, h)
+        check(section)
+
+
+@pytest.mark.parametrize('k', (0, 1, 2))
+def test_drag_width(section:dict, k:int):
+    for w in np.linspace(5e-3, 0.12, 37):
+        section_editor.set_width(section, k, w)
+        check(section)
+
+
+@pytest.mark.parametrize('k', (0, 1, 2, 3))
+def test_insert_and_remove(section:dict, k:int):
+    section_editor.insert_layer(section, k, 30e-3, 15e-3)
+    assert len(section['widths']) == 4
+    assert section['widths'][k] == 30e-3
+    check(section)
+
+    section_editor.remove_layer(section, k)
+    assert section['widths'] == [50e-3, 7.5e-3, 90e-3]
+    check(section)
+
+
+def test_random_edits_stay_close():
+    rng = np.random.default_rng(65537)
+    section = section_editor.editable_section((50e-3, 7.5e-3, 90e-3), (12e-3, 70e-3, 10e-3), refresh_every=64)
+    for _ in range(3000):
+        n = len(section['widths'])
+        op = rng.integers(4)
+        if 0 == op:
+            section_editor.set_width(section, rng.integers(n), rng.uniform(5e-3, 0.1))
+        elif 1 == op:
+            section_editor.set_height(section, rng.integers(n), rng.uniform(5e-3, 0.1))
+        elif 2 == op and n < 8:
+            section_editor.insert_layer(section, rng.integers(n + 1), rng.uniform(5e-3, 0.1), rng.uniform(5e-3, 0.1))
+        elif 3 == op and n > 2:
+            section_editor.remove_layer(section, rng.integers(n))
+        check(section, rtol=1e-9)
+
+
+def test_refresh_resets(section:dict):
+    section['refresh_every'] = 3
+    for h in (20e-3, 30e-3):
+        section_editor.set_height(section, 1, h)
+    assert section['updates'] == 2
+    section_editor.set_height(section, 1, 40e-3)
+    assert section['updates'] == 0
+    assert section['offset'] == 0.0
+    check(section, rtol=1e-15)
+
+
+def test_mismatched_layers():
+    with pytest.raises(ValueError):
+        section_editor.editable_section((1.0, 2.0), (1.0,))
@@ -0,0 +1,68 @@
+import os
+import pathlib
+import subprocess
+import sys
+
+
+import pytest
+
+
+proj_folder = pathlib.Path(
+    os.getenv(
+        'STUDENT_CODE_FOLDER',
+        pathlib.Path(__file__).parent.parent.absolute()
+    )
+)
+
+
+# Importing the computation modules should cost about as much as importing numpy :
+# scipy and matplotlib are loaded only by the functions that use them.
+# 계산 모듈의 import 비용은 numpy 의 import 와 비슷해야 함 :
+# scipy 와 matplotlib 은 이를 사용하는 함수에서만 불러옴.
+#
+# The wall clock budget depends on the machine and its load, so it runs only on request :
+# 시간 예산은 기계와 부하에 따라 달라지므로 요청할 때만 실행 :
+#   RUN_BENCHMARKS=1 IMPORT_BUDGET_S=0.25 python -m pytest tests/test_import_time.py
+
+
+def computation_modules() -> tuple:
+    return tuple(sorted(
+        p.stem for p in proj_folder.glob('*.py')
+        if 'sample.py' != p.name
+    ))
+
+
+def import_in_fresh_process(statement:str) -> str:
+    return subprocess.check_output(
+        [sys.executable, '-c', statement], cwd=proj_folder, encoding='utf-8',
+    ).strip()
+
+
+def best_import_time_s(modules:tuple, repeat:int=3) -> float:
+    statement = (
+        'import time; start = time.perf_counter(); '
+        + ''.join(f'import {m}; ' for m in modules)
+        + 'print(time.perf_counter() - start)'
+    )
+    return min(float(import_in_fresh_process(statement)) for _ in range(repeat))
+
+
+def test_no_heavy_import():
+    modules = computation_modules() + ('sample',)
+    loaded = import_in_fresh_process(
+        f"import sys, {', '.join(modules)}; "
+        "print(sorted({m.split('.')[0] for m in sys.modules} & {'scipy', 'matplotlib'}))"
+    )
+    assert '[]' == loaded, f'importing {modules} loads {loaded}'
+
+
+@pytest.mark.skipif(not os.getenv('RUN_BENCHMARKS'), reason='set RUN_BENCHMARKS=1 to time the imports')
+def test_import_time_budget():
+    # extra time over numpy alone, default 0.25 s; IMPORT_BUDGET_S overrides it on slow machines
+    # numpy 만 import 할 때보다 늘어난 시간, 기본 0.25 초; 느린 기계에서는 IMPORT_BUDGET_S 로 변경
+    budget_s = float(os.getenv('IMPORT_BUDGET_S', 0.25))
+    numpy_s = best_import_time_s(('numpy',))
+    all_s = best_import_time_s(('numpy',) + computation_modules())
+    assert all_s - numpy_s < budget_s, (
+        f'importing every module takes {all_s:.3f} s, numpy alone {numpy_s:.3f} s'
+    )
@@ -0,0 +1,127 @@
+import os
+import pathlib
+import sys
+
+
+import numpy as np
+import numpy.testing as nt
+import pytest
+
+
+sys.path.insert(
+    0,
+    os.getenv(
+        'STUDENT_CODE_FOLDER',
+        str(
+            pathlib.Path(__file__).parent.parent.absolute()
+        )
+    )
+)
+
+
+import exercise
+import polygon_section
+import section_integration
+
+
+@pytest.fixture
+def sections() -> np.ndarray:
+    rng = np.random.default_rng(16384)
+    nominal = np.array((50e-3, 12e-3, 7.5e-3, 70e-3, 90e-3, 10e-3))
+    return nominal * rng.uniform(0.5, 1.5, size=(32, 6))
+
+
+@pytest.mark.parametrize('rule', ('trapezoid', 'simpson', 'romberg'))
+def test_layered_matches_exercise(rule:str, sections:np.ndarray):
+    width, breakpoints = section_integration.layered_width(sections[:, 0::2], sections[:, 1::2])
+    result = section_integration.section_integrals(width, breakpoints, rule=rule, rtol=1e-9)
+
+    assert result['converged'].all()
+    nt.assert_allclose(result['area'], exercise.area_batch(sections), rtol=1e-8)
+    nt.assert_allclose(result['centroid_y'], exercise.centroid_y_batch(sections), rtol=1e-8)
+    nt.assert_allclose(result['moment_of_inertia'], exercise.moment_of_inertia_batch(sections), rtol=1e-8)
+
+
+def test_layers_need_no_refinement(sections:np.ndarray):
+    # b(y) is constant inside each interval : Simpson is exact from the first check
+    width, breakpoints = section_integration.layered_width(sections[:, 0::2], sections[:, 1::2])
+    result = section_integration.section_integrals(width, breakpoints, rule='simpson')
+    assert (result['levels'] == 2).all()
+
+
+@pytest.mark.parametrize('rule', ('simpson', 'romberg'))
+def test_tapered_web(rule:str):
+    # web width changes linearly from 6 mm at the bottom to 12 mm at the top
+    h_m, b_bottom_m, b_top_m = 0.1, 6e-3, 12e-3
+
+    def width(y:np.ndarray, section:np.ndarray, piece:np.ndarray) -> np.ndarray:
+        return b_bottom_m + (b_top_m - b_bottom_m) * y / h_m
+
+    result = section_integration.section_integrals(width, (0.0, h_m), rule=rule)
+
+    outline = np.array((
+        (-0.5 * b_bottom_m, 0.0), (0.5 * b_bottom_m, 0.0),
+        (0.5 * b_top_m, h_m), (-0.5 * b_top_m, h_m),
+    ))
+    expected = polygon_section.polygon_properties(outline)
+
+    nt.assert_allclose(result['area'], expected['area'], rtol=1e-12)
+    nt.assert_allclose(result['centroid_y'], expected['centroid_y'], rtol=1e-12)
+    nt.assert_allclose(result['moment_of_inertia'], expected['Ix'], rtol=1e-10)
+
+
+def test_refines_only_what_needs_it():
+    # the flange and the tapered web of one section, and a plain rectangle :
+    # only the web interval is refined past the first check, in chunks of at most max_nodes nodes
+    # 한 단면의 플랜지와 폭이 변하는 웹, 그리고 직사각형 :
+    # 첫 확인 뒤에는 웹 구간만 세분하며 한번에 max_nodes 개 이하의 점만 계산
+    calls = []
+
+    def width(y:np.ndarray, section:np.ndarray, piece:np.ndarray) -> np.ndarray:
+        calls.append((y.size, np.unique(section).tolist()))
+        taper = 1.0 + 10.0 * np.sin(40.0 * y)
+        return np.where((0 == section) & (1 == piece), taper, 1.0)
+
+    result = section_integration.section_integrals(width, ((0.0, 0.1, 1.0), (0.0, 0.5, 1.0)), rule='simpson', rtol=1e-10, max_nodes=1024)
+
+    assert result['converged'].all()
+    assert result['levels'][1] == 2 < result['levels'][0]
+    assert max(size for size, _ in calls) <= 1024
+    assert all([0] == sections for _, sections in calls[3:])
+    nt.assert_allclose(result['area'][0], 0.1 + 0.9 + 10.0 * (np.cos(4.0) - np.cos(40.0)) / 40.0, rtol=1e-7)
+
+
+def test_node_cache():
+    # reused between calls, with read only nodes
+    # 호출 사이에 재사용하며 점은 읽기 전용
+    width, breakpoints = section_integration.layered_width((50e-3, 7.5e-3, 90e-3), (12e-3, 70e-3, 10e-3))
+    nodes = section_integration.node_cache()
+    first = section_integration.section_integrals(width, breakpoints, nodes=nodes)
+    assert nodes['levels'] and not any(unit.flags.writeable for unit in nodes['levels'].values())
+
+    again = section_integration.section_integrals(width, breakpoints, nodes=nodes)
+    fresh = section_integration.section_integrals(width, breakpoints)
+    for key in ('area', 'centroid_y', 'moment_of_inertia'):
+        assert again[key] == first[key] == fresh[key]
+
+
+@pytest.mark.parametrize('rule', ('trapezoid', 'simpson', 'romberg'))
+def test_sampled_rectangle(rule:str):
+    b_m, h_m = 0.05, 0.2
+    y = np.linspace(0.0, h_m, 2 ** 6 + 1)
+    result = section_integration.sampled_section_integrals(y, np.full_like(y, b_m), rule=rule)
+
+    nt.assert_allclose(result['area'], b_m * h_m, rtol=1e-12)
+    nt.assert_allclose(result['centroid_y'], 0.5 * h_m, rtol=1e-12)
+    nt.assert_allclose(result['moment_of_inertia'], b_m * h_m ** 3 / 12.0, rtol=1e-3 if 'trapezoid' == rule else 1e-12)
+
+
+def test_bad_rule():
+    with pytest.raises(ValueError):
+        section_integration.sampled_section_integrals((0.0, 1.0), (1.0, 1.0), rule='gauss')
+    with pytest.raises(ValueError):
+        section_integration.sampled_section_integrals(np.linspace(0, 1, 6), np.ones(6), rule='romberg')
+
+
+if "__main__" == __name__:
+    pytest.main([__file__])
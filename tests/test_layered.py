@@ -0,0 +1,89 @@
+import os
+import pathlib
+import sys
+
+from typing import Tuple
+
+
+import numpy as np
+import numpy.testing as nt
+import pytest
+
+
+sys.path.insert(
+    0,
+    os.getenv(
+        'STUDENT_CODE_FOLDER',
+        str(
+            pathlib.Path(__file__).parent.parent.absolute()
+        )
+    )
+)
+
+
+import exercise
+
+
+@pytest.fixture
+def plates() -> Tuple[Tuple[np.ndarray]]:
+    rng = np.random.default_rng(4096)
+    counts = rng.integers(5, 41, size=64)
+    widths = tuple(rng.uniform(5e-3, 100e-3, size=n) for n in counts)
+    heights = tuple(rng.uniform(1e-3, 20e-3, size=n) for n in counts)
+    return widths, heights
+
+
+def test_three_layer_special_case(wh:Tuple[float], width_m:Tuple[float], height_m:Tuple[float]):
+    props = exercise.layered_section_properties(width_m, height_m)
+
+    assert props['area'] == exercise.area(*wh)
+    assert props['centroid_y'] == exercise.centroid_y(*wh)
+    assert props['moment_of_inertia'] == exercise.moment_of_inertia(*wh)
+    assert exercise.layered_bending_stress(100.0, width_m, height_m) == exercise.bending_stress(100.0, *wh)
+
+
+def test_degenerate_scalar_section():
+    # the scalar path falls back to the arrays instead of raising ZeroDivisionError
+    # scalar 경로는 ZeroDivisionError 대신 배열 계산으로 넘어감
+    with np.errstate(invalid='ignore', divide='ignore'):
+        assert np.isnan(exercise.centroid_y(0.0, 0.0, 0.0, 0.0, 0.0, 0.0))
+        assert np.isnan(exercise.bending_stress(100.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0))
+
+
+def test_split_layer_same_section(width_m:Tuple[float], height_m:Tuple[float]):
+    # cutting the web into two plates must not change anything
+    widths = (width_m[0], width_m[1], width_m[1], width_m[2])
+    heights = (height_m[0], height_m[1] * 0.25, height_m[1] * 0.75, height_m[2])
+
+    expected = exercise.layered_section_properties(width_m, height_m)
+    result = exercise.layered_section_properties(widths, heights)
+
+    for key in ('area', 'centroid_y', 'moment_of_inertia', 'c_max'):
+        nt.assert_allclose(result[key], expected[key], rtol=1e-12)
+
+    q = exercise.layered_area_moment_above_below_equal(widths, heights)
+    assert q['close']
+
+
+def test_ragged_batch(plates:Tuple[Tuple[np.ndarray]]):
+    widths, heights = plates
+    padded_w, padded_h = exercise.pad_layers(widths, heights)
+    assert padded_w.shape == (len(widths), max(map(len, widths)))
+
+    props = exercise.layered_section_properties(padded_w, padded_h)
+    stress = exercise.layered_bending_stress(np.arange(len(widths)), padded_w, padded_h)
+
+    for i, (w, h) in enumerate(zip(widths, heights)):
+        expected = exercise.layered_section_properties(w, h)
+        for key in ('area', 'centroid_y', 'moment_of_inertia', 'depth'):
+            nt.assert_allclose(props[key][i], expected[key], rtol=1e-12)
+        nt.assert_allclose(stress[i], exercise.layered_bending_stress(i, w, h), rtol=1e-12)
+
+
+def test_pad_layers_mismatch():
+    with pytest.raises(ValueError):
+        exercise.pad_layers((np.ones(3),), (np.ones(2),))
+
+
+if "__main__" == __name__:
+    pytest.main([__file__])
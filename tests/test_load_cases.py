@@ -0,0 +1,73 @@
+import os
+import pathlib
+import sys
+
+
+import numpy as np
+import numpy.testing as nt
+import pytest
+
+
+sys.path.insert(
+    0,
+    os.getenv(
+        'STUDENT_CODE_FOLDER',
+        str(
+            pathlib.Path(__file__).parent.parent.absolute()
+        )
+    )
+)
+
+
+import load_cases
+
+
+@pytest.fixture
+def sections() -> np.ndarray:
+    rng = np.random.default_rng(65536)
+    nominal = np.array((50e-3, 12e-3, 7.5e-3, 70e-3, 90e-3, 10e-3))
+    return nominal * rng.uniform(0.5, 1.5, size=(300, 6))
+
+
+@pytest.fixture
+def moments_Nm() -> np.ndarray:
+    return np.random.default_rng(131072).normal(0.0, 500.0, size=700)
+
+
+@pytest.fixture
+def sigma_allow_pa(sections:np.ndarray) -> np.ndarray:
+    return np.linspace(100e6, 250e6, sections.shape[0])
+
+
+def test_scan_matches_tiled_matrix(sections:np.ndarray, moments_Nm:np.ndarray, sigma_allow_pa:np.ndarray):
+    result = load_cases.load_case_scan(sections, moments_Nm, sigma_allow_pa, top_k=25)
+
+    full = np.empty((sections.shape[0], moments_Nm.size))
+    for i0, j0, tile in load_cases.utilization_tiles(sections, moments_Nm, sigma_allow_pa, tile=(64, 100)):
+        full[i0:i0 + tile.shape[0], j0:j0 + tile.shape[1]] = tile
+
+    nt.assert_allclose(result['max_utilization'], full.max(axis=1), rtol=1e-12)
+    nt.assert_array_equal(result['governing_load_case'], full.argmax(axis=1))
+
+    expected = np.sort(full.ravel())[::-1][:25]
+    nt.assert_allclose(result['top_utilization'], expected, rtol=1e-12)
+    nt.assert_allclose(
+        full[result['top_sections'], result['top_load_cases']],
+        result['top_utilization'],
+        rtol=1e-12,
+    )
+
+
+def test_top_k_larger_than_pairs(sections:np.ndarray):
+    result = load_cases.load_case_scan(sections[:3], (1.0, -2.0), 1e6, top_k=100)
+    assert result['top_utilization'].size == 6
+    assert (np.diff(result['top_utilization']) <= 0.0).all()
+
+
+def test_no_load_case(sections:np.ndarray):
+    with pytest.raises(ValueError):
+        load_cases.load_case_scan(sections, (), 1e6)
+
+
+if "__main__" == __name__:
+    pytest.main([__file__])
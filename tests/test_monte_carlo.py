@@ -0,0 +1,75 @@
+import math
+import os
+import pathlib
+import sys
+
+from typing import Dict
+
+
+import numpy as np
+import pytest
+
+
+sys.path.insert(
+    0,
+    os.getenv(
+        'STUDENT_CODE_FOLDER',
+        str(
+            pathlib.Path(__file__).parent.parent.absolute()
+        )
+    )
+)
+
+
+import exercise
+import monte_carlo
+
+
+@pytest.fixture
+def tolerance() -> Dict[str, object]:
+    # same scatter as the fixtures in conftest.py
+    return {
+        'nominal': (50e-3, 12e-3, 7.5e-3, 70e-3, 90e-3, 10e-3),
+        'std': (10e-3, 2.5e-3, 1.5e-3, 1.4e-3, 18e-3, 2e-3),
+        'M_Nm': 100.0,
+        'M_std': 10.0,
+        'n_samples': 50_000,
+        'seed': 42,
+        'sigma_limit': 2.5e6,
+        'block_size': 4096,
+    }
+
+
+def test_reproducible_across_chunk_sizes(tolerance:Dict[str, object]):
+    small = monte_carlo.stress_monte_carlo(chunk_size=4096, **tolerance)
+    large = monte_carlo.stress_monte_carlo(chunk_size=10 ** 6, **tolerance)
+    assert small == large
+
+
+def test_against_in_memory_reference(tolerance:Dict[str, object]):
+    result = monte_carlo.stress_monte_carlo(quantiles=(0.5, 0.95, 0.999), **tolerance)
+
+    n, block = tolerance['n_samples'], tolerance['block_size']
+    draws = np.concatenate([
+        monte_carlo._block_draws(tolerance['seed'], b, min(block, n - b * block))
+        for b in range(-(-n // block))
+    ])
+    samples = np.append(tolerance['nominal'], tolerance['M_Nm']) + np.append(tolerance['std'], tolerance['M_std']) * draws
+    sigma = exercise.bending_stress(samples[:, 6], *samples[:, :6].T)
+
+    assert result['count'] == n
+    assert math.isclose(result['mean'], sigma.mean(), rel_tol=1e-12)
+    assert math.isclose(result['variance'], sigma.var(ddof=1), rel_tol=1e-10)
+    assert result['p_exceed'] == np.count_nonzero(sigma > tolerance['sigma_limit']) / n
+    for q, value in result['quantiles'].items():
+        assert math.isclose(value, np.quantile(sigma, q), rel_tol=1e-3)
+
+
+def test_seed_changes_result(tolerance:Dict[str, object]):
+    first = monte_carlo.stress_monte_carlo(**tolerance)
+    tolerance['seed'] += 1
+    assert monte_carlo.stress_monte_carlo(**tolerance)['mean'] != first['mean']
+
+
+if "__main__" == __name__:
+    pytest.main([__file__])
@@ -0,0 +1,84 @@
+import os
+import pathlib
+import sys
+import warnings
+
+
+import numpy as np
+import pytest
+
+
+sys.path.insert(
+    0,
+    os.getenv(
+        'STUDENT_CODE_FOLDER',
+        str(
+            pathlib.Path(__file__).parent.parent.absolute()
+        )
+    )
+)
+
+
+import exercise
+import section_optimize
+
+
+@pytest.fixture
+def bounds() -> np.ndarray:
+    return np.array((
+        (20e-3, 100e-3),
+        (5e-3, 20e-3),
+        (5e-3, 15e-3),
+        (40e-3, 120e-3),
+        (20e-3, 100e-3),
+        (5e-3, 20e-3),
+    ))
+
+
+def test_minimum_area_beats_grid(bounds:np.ndarray):
+    M_Nm, sigma_allow_pa = 1000.0, 100e6
+    result = section_optimize.minimum_area_section(M_Nm, sigma_allow_pa, bounds, points_per_dim=5)
+    grid_only = section_optimize.minimum_area_section(M_Nm, sigma_allow_pa, bounds, points_per_dim=5, refine=False)
+
+    assert result['feasible']
+    assert result['area'] <= grid_only['area']
+    assert result['area'] == exercise.area(*result['section'])
+    assert ((bounds[:, 0] <= result['section']) & (result['section'] <= bounds[:, 1])).all()
+
+
+def test_fixed_dimensions(bounds:np.ndarray):
+    # lower == upper fixes a dimension : only the others are optimized, without nan or warnings
+    # 하한과 상한이 같으면 고정 : 나머지만 최적화하며 nan 이나 경고가 없음
+    M_Nm, sigma_allow_pa = 3000.0, 100e6
+    bounds[0] = bounds[4] = 60e-3
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        result = section_optimize.minimum_area_section(M_Nm, sigma_allow_pa, bounds, points_per_dim=5)
+        grid_only = section_optimize.minimum_area_section(M_Nm, sigma_allow_pa, bounds, points_per_dim=5, refine=False)
+
+    assert result['feasible']
+    assert result['area'] < grid_only['area']
+    assert result['section'][0] == result['section'][4] == 60e-3
+
+
+def test_infeasible(bounds:np.ndarray):
+    result = section_optimize.minimum_area_section(1e6, 1.0, bounds, points_per_dim=3)
+    assert not result['feasible']
+    assert result['section'] is None
+
+
+def test_pareto_front_nondominated(bounds:np.ndarray):
+    front = section_optimize.pareto_front(1000.0, bounds, points_per_dim=4, batch_size=500)
+
+    assert (np.diff(front['area']) >= 0.0).all()
+    assert (np.diff(front['bending_stress']) < 0.0).all()
+    np.testing.assert_array_equal(front['bending_stress'], exercise.bending_stress_batch(1000.0, front['sections']))
+
+
+def test_bad_bounds():
+    with pytest.raises(ValueError):
+        section_optimize.minimum_area_section(1.0, 1.0, np.ones((5, 2)))
+
+
+if "__main__" == __name__:
+    pytest.main([__file__])
@@ -0,0 +1,62 @@
+import os
+import pathlib
+import sys
+
+
+import numpy as np
+import numpy.testing as nt
+import pytest
+
+
+sys.path.insert(
+    0,
+    os.getenv(
+        'STUDENT_CODE_FOLDER',
+        str(
+            pathlib.Path(__file__).parent.parent.absolute()
+        )
+    )
+)
+
+
+import section_io
+import section_parallel
+
+
+@pytest.fixture
+def rows() -> np.ndarray:
+    rng = np.random.default_rng(1048576)
+    nominal = np.array((50e-3, 12e-3, 7.5e-3, 70e-3, 90e-3, 10e-3, 100.0))
+    return nominal * rng.uniform(0.5, 1.5, size=(5003, 7))
+
+
+@pytest.mark.parametrize('backend', ('process', 'thread'))
+def test_matches_serial(backend:str, rows:np.ndarray):
+    expected = section_io.evaluate_chunk(rows)
+    result = section_parallel.parallel_evaluate(rows, workers=2, chunk_rows=700, backend=backend)
+    nt.assert_array_equal(result, expected)
+
+
+def test_order_independent_of_chunks(rows:np.ndarray):
+    a = section_parallel.parallel_evaluate(rows[:, :6], workers=2, chunk_rows=1000, backend='thread')
+    b = section_parallel.parallel_evaluate(rows[:, :6], workers=3, chunk_rows=333, backend='thread')
+    nt.assert_array_equal(a, b)
+    assert np.isnan(a[:, -1]).all()
+
+
+def test_single_worker(rows:np.ndarray):
+    nt.assert_array_equal(
+        section_parallel.parallel_evaluate(rows, workers=1),
+        section_io.evaluate_chunk(rows),
+    )
+
+
+def test_auto_chunk_rows():
+    assert section_parallel.auto_chunk_rows(100, 8) == 2**14
+    assert section_parallel.auto_chunk_rows(10**8, 64) == 390625
+    assert section_parallel.auto_chunk_rows(10**10, 4) == 2**20
+
+
+def test_unknown_backend(rows:np.ndarray):
+    with pytest.raises(ValueError):
+        section_parallel.parallel_evaluate(rows, backend='gpu')
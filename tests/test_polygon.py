@@ -0,0 +1,88 @@
+import math
+import os
+import pathlib
+import sys
+
+from typing import Tuple
+
+
+import numpy as np
+import numpy.testing as nt
+import pytest
+
+
+sys.path.insert(
+    0,
+    os.getenv(
+        'STUDENT_CODE_FOLDER',
+        str(
+            pathlib.Path(__file__).parent.parent.absolute()
+        )
+    )
+)
+
+
+import exercise
+import polygon_section
+
+
+@pytest.fixture
+def sections() -> np.ndarray:
+    rng = np.random.default_rng(8192)
+    nominal = np.array((50e-3, 12e-3, 7.5e-3, 70e-3, 90e-3, 10e-3))
+    return nominal * rng.uniform(0.5, 1.5, size=(100, 6))
+
+
+def test_t_section_regression(sections:np.ndarray):
+    # the T-beam functions of exercise.py are the reference
+    outline = polygon_section.t_section_polygon(*sections.T)
+    props = polygon_section.polygon_properties(outline)
+
+    nt.assert_allclose(props['area'], exercise.area_batch(sections), rtol=1e-12)
+    nt.assert_allclose(props['centroid_y'], exercise.centroid_y_batch(sections), rtol=1e-12)
+    nt.assert_allclose(props['Ix'], exercise.moment_of_inertia_batch(sections), rtol=1e-10)
+    nt.assert_allclose(props['Ixy'], 0.0, atol=1e-20)
+    nt.assert_allclose(props['centroid_x'], 0.0, atol=1e-15)
+    nt.assert_allclose(
+        polygon_section.polygon_bending_stress(100.0, outline),
+        exercise.bending_stress_batch(100.0, sections),
+        rtol=1e-10,
+    )
+
+
+def test_orientation_does_not_matter(wh:Tuple[float]):
+    outline = polygon_section.t_section_polygon(*wh)
+    ccw = polygon_section.polygon_properties(outline)
+    cw = polygon_section.polygon_properties(outline[::-1])
+
+    for key in ('area', 'centroid_y', 'Ix', 'Iy'):
+        assert math.isclose(ccw[key], cw[key], rel_tol=1e-12)
+
+
+def test_box_with_hole():
+    b, h, t = 0.1, 0.2, 0.01
+    outer = polygon_section.rectangle_polygon(0.0, 0.0, b, h)
+    hole = polygon_section.rectangle_polygon(t, t, b - 2 * t, h - 2 * t)
+    props = polygon_section.polygon_properties(outer, (hole,))
+
+    expected_Ix = (b * h ** 3 - (b - 2 * t) * (h - 2 * t) ** 3) / 12.0
+    assert math.isclose(props['area'], b * h - (b - 2 * t) * (h - 2 * t), rel_tol=1e-12)
+    assert math.isclose(props['Ix'], expected_Ix, rel_tol=1e-12)
+    assert math.isclose(props['centroid_y'], 0.5 * h, rel_tol=1e-12)
+
+
+@pytest.mark.parametrize('angle', (0.0, 0.3, 1.0, -0.7))
+def test_principal_axes_of_rotated_rectangle(angle:float):
+    b, h = 0.2, 0.05
+    rect = polygon_section.rectangle_polygon(-0.5 * b, -0.5 * h, b, h)
+    rotation = np.array(((math.cos(angle), -math.sin(angle)), (math.sin(angle), math.cos(angle))))
+    props = polygon_section.polygon_properties(rect @ rotation.T)
+
+    assert math.isclose(props['I1'], h * b ** 3 / 12.0, rel_tol=1e-9)
+    assert math.isclose(props['I2'], b * h ** 3 / 12.0, rel_tol=1e-9)
+    # the major axis is perpendicular to the long side
+    assert math.isclose(math.cos(2 * (props['theta'] - angle)), -1.0, rel_tol=1e-9)
+
+
+if "__main__" == __name__:
+    pytest.main([__file__])
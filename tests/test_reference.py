@@ -0,0 +1,104 @@
+import os
+import pathlib
+import sys
+
+
+import numpy as np
+import pytest
+
+
+sys.path.insert(
+    0,
+    os.getenv(
+        'STUDENT_CODE_FOLDER',
+        str(
+            pathlib.Path(__file__).parent.parent.absolute()
+        )
+    )
+)
+sys.path.insert(0, str(pathlib.Path(__file__).parent.absolute()))
+
+
+import exercise
+import reference
+
+
+# Thousands of seeded sections per test, compared in bulk with reference.py
+# 시험마다 seed 를 고정한 수천 개의 단면을 reference.py 와 한번에 비교
+#   REFERENCE_SEED=<n> reproduces a reported failure, REFERENCE_SECTIONS changes the batch size
+#   REFERENCE_SEED=<n> 으로 보고된 실패를 재현, REFERENCE_SECTIONS 로 묶음 크기를 변경
+
+
+def seeds() -> tuple:
+    if os.getenv('REFERENCE_SEED'):
+        return (int(os.getenv('REFERENCE_SEED')),)
+    return (20241001, 20241002, 20241003)
+
+
+@pytest.fixture(params=seeds())
+def batch(request) -> dict:
+    n = int(os.getenv('REFERENCE_SECTIONS', 4096))
+    data = reference.random_sections(request.param, n)
+    data['seed'] = request.param
+    data['expected'] = reference.reference(data['sections'], data['M'])
+    return data
+
+
+def check(name:str, result:np.ndarray, batch:dict, rtol:float=1e-9, scale:np.ndarray=None):
+    error, i = reference.worst_relative_error(result, batch['expected'][name], scale)
+    assert error <= rtol, (
+        '\n'
+        f"{name} : worst relative error {error:.3g} at seed {batch['seed']} row {i} "
+        f"({reference.edge_cases()[batch['case'][i]]})\n"
+        f"  section {tuple(batch['sections'][i])}, M {batch['M'][i]}\n"
+        f"  returned {np.asarray(result)[i]!r}, expected {batch['expected'][name][i]!r}\n"
+        f"{name} : 최대 상대 오차 {error:.3g}, seed {batch['seed']} 의 {i} 번째 행\n"
+    )
+
+
+def columns(batch:dict) -> tuple:
+    return tuple(batch['sections'].T)
+
+
+@pytest.mark.parametrize('name', ('area', 'centroid_y', 'moment_of_inertia'))
+def test_properties(name:str, batch:dict):
+    check(name, getattr(exercise, name)(*columns(batch)), batch)
+
+
+def test_bending_stress(batch:dict):
+    check('bending_stress', exercise.bending_stress(batch['M'], *columns(batch)), batch)
+
+
+def test_area_above_below(batch:dict):
+    result = exercise.area_above_below_equal(*columns(batch))
+    for key in ('a_above', 'a_below'):
+        check(key, result[key], batch, scale=batch['expected']['area'])
+
+    expected = batch['expected']
+    gap = np.abs(expected['a_above'] - expected['a_below']) / np.maximum(expected['a_above'], expected['a_below'])
+    # 'close' is only well defined away from the math.isclose() threshold of 1e-9
+    # 'close' 는 math.isclose() 의 기준 1e-9 에서 떨어진 경우에만 명확함
+    clear = (gap > 1e-6) | (gap < 1e-12)
+    mismatch = np.flatnonzero(clear & (result['close'] != (gap <= 1e-9)))
+    assert 0 == mismatch.size, f"close differs at seed {batch['seed']} rows {mismatch[:10]}"
+
+
+def test_area_moment_above_below(batch:dict):
+    result = exercise.area_moment_above_below_equal(*columns(batch))
+    expected = batch['expected']
+    # both first moments are about the same centroid and balance; compare them with A × depth
+    # 두 1차 모멘트는 같은 도심에 대한 것으로 크기가 같음; A × 깊이와 비교
+    scale = expected['area'] * batch['sections'][:, 1::2].sum(axis=-1)
+    for key in ('a_moment_above', 'a_moment_below'):
+        check(key, result[key], batch, scale=scale)
+    assert np.all(result['close']), f"first moments not balanced at seed {batch['seed']}"
+
+
+def test_scalar_path_matches_batch(batch:dict):
+    # the float path of a few hundred rows gives the same numbers as the array path
+    # 수백 행의 float 경로가 배열 경로와 같은 값을 반환
+    rows = batch['sections'][:256]
+    for name in ('area', 'centroid_y', 'moment_of_inertia'):
+        scalar = np.array([getattr(exercise, name)(*map(float, row)) for row in rows])
+        assert all(isinstance(getattr(exercise, name)(*map(float, row)), float) for row in rows[:4])
+        np.testing.assert_array_equal(scalar, getattr(exercise, name)(*rows.T), err_msg=name)
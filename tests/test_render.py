@@ -0,0 +1,106 @@
+import os
+import pathlib
+import subprocess
+import sys
+
+
+import numpy as np
+import numpy.testing as nt
+import pytest
+
+
+sys.path.insert(
+    0,
+    os.getenv(
+        'STUDENT_CODE_FOLDER',
+        str(
+            pathlib.Path(__file__).parent.parent.absolute()
+        )
+    )
+)
+
+
+import exercise
+import sample
+import section_render
+
+
+@pytest.fixture
+def sections() -> np.ndarray:
+    rng = np.random.default_rng(16384)
+    nominal = np.array((50e-3, 12e-3, 7.5e-3, 70e-3, 90e-3, 10e-3))
+    return nominal * rng.uniform(0.5, 1.5, size=(25, 6))
+
+
+def test_layer_polygons():
+    polygons = section_render.layer_polygons([[2.0, 1.0, 0.0]], [[1.0, 3.0, 0.0]], x_center=5.0, y_bottom=-1.0)
+    nt.assert_allclose(polygons, [
+        [[4.0, -1.0], [6.0, -1.0], [6.0, 0.0], [4.0, 0.0]],
+        [[4.5, 0.0], [5.5, 0.0], [5.5, 3.0], [4.5, 3.0]],
+    ])
+
+
+def test_layout_fits_cells(sections:np.ndarray):
+    widths, heights = section_render._three_layer_stacks(sections)
+    layout = section_render.sheet_layout(widths, heights, columns=7)
+    assert (layout['rows'], layout['columns']) == (4, 7)
+
+    polygons = section_render.layer_polygons(widths, heights, layout['x_center'], layout['y_bottom'], layout['scale'])
+    cell_x = np.floor(polygons[..., 0].mean(axis=-1))
+    cell_y = np.floor(polygons[..., 1].mean(axis=-1))
+    assert np.all(np.floor(polygons[..., 0]) == cell_x[:, None])
+    assert np.all(np.floor(polygons[..., 1] - 1e-12) == cell_y[:, None])
+
+
+def test_draw_sheet_collections(sections:np.ndarray):
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    widths, heights = exercise.pad_layers(
+        [row[0::2] for row in sections[:10]] + [np.array((0.05, 0.01, 0.05, 0.01))],
+        [row[1::2] for row in sections[:10]] + [np.array((0.01, 0.05, 0.01, 0.05))],
+    )
+    figure = Figure()
+    FigureCanvasAgg(figure)
+    ax = figure.add_subplot()
+    artists = section_render.draw_sheet(ax, widths, heights, columns=4)
+
+    assert len(ax.collections) == 3
+    assert len(artists['layers'].get_paths()) == 10 * 3 + 4
+    assert len(artists['centroid'].get_segments()) == 11
+
+    # the centroid line of the first cell is at ȳ of the first section
+    # 첫 칸의 도심 선은 첫 단면의 ȳ 위치
+    layout = artists['layout']
+    y = artists['centroid'].get_segments()[0][0, 1]
+    nt.assert_allclose((y - layout['y_bottom'][0]) / layout['scale'][0], exercise.centroid_y(*sections[0]))
+
+
+def test_render_sheets(tmp_path:pathlib.Path, sections:np.ndarray):
+    serial = section_render.render_sheets_batch(sections, tmp_path / 'serial', per_page=10, columns=5, workers=1, dpi=40)
+    parallel = section_render.render_sheets_batch(sections, tmp_path / 'parallel', per_page=10, columns=5, workers=2, dpi=40)
+
+    assert [pathlib.Path(p).name for p in serial] == ['sheet_0000.png', 'sheet_0001.png', 'sheet_0002.png']
+    assert [pathlib.Path(p).name for p in parallel] == [pathlib.Path(p).name for p in serial]
+    for a, b in zip(serial, parallel):
+        assert pathlib.Path(a).read_bytes() == pathlib.Path(b).read_bytes()
+
+    from matplotlib.image import imread
+    assert imread(serial[0]).shape[:2] == (2 * 40, 5 * 40)
+    assert imread(serial[-1]).shape[:2] == (1 * 40, 5 * 40)
+
+
+def test_sample_plot_section_self_contained(tmp_path:pathlib.Path):
+    # sample.py is copied next to a submission's exercise.py of the six functions only :
+    # plot_section() may not need anything else from this repository
+    # sample.py 는 여섯 함수만 있는 제출물의 exercise.py 옆에 복사됨 :
+    # plot_section() 은 이 저장소의 다른 것을 필요로 하면 안 됨
+    (tmp_path / 'sample.py').write_text(pathlib.Path(sample.__file__).read_text())
+    (tmp_path / 'exercise.py').write_text('def area(w0, h0, w1, h1, w2, h2):\n    return w0 * h0 + w1 * h1 + w2 * h2\n')
+    statement = (
+        'import matplotlib; matplotlib.use("Agg"); import matplotlib.pyplot as plt; import sample; '
+        'ax = plt.gca(); sample.plot_section(ax, 0.05, 0.05, 0.0075, 0.09, 0.012, 0.07, 0.01); '
+        'print(len(ax.collections), len(ax.collections[0].get_paths()))'
+    )
+    output = subprocess.check_output([sys.executable, '-c', statement], cwd=tmp_path, encoding='utf-8')
+    assert '1 3' == output.strip()
@@ -8,7 +8,6 @@ import sys
 from typing import Tuple
 
 
-import matplotlib.pyplot as plt
 import pytest
 
 
@@ -25,7 +24,6 @@ sys.path.insert(
 
 # Import the functions you'll be testing from your beam_analysis module
 import exercise
-import sample
 
 
 @pytest.fixture
@@ -122,6 +120,11 @@ def test_result_centroid_y_value(
             f"반환값 {result_centroid_y:g} 이(가) 예상 값 {expected_centroid_m:g} 과 거리가 있음\n"
         )
     except AssertionError as e:
+        # plotting modules only when there is something to show
+        # 보여줄 것이 있을 때만 그림 관련 모듈을 import
+        import matplotlib.pyplot as plt
+        import sample
+
         ax = plt.gca()
         sample.plot_section(ax, result_centroid_y, *width_m, *height_m,)
         ax.axhline(y=expected_centroid_m, color='red', linestyle='-.')
@@ -0,0 +1,125 @@
+import os
+import pathlib
+import sys
+
+from typing import Tuple
+
+
+import numpy as np
+import numpy.testing as nt
+import pytest
+
+
+sys.path.insert(
+    0,
+    os.getenv(
+        'STUDENT_CODE_FOLDER',
+        str(
+            pathlib.Path(__file__).parent.parent.absolute()
+        )
+    )
+)
+
+
+import exercise
+import section_cuts
+
+
+@pytest.fixture
+def sections() -> np.ndarray:
+    rng = np.random.default_rng(262144)
+    nominal = np.array((50e-3, 12e-3, 7.5e-3, 70e-3, 90e-3, 10e-3))
+    return nominal * rng.uniform(0.5, 1.5, size=(128, 6))
+
+
+def brute_force_below(sections:np.ndarray, y:np.ndarray) -> Tuple[np.ndarray]:
+    widths, heights = sections[:, 0::2], sections[:, 1::2]
+    tops = np.cumsum(heights, axis=-1)
+    t = np.clip(y[..., None] - (tops - heights)[:, None, :], 0.0, heights[:, None, :])
+    a = (widths[:, None, :] * t).sum(axis=-1)
+    q = (widths[:, None, :] * t * ((tops - heights)[:, None, :] + 0.5 * t)).sum(axis=-1)
+    return a, q
+
+
+def test_area_and_first_moment(sections:np.ndarray):
+    table = section_cuts.cut_table_batch(sections)
+    depth = sections[:, 1::2].sum(axis=1)
+    y = np.linspace(-0.1, 1.1, 49)[None, :] * depth[:, None]
+
+    a_expected, q_expected = brute_force_below(sections, y)
+    y_bar = exercise.centroid_y_batch(sections)[:, None]
+
+    nt.assert_allclose(section_cuts.area_below(table, y), a_expected, rtol=1e-12, atol=1e-18)
+    nt.assert_allclose(
+        section_cuts.first_moment(table, y),
+        a_expected * y_bar - q_expected,
+        rtol=1e-9, atol=1e-15,
+    )
+
+
+def test_first_moment_at_centroid(sections:np.ndarray):
+    # Q at the neutral axis is the area moment of area_moment_above_below_equal()
+    table = section_cuts.cut_table_batch(sections)
+    q = section_cuts.first_moment(table, exercise.centroid_y_batch(sections)[:, None])[:, 0]
+    nt.assert_allclose(q, exercise.area_moment_above_below_equal_batch(sections)['a_moment_above'], rtol=1e-9)
+
+
+def test_plastic_neutral_axis(sections:np.ndarray):
+    table = section_cuts.cut_table_batch(sections)
+    result = section_cuts.plastic_neutral_axis(table)
+
+    nt.assert_allclose(
+        section_cuts.area_below(table, result['y_p'][:, None])[:, 0],
+        0.5 * exercise.area_batch(sections),
+        rtol=1e-12,
+    )
+    assert (result['shape_factor'] >= 1.0).all()
+
+
+def test_rectangle_plastic_modulus():
+    b, h = 0.05, 0.2
+    table = section_cuts.cut_table((b,), (h,))
+    result = section_cuts.plastic_neutral_axis(table)
+
+    nt.assert_allclose(result['y_p'], 0.5 * h)
+    nt.assert_allclose(result['Z'], b * h * h / 4.0)
+    nt.assert_allclose(result['shape_factor'], 1.5)
+
+
+if "__main__" == __name__:
+    pytest.main([__file__])
+
+
+def test_rectangle_shear_stress():
+    b, h, V = 0.05, 0.2, 1000.0
+    table = section_cuts.cut_table((b,), (h,))
+    tau = section_cuts.shear_stress(table, V, (0.0, 0.5 * h, h, 2.0 * h))
+
+    nt.assert_allclose(tau[0], (0.0, 1.5 * V / (b * h), 0.0, 0.0), atol=1e-6)
+
+
+def test_shear_jump_at_interfaces(sections:np.ndarray):
+    table = section_cuts.cut_table_batch(sections)
+    V = np.linspace(1e3, 2e3, sections.shape[0])
+    interfaces = table['layer_top'][:, :-1]
+
+    below = section_cuts.shear_stress(table, V, interfaces, side='below')
+    above = section_cuts.shear_stress(table, V, interfaces, side='above')
+
+    # same Q and I on both sides : τ changes with the width only
+    nt.assert_allclose(below[:, 0] * sections[:, 0], above[:, 0] * sections[:, 2], rtol=1e-12)
+    nt.assert_allclose(below[:, 1] * sections[:, 2], above[:, 1] * sections[:, 4], rtol=1e-12)
+
+
+def test_shear_profile(sections:np.ndarray):
+    table = section_cuts.cut_table_batch(sections)
+    profile = section_cuts.shear_profile(table, 1e3, n_points=2001)
+
+    assert profile['tau'].shape == (sections.shape[0], 2001 + 4)
+    assert (np.diff(profile['y'], axis=-1) >= 0.0).all()
+
+    # the maximum is at the neutral axis, inside the web
+    y_bar = exercise.centroid_y_batch(sections)
+    tau_na = section_cuts.shear_stress(table, 1e3, y_bar[:, None])[:, 0]
+    assert (profile['tau'].max(axis=-1) <= tau_na * (1.0 + 1e-12)).all()
+    nt.assert_allclose(profile['tau'].max(axis=-1), tau_na, rtol=1e-5)
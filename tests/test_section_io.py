@@ -0,0 +1,114 @@
+import os
+import pathlib
+import sys
+
+
+import numpy as np
+import numpy.testing as nt
+import pytest
+
+
+sys.path.insert(
+    0,
+    os.getenv(
+        'STUDENT_CODE_FOLDER',
+        str(
+            pathlib.Path(__file__).parent.parent.absolute()
+        )
+    )
+)
+
+
+import exercise
+import section_io
+
+
+@pytest.fixture
+def rows() -> np.ndarray:
+    rng = np.random.default_rng(524288)
+    nominal = np.array((50e-3, 12e-3, 7.5e-3, 70e-3, 90e-3, 10e-3, 100.0))
+    return nominal * rng.uniform(0.5, 1.5, size=(1001, 7))
+
+
+def check_output(path:pathlib.Path, rows:np.ndarray):
+    result = np.load(path)
+    columns = section_io.output_columns()
+
+    assert result.shape == (rows.shape[0], len(columns))
+    nt.assert_array_equal(result[:, columns.index('area')], exercise.area_batch(rows[:, :6]))
+    nt.assert_array_equal(result[:, columns.index('moment_of_inertia')], exercise.moment_of_inertia_batch(rows[:, :6]))
+    nt.assert_array_equal(
+        result[:, columns.index('bending_stress')],
+        exercise.bending_stress_batch(rows[:, 6], rows[:, :6]),
+    )
+
+
+def test_npy(tmp_path:pathlib.Path, rows:np.ndarray):
+    np.save(tmp_path / 'catalog.npy', rows)
+    section_io.evaluate_file(tmp_path / 'catalog.npy', tmp_path / 'out.npy', chunk_rows=100)
+    check_output(tmp_path / 'out.npy', rows)
+
+
+@pytest.mark.parametrize('save', (np.savez, np.savez_compressed))
+def test_npz(save, tmp_path:pathlib.Path, rows:np.ndarray):
+    save(tmp_path / 'catalog.npz', sections=rows, other=np.zeros(3))
+
+    stored = section_io.open_array(tmp_path / 'catalog.npz', 'sections')
+    if np.savez == save:
+        assert isinstance(stored, np.memmap)
+    else:
+        assert stored is None
+
+    section_io.evaluate_file(tmp_path / 'catalog.npz', tmp_path / 'out.npy', chunk_rows=64, key='sections')
+    check_output(tmp_path / 'out.npy', rows)
+
+
+@pytest.mark.parametrize('header', (True, False))
+def test_csv(header:bool, tmp_path:pathlib.Path, rows:np.ndarray):
+    np.savetxt(
+        tmp_path / 'catalog.csv', rows, delimiter=',', fmt='%.17g',
+        header='w0,h0,w1,h1,w2,h2,M' if header else '', comments='',
+    )
+    assert section_io.count_rows(tmp_path / 'catalog.csv') == rows.shape[0]
+
+    section_io.main([str(tmp_path / 'catalog.csv'), str(tmp_path / 'out.npy'), '--chunk-rows', '250'])
+    check_output(tmp_path / 'out.npy', rows)
+
+
+def test_csv_blank_and_comment_lines(tmp_path:pathlib.Path, rows:np.ndarray):
+    # rows np.loadtxt() skips are not counted either
+    # np.loadtxt() 가 건너뛰는 줄은 세지도 않음
+    lines = ['# catalog', 'w0,h0,w1,h1,w2,h2,M']
+    for i, row in enumerate(rows[:20]):
+        lines.append(','.join(f'{v:.17g}' for v in row) + ('  # note' if i % 3 else ''))
+        lines.extend([''] * (i % 4) + ['   '] * (i % 2))
+    (tmp_path / 'catalog.csv').write_text('\n'.join(lines) + '\n\n')
+    assert section_io.count_rows(tmp_path / 'catalog.csv') == 20
+
+    section_io.evaluate_file(tmp_path / 'catalog.csv', tmp_path / 'out.npy', chunk_rows=3)
+    check_output(tmp_path / 'out.npy', rows[:20])
+
+
+def test_csv_first_row_with_comment(tmp_path:pathlib.Path, rows:np.ndarray):
+    # without a header, the first row keeps its trailing comment and is still a row
+    # 머리글이 없을 때 뒤에 주석이 붙은 첫 행도 행임
+    lines = [','.join(f'{v:.17g}' for v in row) + '  # note' for row in rows[:5]]
+    (tmp_path / 'catalog.csv').write_text('\n'.join(lines) + '\n')
+    assert section_io.count_rows(tmp_path / 'catalog.csv') == 5
+
+    section_io.evaluate_file(tmp_path / 'catalog.csv', tmp_path / 'out.npy', chunk_rows=2)
+    check_output(tmp_path / 'out.npy', rows[:5])
+
+
+def test_six_columns_no_stress():
+    result = section_io.evaluate_chunk(np.array(((50e-3, 12e-3, 7.5e-3, 70e-3, 90e-3, 10e-3),)))
+    assert np.isnan(result[0, -1])
+
+
+def test_unsupported(tmp_path:pathlib.Path):
+    with pytest.raises(ValueError):
+        list(section_io.iter_chunks(tmp_path / 'catalog.txt'))
+
+
+if "__main__" == __name__:
+    pytest.main([__file__])
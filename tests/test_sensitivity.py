@@ -0,0 +1,78 @@
+import os
+import pathlib
+import sys
+
+
+import numpy as np
+import numpy.testing as nt
+import pytest
+
+
+sys.path.insert(
+    0,
+    os.getenv(
+        'STUDENT_CODE_FOLDER',
+        str(
+            pathlib.Path(__file__).parent.parent.absolute()
+        )
+    )
+)
+
+
+import exercise
+import section_sensitivity
+
+
+@pytest.fixture
+def sections() -> np.ndarray:
+    rng = np.random.default_rng(32768)
+    nominal = np.array((50e-3, 12e-3, 7.5e-3, 70e-3, 90e-3, 10e-3))
+    return nominal * rng.uniform(0.5, 1.5, size=(64, 6))
+
+
+def central_difference(f, sections:np.ndarray) -> np.ndarray:
+    step = 1e-6 * sections
+    columns = []
+    for i in range(6):
+        delta = np.zeros_like(sections)
+        delta[:, i] = step[:, i]
+        columns.append((f(sections + delta) - f(sections - delta)) / (2.0 * step[:, i]))
+    return np.stack(columns, axis=-1)
+
+
+@pytest.mark.parametrize(
+    'key, name',
+    (
+        ('area', 'area_batch'),
+        ('centroid_y', 'centroid_y_batch'),
+        ('moment_of_inertia', 'moment_of_inertia_batch'),
+    ),
+)
+def test_jacobian_matches_finite_difference(key:str, name:str, sections:np.ndarray):
+    jacobian = section_sensitivity.section_jacobian_batch(sections)[key]
+    expected = central_difference(getattr(exercise, name), sections)
+
+    assert jacobian.shape == sections.shape
+    nt.assert_allclose(jacobian, expected, rtol=1e-6, atol=1e-9 * np.abs(expected).max())
+
+
+def test_bending_stress_jacobian(sections:np.ndarray):
+    M_Nm = np.linspace(50.0, 150.0, sections.shape[0])
+    result = section_sensitivity.section_jacobian_batch(sections, M_Nm)
+    expected = central_difference(lambda s: exercise.bending_stress_batch(M_Nm, s), sections)
+
+    smooth = ~result['kink']
+    nt.assert_allclose(result['bending_stress'][smooth], expected[smooth], rtol=1e-5)
+
+
+def test_kink_between_fibers():
+    # symmetric I-beam : both fibers govern
+    section = np.array(((60e-3, 10e-3, 8e-3, 80e-3, 60e-3, 10e-3),))
+    result = section_sensitivity.section_jacobian_batch(section, 100.0)
+
+    assert result['kink'].all()
+    assert not np.allclose(result['bending_stress_top'], result['bending_stress_bottom'])
+
+
+if "__main__" == __name__:
+    pytest.main([__file__])
@@ -0,0 +1,189 @@
+import asyncio
+import json
+import os
+import pathlib
+import sys
+
+
+import numpy as np
+import numpy.testing as nt
+import pytest
+
+
+sys.path.insert(
+    0,
+    os.getenv(
+        'STUDENT_CODE_FOLDER',
+        str(
+            pathlib.Path(__file__).parent.parent.absolute()
+        )
+    )
+)
+
+
+import exercise
+import section_service
+
+
+@pytest.fixture
+def sections() -> np.ndarray:
+    rng = np.random.default_rng(4242)
+    nominal = np.array((50e-3, 12e-3, 7.5e-3, 70e-3, 90e-3, 10e-3))
+    return nominal * rng.uniform(0.5, 1.5, size=(64, 6))
+
+
+async def post(port:int, path:str, payload:dict, connection:tuple=None) -> tuple:
+    reader, writer = connection or await asyncio.open_connection('127.0.0.1', port)
+    body = json.dumps(payload).encode()
+    writer.write(
+        f"POST {path} HTTP/1.1\r\nHost: localhost\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body)
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b''):
+            break
+        if line.lower().startswith(b'content-length:'):
+            length = int(line.split(b':')[1])
+    reply = json.loads(await reader.readexactly(length))
+    if connection is None:
+        writer.close()
+    return status, reply
+
+
+async def get_metrics(port:int) -> dict:
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    writer.write(b"GET /metrics HTTP/1.1\r\nConnection: close\r\n\r\n")
+    data = await reader.read()
+    writer.close()
+    return json.loads(data.split(b'\r\n\r\n', 1)[1])
+
+
+def test_submit_coalesces(sections:np.ndarray):
+    state = section_service.service_state(window_s=5e-3)
+
+    async def main():
+        futures = [section_service.service_submit(state, 'moment_of_inertia', row) for row in sections]
+        futures += [section_service.service_submit(state, 'bending_stress', (100.0, *row)) for row in sections]
+        return await asyncio.gather(*futures)
+
+    results = asyncio.run(main())
+    nt.assert_allclose(results[:64], exercise.moment_of_inertia_batch(sections), rtol=1e-15)
+    nt.assert_allclose(results[64:], exercise.bending_stress_batch(100.0, sections), rtol=1e-15)
+    assert state['batches'] == 2
+    assert state['largest_batch'] == 64
+
+
+def test_max_batch(sections:np.ndarray):
+    state = section_service.service_state(window_s=10.0, max_batch=16)
+
+    async def main():
+        return await asyncio.gather(*(section_service.service_submit(state, 'area', row) for row in sections))
+
+    nt.assert_allclose(asyncio.run(main()), exercise.area_batch(sections), rtol=1e-15)
+    assert state['batches'] == 4
+
+
+def test_http(sections:np.ndarray):
+    state = section_service.service_state(window_s=2e-3)
+
+    async def main():
+        server = await section_service.serve(state)
+        port = state['port']
+        async with server:
+            names = ('w0', 'h0', 'w1', 'h1', 'w2', 'h2')
+            replies = await asyncio.gather(
+                *(post(port, '/centroid_y', dict(zip(names, row))) for row in sections),
+                *(post(port, '/area_above_below_equal', {'args': list(row)}) for row in sections[:4]),
+            )
+            errors = await asyncio.gather(
+                post(port, '/centroid_y', {'w0': 1.0}),
+                post(port, '/nothing', {}),
+            )
+
+            # several requests over one keep-alive connection
+            # keep-alive 연결 하나로 여러 요청
+            connection = await asyncio.open_connection('127.0.0.1', port)
+            kept = [await post(port, '/area', {'args': list(row)}, connection) for row in sections[:3]]
+            connection[1].close()
+
+            return replies, errors, kept, await get_metrics(port)
+
+    replies, errors, kept, metrics = asyncio.run(main())
+
+    assert all(200 == status for status, _ in replies)
+    nt.assert_allclose([r['result'] for _, r in replies[:64]], exercise.centroid_y_batch(sections), rtol=1e-15)
+    for (_, reply), row in zip(replies[64:], sections):
+        assert reply['result'] == exercise.area_above_below_equal(*row)
+
+    assert [status for status, _ in errors] == [400, 404]
+    nt.assert_allclose([r['result'] for _, r in kept], exercise.area_batch(sections[:3]), rtol=1e-15)
+
+    assert metrics['requests'] == 64 + 4 + 3
+    assert metrics['batches'] < metrics['requests']
+    assert metrics['latency_p50_ms'] <= metrics['latency_max_ms']
+
+
+def test_malformed_requests():
+    # 400 and the connection closed, not a silently dropped connection
+    # 조용히 끊지 않고 400 을 응답한 뒤 연결을 닫음
+    state = section_service.service_state()
+
+    async def send(data:bytes, eof:bool=False) -> bytes:
+        reader, writer = await asyncio.open_connection('127.0.0.1', state['port'])
+        writer.write(data)
+        if eof:
+            writer.write_eof()
+        await writer.drain()
+        reply = await reader.read()
+        writer.close()
+        return reply
+
+    async def main():
+        server = await section_service.serve(state)
+        async with server:
+            return await asyncio.gather(
+                send(b"POST /area\r\n\r\n"),
+                send(b"POST /area HTTP/1.1\r\nContent-Length: many\r\n\r\n"),
+                send(b"POST /area HTTP/1.1\r\nContent-Length: 100\r\n\r\n{\"args\"", eof=True),
+            )
+
+    for reply in asyncio.run(main()):
+        assert reply.startswith(b"HTTP/1.1 400 Bad Request\r\n")
+        assert b"Connection: close" in reply
+        assert json.loads(reply.split(b'\r\n\r\n', 1)[1])['error'].startswith('malformed request')
+
+
+def test_degenerate_and_failing(monkeypatch, sections:np.ndarray):
+    # nan is sent as null; an item that raises fails alone, with a 500 reply
+    # nan 은 null 로 보냄; 예외를 일으키는 항목만 500 응답으로 실패
+    def moment_of_inertia(*dims):
+        if (np.asarray(dims[0]) < 0.0).any():
+            raise ArithmeticError('negative width')
+        return exercise.moment_of_inertia(*dims)
+
+    monkeypatch.setattr(section_service, 'moment_of_inertia', moment_of_inertia)
+    state = section_service.service_state(window_s=5e-3)
+
+    async def main():
+        server = await section_service.serve(state)
+        async with server:
+            return await asyncio.gather(
+                post(state['port'], '/centroid_y', {'args': [0.0] * 6}),
+                *(post(state['port'], '/moment_of_inertia', {'args': list(row)}) for row in sections[:3]),
+                post(state['port'], '/moment_of_inertia', {'args': [-1.0] + [1.0] * 5}),
+            )
+
+    degenerate, *good, bad = asyncio.run(main())
+
+    assert degenerate == (200, {'result': None})
+    nt.assert_allclose([r['result'] for _, r in good], exercise.moment_of_inertia_batch(sections[:3]), rtol=1e-15)
+    assert 500 == bad[0] and 'negative width' in bad[1]['error']
+
+
+def test_metrics_before_any_request():
+    metrics = section_service.service_metrics(section_service.service_state())
+    assert metrics['requests'] == 0
+    assert metrics['latency_p99_ms'] is None
+    json.dumps(metrics)
@@ -0,0 +1,113 @@
+import pathlib
+import sys
+
+
+import pytest
+
+
+sys.path.insert(0, str(pathlib.Path(__file__).parent.absolute()))
+
+
+import static_analysis
+
+
+@pytest.fixture
+def cache(tmp_path:pathlib.Path, monkeypatch) -> pathlib.Path:
+    monkeypatch.setenv('STATIC_ANALYSIS_CACHE', str(tmp_path / 'cache'))
+    monkeypatch.setattr(static_analysis, '_memory', {})
+    monkeypatch.setattr(static_analysis, '_index', {'entries': None})
+    return tmp_path / 'cache'
+
+
+def lines(findings:dict) -> list:
+    return [f['line'] for f in findings['top_level_findings']]
+
+
+def test_clean_module():
+    findings = static_analysis.analyze_code(
+        '"""doc"""\n# comment\nimport numpy as np\nfrom typing import Dict\n\n\ndef f(x:float) -> float:\n    return np.sin(x)\n'
+    )
+    assert findings == {
+        'syntax_error': None, 'imports': ['numpy', 'typing'], 'import_findings': [], 'top_level_findings': [],
+    }
+
+
+def test_imports():
+    findings = static_analysis.analyze_code('import os\nfrom numpy import pi\nimport scipy.optimize\n\n\ndef f():\n    import json\n')
+    assert len(findings['import_findings']) == 3
+    assert findings['imports'] == ['os', 'numpy', 'scipy.optimize', 'json']
+
+
+def test_from_imports():
+    # as in the assignment, "from x import" is checked for numpy only
+    # 과제대로 "from x import" 는 numpy 만 검사
+    findings = static_analysis.analyze_code(
+        'from collections import deque\nfrom os import path\nfrom . import sibling\nfrom numpy import pi\n'
+    )
+    assert findings['import_findings'] == ['line 4 : from numpy import']
+
+
+def test_line_rule_kept():
+    findings = static_analysis.analyze_code('x = 1\n\n\ndef f(a,\n      b):\n    pass\n\n\nif __name__ == "__main__":\n    f(1, 2)\n')
+    assert lines(findings) == [1, 4, 9]
+
+
+def test_constructs_the_line_rule_misses():
+    findings = static_analysis.analyze_code(
+        'import math; x = 1\n\n\ndef f(): return 1\n\n\n@staticmethod\ndef g():\n    pass\n'
+    )
+    assert lines(findings) == [1, 4, 7]
+    assert 'Assign' in findings['top_level_findings'][0]['text']
+
+
+def test_syntax_error():
+    findings = static_analysis.analyze_code('def f(:\n    pass\n')
+    assert findings['syntax_error']
+    assert findings['import_findings'] == []
+
+
+def test_cached_by_content(cache:pathlib.Path, tmp_path:pathlib.Path, monkeypatch):
+    py_file = tmp_path / 'module.py'
+    py_file.write_text('import os\n')
+    first = static_analysis.analyze(py_file)
+    assert first['import_findings']
+
+    # a new process : the disk cache answers without analyzing again
+    # 새 process : 다시 분석하지 않고 디스크 cache 가 답함
+    monkeypatch.setattr(static_analysis, '_memory', {})
+    monkeypatch.setattr(static_analysis, '_index', {'entries': None})
+    monkeypatch.setattr(static_analysis, 'analyze_code', lambda code: pytest.fail('analyzed again'))
+    assert static_analysis.analyze(py_file) == first
+
+    # same content in another file : found by hash
+    # 다른 파일의 같은 내용 : hash 로 찾음
+    copy = tmp_path / 'copy.py'
+    copy.write_text('import os\n')
+    assert static_analysis.analyze(copy) == first
+
+
+def test_changed_file_analyzed_again(cache:pathlib.Path, tmp_path:pathlib.Path):
+    py_file = tmp_path / 'module.py'
+    py_file.write_text('import os\n')
+    assert static_analysis.analyze(py_file)['import_findings']
+
+    py_file.write_text('import math\n\n\n')
+    assert not static_analysis.analyze(py_file)['import_findings']
+
+
+def test_cache_folder_of_the_user(tmp_path:pathlib.Path, monkeypatch):
+    monkeypatch.delenv('STATIC_ANALYSIS_CACHE', raising=False)
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path / 'xdg'))
+    assert static_analysis.cache_folder() == tmp_path / 'xdg' / 'section-static-analysis'
+
+    monkeypatch.delenv('XDG_CACHE_HOME')
+    assert static_analysis.cache_folder().is_relative_to(pathlib.Path.home())
+
+
+def test_memory_only(tmp_path:pathlib.Path, monkeypatch):
+    monkeypatch.setenv('STATIC_ANALYSIS_CACHE', '')
+    monkeypatch.setattr(static_analysis, '_memory', {})
+    py_file = tmp_path / 'module.py'
+    py_file.write_text('import os\n')
+    assert static_analysis.analyze(py_file)['import_findings']
+    assert [py_file] == list(tmp_path.iterdir())
@@ -0,0 +1,119 @@
+import os
+import pathlib
+import sys
+
+
+import numpy as np
+import numpy.testing as nt
+import pytest
+
+
+sys.path.insert(
+    0,
+    os.getenv(
+        'STUDENT_CODE_FOLDER',
+        str(
+            pathlib.Path(__file__).parent.parent.absolute()
+        )
+    )
+)
+
+
+import exercise
+import section_store
+
+
+@pytest.fixture
+def sections() -> np.ndarray:
+    rng = np.random.default_rng(8675309)
+    nominal = np.array((50e-3, 12e-3, 7.5e-3, 70e-3, 90e-3, 10e-3))
+    return nominal * rng.uniform(0.5, 1.5, size=(500, 6))
+
+
+def check(result:dict, sections:np.ndarray):
+    props = exercise.section_properties_batch(sections)
+    for name in section_store.store_columns():
+        nt.assert_array_equal(result[name], props[name], err_msg=name)
+
+
+def test_misses_then_hits(tmp_path:pathlib.Path, sections:np.ndarray):
+    store = section_store.open_store(tmp_path)
+    check(section_store.store_evaluate(store, sections[:300]), sections[:300])
+    assert section_store.store_info(store)['misses'] == 300
+
+    check(section_store.store_evaluate(store, sections), sections)
+    info = section_store.store_info(store)
+    assert (info['hits'], info['misses'], info['entries'], info['segments']) == (300, 500, 500, 2)
+
+
+def test_reopen(tmp_path:pathlib.Path, sections:np.ndarray):
+    section_store.store_evaluate(section_store.open_store(tmp_path), sections)
+
+    store = section_store.open_store(tmp_path)
+    values, found = section_store.store_lookup(store, sections[::-1])
+    assert found.all()
+    check(dict(zip(section_store.store_columns(), values.T)), sections[::-1])
+
+
+def test_duplicates_in_batch(tmp_path:pathlib.Path, sections:np.ndarray):
+    store = section_store.open_store(tmp_path)
+    batch = np.concatenate((sections[:10], sections[:10], sections[5:15]))
+    check(section_store.store_evaluate(store, batch), batch)
+    assert section_store.store_info(store)['entries'] == 15
+
+
+def test_quantum(tmp_path:pathlib.Path):
+    store = section_store.open_store(tmp_path, quantum_m=1e-6)
+    nominal = np.array((50e-3, 12e-3, 7.5e-3, 70e-3, 90e-3, 10e-3))
+    section_store.store_evaluate(store, nominal[None, :])
+    _, found = section_store.store_lookup(store, (nominal + 1e-8)[None, :])
+    assert found.all()
+    _, found = section_store.store_lookup(store, (nominal + 1e-5)[None, :])
+    assert not found.any()
+
+
+def test_reopen_other_quantum(tmp_path:pathlib.Path):
+    nominal = np.array((50e-3, 12e-3, 7.5e-3, 70e-3, 90e-3, 10e-3))
+    section_store.store_evaluate(section_store.open_store(tmp_path, quantum_m=1e-3), nominal[None, :])
+
+    # round(d / 1e-4) of d / 10 is round(d / 1e-3) of d : the same keys for another section
+    # d / 10 의 round(d / 1e-4) 는 d 의 round(d / 1e-3) : 다른 단면에 같은 key
+    for quantum_m in (1e-4, 0.0):
+        with pytest.raises(ValueError):
+            section_store.open_store(tmp_path, quantum_m=quantum_m)
+    assert section_store.store_info(section_store.open_store(tmp_path, quantum_m=1e-3))['entries'] == 1
+
+
+def test_compact(tmp_path:pathlib.Path, sections:np.ndarray):
+    store = section_store.open_store(tmp_path)
+    for part in np.array_split(sections, 5):
+        section_store.store_evaluate(store, part)
+    assert section_store.store_info(store)['segments'] == 5
+
+    section_store.store_compact(store)
+    info = section_store.store_info(store)
+    assert (info['segments'], info['entries']) == (1, 500)
+    assert len(list(tmp_path.glob('*.npy'))) == 2
+
+    values, found = section_store.store_lookup(section_store.open_store(tmp_path), sections)
+    assert found.all()
+    check(dict(zip(section_store.store_columns(), values.T)), sections)
+
+
+def test_evict(tmp_path:pathlib.Path, sections:np.ndarray):
+    store = section_store.open_store(tmp_path)
+    for part in np.array_split(sections, 5):
+        section_store.store_evaluate(store, part)
+    segment_bytes = section_store.store_info(store)['bytes'] // 5
+
+    section_store.store_evict(store, 2 * segment_bytes + 100)
+    assert section_store.store_info(store)['segments'] == 2
+    _, found = section_store.store_lookup(store, sections)
+    nt.assert_array_equal(found, np.arange(500) >= 300)
+
+
+def test_max_bytes(tmp_path:pathlib.Path, sections:np.ndarray):
+    store = section_store.open_store(tmp_path, max_bytes=1)
+    for part in np.array_split(sections, 4):
+        section_store.store_evaluate(store, part)
+    assert section_store.store_info(store)['segments'] == 1
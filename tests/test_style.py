@@ -1,6 +1,7 @@
 import os
 import pathlib
 import subprocess
+import sys
 
 from typing import Tuple
 
@@ -18,20 +19,19 @@ proj_folder = pathlib.Path(
     )
 )
 
+sys.path.insert(0, str(test_folder))
+
+
+import static_analysis
+
 
 def test_function_only_in_py_file(py_file:pathlib.Path):
-    with open(py_file, 'r') as file:
-        lines = file.readlines()
-
-    for line in lines:
-        line_strip = line.strip()
-        if line.startswith('#') or line.startswith('"""') or line.startswith("'''"):
-            continue
-        elif line.startswith('def ') and line_strip.endswith(':'):
-            continue
-        elif line.startswith('import ') or (line.startswith('from ') and ' import ' in line):
-            continue
-        assert line.startswith(' ') or line_strip == ''
+    findings = static_analysis.analyze(py_file)['top_level_findings']
+
+    assert not findings, (
+        f"only imports, comments and one line def signatures are allowed at the top level of {py_file.name} :\n"
+        + '\n'.join(f"  line {f['line']} : {f['text']}" for f in findings)
+    )
 
 
 @pytest.fixture
@@ -1,4 +1,3 @@
-import ast
 import logging
 import os
 import pathlib
@@ -12,6 +11,11 @@ test_folder = file_path.parent.absolute()
 proj_folder = pathlib.Path(os.getenv('STUDENT_CODE_FOLDER', test_folder.parent.absolute()))
 
 sys.path.insert(0, str(proj_folder))
+sys.path.insert(0, str(test_folder))
+
+
+import static_analysis
+
 
 logger = logging.getLogger(__file__)
 logger.setLevel(logging.INFO)
@@ -19,29 +23,24 @@ logger.setLevel(logging.INFO)
 
 def test_syntax(py_file:pathlib.Path):
 
-    code = py_file.read_text(encoding="utf-8")
+    findings = static_analysis.analyze(py_file)
 
-    try:
-        ast.parse(code)
-    except SyntaxError as e:
-        pytest.fail(f"Syntax error in file: {py_file.relative_to(proj_folder)}\n{e}")
+    if findings['syntax_error']:
+        pytest.fail(f"Syntax error in file: {py_file.relative_to(proj_folder)}\n{findings['syntax_error']}")
 
 
 def test_module(py_file:pathlib.Path):
 
-    code = py_file.read_text(encoding="utf-8")
+    findings = static_analysis.analyze(py_file)
+
+    if findings['syntax_error']:
+        pytest.fail(f"Syntax error in file: {py_file.relative_to(proj_folder)}\n{findings['syntax_error']}")
 
-    tree = ast.parse(code)
+    for name in findings['imports']:
+        logger.info(f"Import: {name}")
 
-    for node in ast.walk(tree):
-        if isinstance(node, ast.Import):
-            for alias in node.names:
-                logger.info(f"Import: {alias.name}")
-                if not(any(map(lambda m:alias.name.startswith(m), ('math', 'numpy', 'scipy', 'matplotlib')))):
-                    pytest.fail(f"tried to import {alias.name} in {py_file.relative_to(proj_folder)}")
-        elif isinstance(node, ast.ImportFrom):
-            if node.module == "numpy":
-                pytest.fail(f"Import of numpy in {py_file.relative_to(proj_folder)}")
+    if findings['import_findings']:
+        pytest.fail(f"{'; '.join(findings['import_findings'])} in {py_file.relative_to(proj_folder)}")
 
 
 def test_importable():